@@ -0,0 +1,517 @@
+############################################################################
+#
+# Ricky Galliani, Tim Menninger, Rush Joshi, Schaeffer Reed
+# Network Simulator Project
+# CS 143 -- Fall 2015
+#
+# benchmark.py
+#
+# This script compares the event schedulers.  First every scheduler is
+# checked against a plain heap on random pushes, pops and rebuilds, so that
+# they all run events in the same order.  Then every scheduler runs the
+# shipped test cases and larger generated networks.  The same transfers are
+# then timed sent as packets and simulated as fluids (see fluid.py).  Next a
+# "hold" benchmark times the scheduler alone: the queue is filled with events
+# and then repeatedly popped and pushed again a little later, with event
+# times clustered the way the simulator's are.  Last, it measures how many
+# bytes each packet held by a simulation takes up.  Run it from the project
+# directory:
+#
+#     $ python3 src/benchmark.py
+#
+############################################################################
+
+
+############################################################################
+#                                                                          #
+#                               Imported Modules                           #
+#                                                                          #
+############################################################################
+
+import os
+import sys
+import time
+import heapq
+import random
+import shutil
+import tempfile
+import argparse
+import contextlib
+import tracemalloc
+from array import array
+
+# Import the constants and the conversion functions
+import constants as ct
+import conversion as cv
+
+# Import the simulation, the event schedulers and the packets
+import simulate
+import scheduler as sc
+import packet as p
+
+
+############################################################################
+#                                                                          #
+#                           Benchmark Functions                            #
+#                                                                          #
+############################################################################
+
+
+def generate_config(config_file, num_pairs, flow_size,
+                    fidelity=ct.FIDELITY_PACKET, duplex=ct.DEFAULT_DUPLEX):
+    '''
+    Description:        Writes a network config file for a dumbbell network:
+                        a chain of four routers with the argued number of
+                        source hosts on the first router, as many destination
+                        hosts on the last one, and a flow from each source to
+                        its destination.  The flows start half a second
+                        apart.
+
+    Arguments:          config_file (string)
+                            - The name of the file to write.
+
+                        num_pairs (integer)
+                            - The number of source/destination host pairs.
+
+                        flow_size (integer)
+                            - The size of each flow in MB.  Config files
+                            only take whole MB.
+
+                        fidelity (string)
+                            - Whether the flows send packets or are 
+                            simulated as fluids.
+
+                        duplex (string)
+                            - Whether the links are half- or full-duplex.
+
+    Return Values:      None.
+
+    Shared Variables:   None.
+
+    Global Variables:   None.
+
+    Limitations:        None.
+
+    Known Bugs:         None.
+
+    Revision History:   2026/10/18: Created
+                        2026/10/18: Takes the fidelity of the flows and
+                                    the duplex mode of the links.
+    '''
+    hosts = []
+    links = ["L1 10 10 128 R1 R2 " + duplex, "L2 10 10 128 R2 R3 " + duplex,
+             "L3 10 10 128 R3 R4 " + duplex]
+    flows = []
+    for i in range(1, num_pairs + 1):
+        hosts += ["S%d" % i, "T%d" % i]
+        links.append("LS%d 12.5 10 128 S%d R1 %s" % (i, i, duplex))
+        links.append("LT%d 12.5 10 128 T%d R4 %s" % (i, i, duplex))
+        flows.append("F%d S%d T%d %d %g %s" % (i, i, i, flow_size, 0.5 * i,
+                                                fidelity))
+
+    with open(config_file, 'w') as config:
+        config.write("hostSpecs:\n" + "\n".join(hosts) + "\n\n")
+        config.write("routerSpecs:\nR1\nR2\nR3\nR4\n\n")
+        config.write("linkSpecs:\n" + "\n".join(links) + "\n\n")
+        config.write("flowSpecs:\n" + "\n".join(flows) + "\n")
+
+
+def time_simulation(config_file, scheduler_name, routing=ct.DEFAULT_ROUTING):
+    '''
+    Description:        Runs the simulation of the argued network with the
+                        argued scheduler and routing and times it.
+
+    Arguments:          config_file (string)
+                            - The network config file.
+
+                        scheduler_name (string)
+                            - The name of the scheduler to use.
+
+                        routing (string)
+                            - Whether the routing tables are filled by
+                            routing packets or once with the shortest paths.
+
+    Return Values:      (float)
+                            - The real time the simulation took in seconds.
+
+                        (integer)
+                            - The number of network recordings, which is the
+                            same for every scheduler, and is the network 
+                            time in RECORD_TIMEs.
+
+    Shared Variables:   None.
+
+    Global Variables:   None.
+
+    Limitations:        The outputs of the simulation are written to a
+                        temporary directory that is removed afterwards, and
+                        what it prints is thrown away.
+
+    Known Bugs:         None.
+
+    Revision History:   2026/10/18: Created
+                        2026/10/18: Writes to a temporary directory.
+                        2026/10/18: Takes the routing mode.
+    '''
+    output_directory = tempfile.mkdtemp()
+    sim = None
+    try:
+        with open(os.devnull, 'w') as devnull, \
+             contextlib.redirect_stdout(devnull):
+            sim = simulate.Simulation(scheduler_name, True, output_directory,
+                                      routing)
+            sim.load_network(config_file)
+
+            start = time.time()
+            sim.run_network()
+            end = time.time()
+
+        return end - start, sim.network_recordings
+
+    finally:
+        if sim is not None:
+            sim.close_files()
+        shutil.rmtree(output_directory, ignore_errors=True)
+
+
+def time_hold(scheduler_name, queue_size, num_holds):
+    '''
+    Description:        Times the argued scheduler alone with the hold
+                        model.  The queue is filled with the argued number of
+                        events, and then the soonest event is popped and
+                        pushed again a little later the argued number of
+                        times.  The delays are link transmission slots, the
+                        recording period, the FAST TCP period or zero, like
+                        the delays of the events in a simulation.
+
+    Arguments:          scheduler_name (string)
+                            - The name of the scheduler to time.
+
+                        queue_size (integer)
+                            - The number of events kept in the queue.
+
+                        num_holds (integer)
+                            - The number of pops and pushes to time.
+
+    Return Values:      (float)
+                            - The real time the holds took in seconds.
+
+    Shared Variables:   None.
+
+    Global Variables:   None.
+
+    Limitations:        None.
+
+    Known Bugs:         None.
+
+    Revision History:   2026/10/18: Created
+                        2026/10/18: The times are in ticks.
+    '''
+    # The same delays for every scheduler, in ticks like the event times.
+    rand = random.Random(0)
+    slot = ct.PACKET_DATA_SIZE * 8 / 10e3
+    delays = [cv.ms_to_ticks(rand.choice([0, slot, 2 * slot, 10, 
+                                          ct.RECORD_TIME, ct.FAST_TCP_PERIOD]))
+              for i in range(num_holds)]
+
+    queue = sc.SCHEDULERS[scheduler_name]()
+    period = cv.ms_to_ticks(ct.FAST_TCP_PERIOD)
+    for seq in range(queue_size):
+        queue.push((rand.randrange(period), seq, None))
+
+    start = time.time()
+    seq = queue_size
+    for delay in delays:
+        (event_time, unused, event) = queue.pop()
+        queue.push((event_time + delay, seq, event))
+        seq += 1
+    end = time.time()
+
+    return end - start
+
+
+def cross_check(seed, num_steps):
+    '''
+    Description:        Checks that every scheduler runs events in the same
+                        order as a plain heap.  Each scheduler is handed the
+                        same random mix of pushes, pops, peeks and rebuilds,
+                        with event times drawn from zero delays, a few
+                        fixed delays and delays spread over a second, and
+                        each pop must give the event the heap gives.
+
+    Arguments:          seed (integer)
+                            - The seed of the random operations.
+
+                        num_steps (integer)
+                            - The number of operations to check.
+
+    Return Values:      None.
+
+    Shared Variables:   None.
+
+    Global Variables:   None.
+
+    Limitations:        None.
+
+    Known Bugs:         None.
+
+    Revision History:   2026/10/18: Created
+    '''
+    for name in sorted(sc.SCHEDULERS):
+        rand = random.Random(seed)
+        queue = sc.SCHEDULERS[name]()
+        expected = []
+        seq = 0
+        now = 0
+        for step in range(num_steps):
+            choice = rand.random()
+            if choice < 0.55 or len(expected) == 0:
+                # Push a few events, some of them at the same time.
+                for i in range(rand.randint(1, 4)):
+                    delay = rand.choice([0, 0, 1, cv.ms_to_ticks(1), 
+                                         cv.ms_to_ticks(10), 
+                                         cv.ms_to_ticks(100),
+                                         rand.randrange(cv.ms_to_ticks(1000))])
+                    entry = (now + delay, seq, None)
+                    seq += 1
+                    queue.push(entry)
+                    heapq.heappush(expected, entry)
+            elif choice < 0.95:
+                assert queue.peek()[:2] == expected[0][:2], (name, step)
+                entry = queue.pop()
+                assert entry[:2] == heapq.heappop(expected)[:2], (name, step)
+                now = entry[0]
+            else:
+                # Keep some of the events, as a restored checkpoint would.
+                entries = queue.entries()
+                assert sorted(entries) == sorted(expected), (name, step)
+                entries = [x for x in entries if rand.random() < 0.7]
+                queue.rebuild(entries)
+                expected = list(entries)
+                heapq.heapify(expected)
+            assert len(queue) == len(expected), (name, step)
+
+        while len(expected) > 0:
+            assert queue.pop()[:2] == heapq.heappop(expected)[:2], name
+        assert len(queue) == 0, name
+
+
+class DictPacket:
+    '''
+    Description:        A packet that keeps its attributes in a dictionary,
+                        as Packet did before its attributes were slots.  Only
+                        used to measure the difference.
+    '''
+
+
+def make_packets(num_packets, packet_class):
+    '''
+    Description:        Returns the argued number of data packets of one flow
+                        in flight, held in a dictionary keyed by (flow ID,
+                        packet ID) like the packets of a simulation.
+
+    Arguments:          num_packets (integer)
+                            - The number of packets to make.
+
+                        packet_class (class)
+                            - Packet or DictPacket.
+
+    Return Values:      (dictionary)
+                            - The packets.
+
+    Shared Variables:   None.
+
+    Global Variables:   None.
+
+    Limitations:        None.
+
+    Known Bugs:         None.
+
+    Revision History:   2026/10/18: Created
+    '''
+    packets = {}
+    for i in range(1, num_packets + 1):
+        pkt = p.Packet(i, 0, 0, 1, ct.PACKET_DATA)
+        pkt.set_data(i)
+        pkt.time = i * 0.1
+        if packet_class is not p.Packet:
+            copy_pkt = packet_class()
+            for name in p.Packet.__slots__:
+                setattr(copy_pkt, name, getattr(pkt, name))
+            pkt = copy_pkt
+        packets[(pkt.flow, pkt.ID)] = pkt
+
+    return packets
+
+
+def make_packet_columns(num_packets):
+    '''
+    Description:        Returns the same packets as make_packets(), but as a
+                        table with a column for each attribute and a row for
+                        each packet, which would be addressed by its row 
+                        number instead of its key.  Every column is an 
+                        array.
+
+    Arguments:          num_packets (integer)
+                            - The number of packets to make.
+
+    Return Values:      (dictionary)
+                            - The columns, by attribute name.
+
+    Shared Variables:   None.
+
+    Global Variables:   None.
+
+    Limitations:        None.
+
+    Known Bugs:         None.
+
+    Revision History:   2026/10/18: Created
+    '''
+    columns = {'ID' : array('q'), 'type' : array('b'), 'size' : array('l'),
+               'time' : array('d'), 'data' : array('q'),
+               'flow' : array('l'), 'src' : array('l'), 'dest' : array('l')}
+    for i in range(1, num_packets + 1):
+        columns['ID'].append(i)
+        columns['type'].append(ct.PACKET_DATA)
+        columns['size'].append(ct.PACKET_DATA_SIZE)
+        columns['time'].append(i * 0.1)
+        columns['data'].append(i)
+        columns['flow'].append(0)
+        columns['src'].append(0)
+        columns['dest'].append(1)
+
+    return columns
+
+
+def measure_packet_memory(num_packets):
+    '''
+    Description:        Measures the memory taken up by each packet in
+                        flight, for packets whose attributes are in a 
+                        dictionary (as before), for the slotted Packet class 
+                        and for a table of columns.
+
+    Arguments:          num_packets (integer)
+                            - The number of packets to measure with.
+
+    Return Values:      (list)
+                            - A (name, bytes per packet) tuple for each way
+                            of storing the packets.
+
+    Shared Variables:   None.
+
+    Global Variables:   None.
+
+    Limitations:        Includes the dictionary holding the packets, but
+                        not the events and link buffers referring to them.
+
+    Known Bugs:         None.
+
+    Revision History:   2026/10/18: Created
+    '''
+    stores = [("dict packets", lambda: make_packets(num_packets, DictPacket)),
+              ("slot packets", lambda: make_packets(num_packets, p.Packet)),
+              ("columns", lambda: make_packet_columns(num_packets))]
+
+    results = []
+    for (name, make) in stores:
+        tracemalloc.start()
+        store = make()
+        (size, unused) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del store
+        results.append((name, size / num_packets))
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the schedulers.")
+    parser.add_argument("--cases", nargs="*", type=int, default=[0, 1, 2],
+                        help="the shipped test cases to run")
+    parser.add_argument("--pairs", nargs="*", type=int, default=[4, 8],
+                        help="the number of host pairs of each generated "
+                             "network to run")
+    parser.add_argument("--flow-size", type=int, default=1,
+                        help="the size of each generated flow in MB")
+    parser.add_argument("--fluid-pairs", nargs="*", type=int, default=[2],
+                        help="the number of host pairs of each generated "
+                             "full-duplex network to run with packet and "
+                             "then fluid flows")
+    parser.add_argument("--fluid-size", type=int, default=20,
+                        help="the size of each flow of those networks in MB")
+    parser.add_argument("--holds", type=int, default=200000,
+                        help="the number of holds per hold benchmark")
+    parser.add_argument("--hold-sizes", nargs="*", type=int,
+                        default=[100, 10000, 1000000],
+                        help="the queue sizes of the hold benchmarks")
+    parser.add_argument("--memory-packets", type=int, default=100000,
+                        help="the number of packets to measure the memory "
+                             "of each packet with (0 to skip)")
+    parser.add_argument("--checks", type=int, default=8,
+                        help="the number of random operation sequences to "
+                             "check the schedulers against a heap with "
+                             "first (0 to skip)")
+    args = parser.parse_args()
+
+    names = sorted(sc.SCHEDULERS)
+
+    # The timings only mean something if the schedulers agree.
+    for seed in range(args.checks):
+        cross_check(seed, 20000)
+
+    # The networks to simulate, by the name printed for them.
+    configs = []
+    for case in args.cases:
+        configs.append(("case_%d" % case, getattr(ct,
+                        "TEST_CASE_%d_FILENAME" % case)))
+    config_dir = tempfile.mkdtemp()
+    try:
+        for num_pairs in args.pairs:
+            config_file = os.path.join(config_dir, "pairs_%d.txt" % num_pairs)
+            generate_config(config_file, num_pairs, args.flow_size)
+            configs.append(("%d pairs" % num_pairs, config_file))
+
+        print("%-16s" % "real time (s)" + "".join("%12s" % n for n in names))
+        for (config_name, config_file) in configs:
+            results = [time_simulation(config_file, n) for n in names]
+            # Every scheduler must have run the same simulation.
+            assert len(set(recordings for (t, recordings) in results)) == 1
+            print("%-16s" % config_name +
+                  "".join("%12.3f" % t for (t, recordings) in results))
+            sys.stdout.flush()
+
+        # The same transfers sent as packets and then simulated as fluids,
+        #   on full-duplex links with static routes so that the two agree.
+        if len(args.fluid_pairs) > 0:
+            print("\n%-16s%12s%12s%12s%12s" % ("real/net (s)", "packet",
+                  "fluid", "packet net", "fluid net"))
+        for num_pairs in args.fluid_pairs:
+            results = []
+            for fidelity in (ct.FIDELITY_PACKET, ct.FIDELITY_FLUID):
+                config_file = os.path.join(config_dir, "%s_%d.txt" % 
+                                           (fidelity, num_pairs))
+                generate_config(config_file, num_pairs, args.fluid_size,
+                                fidelity, ct.DUPLEX_FULL)
+                results.append(time_simulation(config_file, 
+                                               ct.DEFAULT_SCHEDULER,
+                                               ct.ROUTING_STATIC))
+            print("%-16s" % ("%d x %d MB" % (num_pairs, args.fluid_size)) +
+                  "".join("%12.3f" % t for (t, recordings) in results) +
+                  "".join("%12.3f" % (recordings * ct.RECORD_TIME / 1000)
+                          for (t, recordings) in results))
+            sys.stdout.flush()
+
+    finally:
+        shutil.rmtree(config_dir, ignore_errors=True)
+
+    for queue_size in args.hold_sizes:
+        print("%-16s" % ("hold %d" % queue_size) +
+              "".join("%12.3f" % time_hold(n, queue_size, args.holds)
+                      for n in names))
+        sys.stdout.flush()
+
+    if args.memory_packets > 0:
+        print("\n%-16s%12s" % ("packet store", "bytes/pkt"))
+        for (name, size) in measure_packet_memory(args.memory_packets):
+            print("%-16s%12.1f" % (name, size))
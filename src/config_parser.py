@@ -34,9 +34,6 @@ import event as e
 import constants as ct
 import conversion as cv
 
-# Import simulator so we can access events, objects and time.
-sim = sys.modules['__main__']
-
 # Import utility functions
 import utility as u
 
@@ -48,7 +45,7 @@ import utility as u
 ############################################################################
 
 
-def load_network_objects(network_file):
+def load_network_objects(sim, network_file):
     '''
     Description:        Loads the network topology from a config file that is 
                         argued at the command line.  For each object in the 
@@ -56,7 +53,11 @@ def load_network_objects(network_file):
                         indexes it in a dictionary by its unique identifier 
                         (usually a name or ID).
 
-    Arguments:          network_file (string) 
+    Arguments:          sim (Simulation)
+                            - The Simulation the network objects are loaded 
+                            into.
+
+                        network_file (string) 
                             - A string representing the relative file name of 
                             the network topology config file.
 
@@ -73,7 +74,7 @@ def load_network_objects(network_file):
                         
                         sim.packets (dictionary) 
                             - A dictionary of Packet indexed by their unique
-                            identifier (a (packet_ID, flow_name)) tuple.  This
+                            identifier (a (flow_ID, packet_ID)) tuple.  This
                             dicationary is untouched (and thus empty) by this 
                             function.
 
@@ -91,6 +92,14 @@ def load_network_objects(network_file):
                             - Adds Flow instances to this dictionary when 
                             loading network objects.
 
+                        sim.endpoint_list, sim.endpoint_names, 
+                        sim.link_list, sim.flow_list (WRITE)
+                            - Each object is appended to the list of its
+                            kind, and its ID is its index there.  The IDs 
+                            follow the order of the config file (with the 
+                            routing flow last), and the objects refer to 
+                            each other by ID.
+
     Limitations:        Only works if the network topology file is in the 
                         correct format.  Behavior is undefined and 
                         unpredictable otherwise.  Please see the 
@@ -98,6 +107,10 @@ def load_network_objects(network_file):
     Known Bugs:         None.
 
     Revision History:   2015/11/02: Created
+                        2026/10/18: Interns the names to integer IDs.
+                        2026/10/18: Reads the optional duplex mode of links.
+                        2026/10/18: Reads the optional fidelity of flows.
+                        2026/10/18: Start times are in ticks.
     '''
     
     # Open the file so we can parse it.
@@ -115,8 +128,12 @@ def load_network_objects(network_file):
         # Remove new line
         host_name = host_name.strip()
 
-        # Create a host and add it to the dictionary.
-        sim.endpoints[host_name] = h.Host(host_name)
+        # Create a host with the next endpoint ID and add it to the 
+        #   dictionary and the list of endpoints.
+        host = h.Host(sim, len(sim.endpoint_list), host_name)
+        sim.endpoints[host_name] = host
+        sim.endpoint_list.append(host)
+        sim.endpoint_names.append(host_name)
         
         # Read the host_name on the next.
         host_name = network.readline()
@@ -134,13 +151,18 @@ def load_network_objects(network_file):
         # Remove new line
         router_name = router_name.strip()
 
-        # Create a router and add it to the dictionary.
-        sim.endpoints[router_name] = r.Router(router_name)
+        # Create a router with the next endpoint ID and add it to the 
+        #   dictionary and the list of endpoints.
+        router = r.Router(sim, len(sim.endpoint_list), router_name)
+        sim.endpoints[router_name] = router
+        sim.endpoint_list.append(router)
+        sim.endpoint_names.append(router_name)
         
         # Read the next line.
         router_name = network.readline()
     
-    # Next line is just "linkSpecs (ID Rate Delay Buffer)"
+    # Next line is just "linkSpecs (ID Rate Delay Buffer Endpoint1 Endpoint2 
+    #   [Duplex])"
     network.readline()
     
     # First link_name
@@ -149,23 +171,38 @@ def load_network_objects(network_file):
     # Iterate through link specs, create Links, and add them to the links
     # dictionary.
     while link != '\n':
-        # Link text encoding: (ID Rate Delay Buffer Endpoint1 Endpoint2)
-        # Get list storing: [ID, Rate, Delay, Buffer, Endpoint1, Endpoint2]
+        # Link text encoding: (ID Rate Delay Buffer Endpoint1 Endpoint2 
+        #   [Duplex])
+        # Get list storing: [ID, Rate, Delay, Buffer, Endpoint1, Endpoint2, 
+        #   (Duplex)]
         link = link.split()
 
-        # Create a link and add it to the dictionary
-        sim.links[link[0]] = l.Link(link[0], float(link[1]), int(link[2]), 
-                                             int(link[3]), (link[4], link[5]))
-
-        # Add the name of this Link as an endpoint attribute to each of the 
+        # The duplex mode is optional, so older config files still work.
+        duplex = ct.DEFAULT_DUPLEX
+        if len(link) > 6:
+            duplex = link[6]
+            if duplex not in (ct.DUPLEX_HALF, ct.DUPLEX_FULL):
+                raise ValueError("link %s: duplex must be %s or %s, not %s" 
+                                 % (link[0], ct.DUPLEX_HALF, ct.DUPLEX_FULL,
+                                    duplex))
+
+        # Create a link with the next link ID and add it to the dictionary
+        #   and the list of links.
+        new_link = l.Link(sim, len(sim.link_list), link[0], float(link[1]), 
+                          int(link[2]), int(link[3]), (link[4], link[5]),
+                          duplex)
+        sim.links[link[0]] = new_link
+        sim.link_list.append(new_link)
+
+        # Add the ID of this Link as an endpoint attribute to each of the 
         # endpoints 
-        sim.endpoints[link[4]].add_link(link[0])
-        sim.endpoints[link[5]].add_link(link[0])
+        sim.endpoints[link[4]].add_link(new_link.ID)
+        sim.endpoints[link[5]].add_link(new_link.ID)
 
         # Read the next line.
         link = network.readline()
     
-    # Next line is just "flowSpecs (ID Src Dest Data Start)"
+    # Next line is just "flowSpecs (ID Src Dest Data Start [Fidelity])"
     network.readline()
 
     flow = network.readline()
@@ -173,13 +210,27 @@ def load_network_objects(network_file):
     # Iterate through flow specs, create Flows, and add them to the flows
     # dictionary.
     while flow != '\n' and flow != '':
-        # Flow text encoding: (ID Src Dest Data Start_Time)
-        # Get list storing: [ID, Src, Dest, Data]
+        # Flow text encoding: (ID Src Dest Data Start_Time [Fidelity])
+        # Get list storing: [ID, Src, Dest, Data, Start_Time, (Fidelity)]
         flow = flow.split()
+
+        # The fidelity is optional, so older config files still work.
+        fidelity = ct.DEFAULT_FIDELITY
+        if len(flow) > 5:
+            fidelity = flow[5]
+            if fidelity not in (ct.FIDELITY_PACKET, ct.FIDELITY_FLUID):
+                raise ValueError("flow %s: fidelity must be %s or %s, not %s"
+                                 % (flow[0], ct.FIDELITY_PACKET, 
+                                    ct.FIDELITY_FLUID, fidelity))
         
-        # Create a flow and add it to the dictionary.
-        sim.flows[flow[0]] = f.Flow(flow[0], flow[1], \
-                  flow[2], int(flow[3]), 1000 * float(flow[4]))
+        # Create a flow with the next flow ID and add it to the dictionary 
+        #   and the list of flows.
+        new_flow = f.Flow(sim, len(sim.flow_list), flow[0], flow[1], 
+                          flow[2], int(flow[3]), 
+                          cv.ms_to_ticks(1000 * float(flow[4])),
+                          fidelity)
+        sim.flows[flow[0]] = new_flow
+        sim.flow_list.append(new_flow)
         
         # Read the next line.
         flow = network.readline()
@@ -189,7 +240,10 @@ def load_network_objects(network_file):
     
     # Add a flow specifically for the routing tables to communicate with each
     #   other.
-    sim.flows[ct.ROUTING_FLOW] = f.Flow(ct.ROUTING_FLOW, None, None, None, 0.0)
+    routing_flow = f.Flow(sim, len(sim.flow_list), ct.ROUTING_FLOW, None, 
+                          None, None, 0)
+    sim.flows[ct.ROUTING_FLOW] = routing_flow
+    sim.flow_list.append(routing_flow)
     
     # Create a dictionary for the packets.  Will be empty at first, but let's 
     # do it here so all of the dictionaries are created at once/in one place.
@@ -197,7 +251,7 @@ def load_network_objects(network_file):
 
     # For debugging/user experience purposes -- to ensure network topology was 
     # loaded correctly
-    print("\nNetwork config file: %s\n" % sys.argv[1])
+    print("\nNetwork config file: %s\n" % network_file)
     print("--- NETWORK TOPOLOGY ---\n")
     u.print_dict_keys("Endpoints", sim.endpoints)
     u.print_dict_keys("Links", sim.links)
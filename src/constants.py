@@ -58,6 +58,8 @@ INPUT_DIRECTORY      = HOME_DIRECTORY   + "in/"
 DATA_DIRECTORY       = OUTPUT_DIRECTORY + "data/"
 LOG_DIRECTORY        = OUTPUT_DIRECTORY + "log/"
 TESTS_DIRECTORY      = INPUT_DIRECTORY  + "test_configs/"
+FORK_DIRECTORY       = OUTPUT_DIRECTORY + "fork/"
+SWEEP_DIRECTORY      = OUTPUT_DIRECTORY + "sweep/"
 
 # Log output filenames
 MAIN_LOG_FILE        = LOG_DIRECTORY    + "main.log"
@@ -81,6 +83,32 @@ TEST_CASE_0_FILENAME = TESTS_DIRECTORY  + "case_0.txt"
 TEST_CASE_1_FILENAME = TESTS_DIRECTORY  + "case_1.txt"
 TEST_CASE_2_FILENAME = TESTS_DIRECTORY  + "case_2.txt"
 
+# Cancelled events are left in the event queue and skipped when popped.  Once
+#   at least this many have piled up and they make up more than the fraction
+#   below of the queue, the queue is rebuilt without them.
+EVENT_COMPACT_MIN    = 1024
+EVENT_COMPACT_RATIO  = 0.5
+
+# The event scheduler used unless another is selected (see scheduler.py for
+#   the choices).
+DEFAULT_SCHEDULER    = 'heap'
+
+# Calendar queue scheduler: the fewest buckets it shrinks to, the day width 
+#   (in ticks of the simulation clock, so 1 ms) it starts with and the number
+#   of soonest events it measures the spacing of to pick a new day width.
+CALENDAR_MIN_BUCKETS   = 2
+CALENDAR_INITIAL_WIDTH = 10 ** 6
+CALENDAR_SAMPLE_SIZE   = 25
+
+# Ladder queue scheduler: the most events sorted at once before a bucket is 
+#   spread over a finer rung instead, and the most rungs there can be.
+LADDER_THRESHOLD     = 50
+LADDER_MAX_RUNGS     = 8
+
+# The simulation clock counts integer ticks of a nanosecond, so times add up
+#   exactly (see cv.ms_to_ticks()).  The time constants here are all in 
+#   milliseconds and are converted where they are used.
+
 # Smallest timestep we use.  Needs to be ~0 because it is used to ensure one
 #   "simultaneous" event occurs before another.
 TIME_BIT             = 0        # Changed to zero because the heapqueue has
@@ -89,6 +117,9 @@ TIME_BIT             = 0        # Changed to zero because the heapqueue has
 # How often to record the network status in milliseconds
 RECORD_TIME          = 1
 
+# How often to print the simulation progress in milliseconds of real time
+PROGRESS_PERIOD      = 200
+
 # The number of seconds for each recording delta (in seconds)
 DELTA_SECS           = (RECORD_TIME * RECORD_DELTA) / 1000
 
@@ -99,6 +130,13 @@ CONFIG_PKT_TIME      = 500
 #   useful packets to update routing tables.
 ROUTING_TIMEOUT      = 150
 
+# How the routing tables are filled: dynamically, by the routers flooding
+#   routing packets every CONFIG_PKT_TIME, or statically, with the shortest
+#   paths worked out once when the network is loaded.
+ROUTING_DYNAMIC      = 'dynamic'
+ROUTING_STATIC       = 'static'
+DEFAULT_ROUTING      = ROUTING_DYNAMIC
+
 # Network objects
 TYPE_FLOW            = 0
 TYPE_LINK            = 1
@@ -111,6 +149,35 @@ PACKET_DATA          = 0
 PACKET_ACK           = 1
 PACKET_ROUTING       = 2
 
+# Link duplex modes: whether both directions share a link or each direction
+#   has its own.  Links are half-duplex unless the config file says otherwise.
+DUPLEX_HALF          = 'half'
+DUPLEX_FULL          = 'full'
+DEFAULT_DUPLEX       = DUPLEX_HALF
+
+# Flow fidelities: whether a flow sends packets or is simulated as a fluid
+#   (see fluid.py).  Flows send packets unless the config file says 
+#   otherwise.
+FIDELITY_PACKET      = 'packet'
+FIDELITY_FLUID       = 'fluid'
+DEFAULT_FIDELITY     = FIDELITY_PACKET
+
+# The rates of the fluid flows are worked out again whenever a queue 
+#   empties or fills, a flow starts or finishes, or a window or round trip
+#   changes by FLUID_TOLERANCE of itself, but at least every FLUID_MAX_STEP
+#   and at most every FLUID_MIN_STEP milliseconds.  Fluid flowing on a link
+#   always leaves packets FLUID_MIN_PACKET_SHARE of its rate.
+FLUID_TOLERANCE        = 0.05
+FLUID_MIN_STEP         = 0.01
+FLUID_MAX_STEP         = 100
+FLUID_MIN_PACKET_SHARE = 0.1
+
+# Link states
+LINK_IDLE            = 0            # Free to put a packet on the link
+LINK_TRANSMITTING    = 1            # Putting a packet on the link
+LINK_DRAINING        = 2            # Waiting for the link to clear before 
+                                    #   packets go the other way
+
 # Packet sizes in bytes
 PACKET_DATA_SIZE     = 1024         # Size of data Packet in bytes
 PACKET_ACK_SIZE      = 64           # Size of ack Packet in bytes
@@ -129,12 +196,18 @@ MAX_SIMULATION_TIME  = 1e5          # Maximum number of milliseconds the
                                     #   network should run (100 seconds)
                             
 # Initial values
-ACK_TIMEOUT_FACTOR   = 3     # Number of milliseconds to wait for acknowledgement
-                             # before timeout
-INITIAL_ASSUMED_RTT  = 500.0 # Before we know the round trip time, we need to
-                             #   define an initial one that we assume (in ms)
 INITIAL_WINDOW_SIZE  = 1.0   # The initial window size for each flow.
 
+# Retransmission timer, computed as in RFC 6298 (times in milliseconds)
+INITIAL_RTO          = 1000.0  # Timeout before any RTT has been measured
+MIN_RTO              = 200.0   # Lower bound on the timeout
+MAX_RTO              = 60000.0 # Upper bound on the timeout (after backoffs)
+RTO_ALPHA            = 0.125   # Gain of the smoothed RTT estimate
+RTO_BETA             = 0.25    # Gain of the RTT variation estimate
+RTO_K                = 4       # Number of RTT variations added to timeout
+RTO_GRANULARITY      = 1.0     # Smallest variation term added to timeout
+RTO_BACKOFF          = 2       # Factor the timeout grows by on each expiry
+
 
 # How often FAST TCP window update should be called (in milliseconds)
 FAST_TCP_PERIOD      = 100
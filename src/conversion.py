@@ -51,7 +51,7 @@ def bytes_to_Mb(num_in_bytes):
     '''
     Converts the parameter given in bytes to Mb and returns it.
     '''
-    return (1.0 * num_in_bytes) / (8 * 10 ** 6)
+    return (8.0 * num_in_bytes) / (10 ** 6)
 
 
 def KB_to_bytes(num_in_KB):
@@ -65,7 +65,7 @@ def KB_to_Mb(num_in_KB):
 	'''
 	Converts the parameter given in KB to Megabits.
 	'''
-	return (1.0 * num_in_KB) / (8 * (10 ** 3))
+	return (8.0 * num_in_KB) / (10 ** 3)
 
 
 def bits_to_MB(num_in_bits):
@@ -101,3 +101,19 @@ def bytes_to_KB(num_in_bytes):
     Converts the parameter given in bytes to MB and returns it.
     '''
     return (1.0 * num_in_bytes) / (10 ** 3)
+
+
+def ms_to_ticks(num_in_ms):
+    '''
+    Converts the parameter given in ms to ticks of the simulation clock, which
+    are nanoseconds, rounded to the nearest tick, and returns the result.
+    '''
+    return int(round(num_in_ms * (10 ** 6)))
+
+
+def ticks_to_ms(num_in_ticks):
+    '''
+    Converts the parameter given in ticks of the simulation clock 
+    (nanoseconds) to ms and returns the result.
+    '''
+    return num_in_ticks / (10 ** 6)
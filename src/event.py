@@ -7,7 +7,7 @@
 # event.py
 #
 # This file contains the event class, which is a class describing a particular
-# event using its actor, function call and parameter list.
+# event using the bound function to call and its parameter list.
 #
 ############################################################################
 
@@ -40,35 +40,35 @@ import conversion as cv
 
 class Event:
 
-    def __init__(self, in_actor, in_function, in_parameters):
+    def __init__(self, in_function, in_parameters):
         '''
         Description:        Create an event for the network and all of the 
                             information necessary for execution.
 
-        Arguments:          in_actor (string)
-                                - A string indicating which actor is carrying 
-                                out this particular event (i.e., "H1").
-
-                            in_function (string)
-                                - A string indicating what action is to be 
-                                executed for this particular event (i.e., 
-                                'check_ack_timeout).
+        Arguments:          in_function (bound method)
+                                - The method that is to be executed for this 
+                                particular event, already bound to the actor 
+                                carrying it out (i.e., host.check_ack_timeout 
+                                for the Host "H1").
 
                             in_parameters (list of variable types)
                                 - A list containing the parameters that are 
                                 necessary to carry out the input function 
-                                (i.e., [flow_name (string), packet_ID (string)] 
-                                for host.receive_packet())
+                                (i.e., [packet (Packet)] for 
+                                host.receive_packet())
 
-        Shared Variables:   self.actor (WRITE) 
-                                - Initialized
-                            
-                            self.function (WRITE) 
+        Shared Variables:   self.function (WRITE) 
                                 - Initialized
                             
                             self.parameters (WRITE) 
                                 - Initialized
 
+                            self.queued (WRITE)       (not init argument)
+                                - Initialized
+
+                            self.cancelled (WRITE)    (not init argument)
+                                - Initialized
+
         Global Variables:   None.
 
         Limitations:        None.
@@ -76,15 +76,23 @@ class Event:
         Known Bugs:         None.
 
         Revision History:   10/20/15: Created
+                            2026/10/18: Holds the bound function rather than the
+                                        actor and function names so nothing has
+                                        to be looked up when the event runs.
         '''     
-        # The object (e.g. Router) that will be executing the event
-        self.actor = in_actor
-                
-        # Function to be executed by the object
+        # Function to be executed, bound to the object (e.g. Router) that will
+        #   be executing the event
         self.function = in_function
                 
         # List of parameters for the function being executed
         self.parameters = in_parameters
+
+        # True while the event is sitting in the event queue.
+        self.queued = False
+
+        # A cancelled event stays in the event queue but is skipped when it is
+        #   popped.
+        self.cancelled = False
            
 
     def get_elements(self):
@@ -93,19 +101,13 @@ class Event:
 
         Arguments:          None.
 
-        Return Values:      self.actor (string) 
-                                - The name of the actor for the event.
-
-                            self.function (string) 
-                                - The name of the function for the event.
+        Return Values:      self.function (bound method) 
+                                - The function to call for the event.
 
                             self.parameters (list) 
                                 - A list of arguments for the function.
 
-        Shared Variables:   self.actor (READ) 
-                                - Returned
-
-                            self.function (READ) 
+        Shared Variables:   self.function (READ) 
                                 - Returned
 
                             self.parameters (READ) 
@@ -119,6 +121,4 @@ class Event:
 
         Revision History:   11/02/15: Created
         '''
-        return self.actor, self.function, self.parameters
-
-
+        return self.function, self.parameters
@@ -23,9 +23,6 @@
 # So we can use command line arguments.
 import sys
 
-# So we can copy heapqueues.
-import copy
-
 # Import network objects
 import packet as p
 import link as l
@@ -40,9 +37,6 @@ import conversion as cv
 # Import utility functions
 import utility as u
 
-# Import functions to carry out the simulation
-sim  = sys.modules['__main__']
-
 # Import the config parser
 import config_parser as cp
 
@@ -62,12 +56,21 @@ import heapq
 
 class Flow:
 
-    def __init__(self, in_flow_name, in_src, in_dest, in_size, in_start_time):
+    def __init__(self, in_sim, in_ID, in_flow_name, in_src, in_dest, in_size,
+                 in_start_time, in_fidelity=ct.DEFAULT_FIDELITY):
         '''
         Description:        Initialize an instance of Flow by intitializing 
                             its attributes.
 
-        Arguments:          in_flow_name (string)
+        Arguments:          in_sim (Simulation)
+                                - The Simulation that this Flow instance is a 
+                                part of.
+
+                            in_ID (integer)
+                                - The ID of this Flow, its index in 
+                                sim.flow_list.
+
+                            in_flow_name (string)
                                 - A string indicating the name of this Flow 
                                 instance (i.e., "F1").
 
@@ -86,13 +89,24 @@ class Flow:
                                 sent for this particular Flow object (in MB, 
                                 i.e., 20).
 
-                            in_start_time (float)
-                                - A float indicating the start time of this 
-                                Flow instance (i.e., 4.567)
+                            in_start_time (int)
+                                - An int indicating the start time of this 
+                                Flow instance in ticks (i.e., 4567000000)
+
+                            in_fidelity (string)
+                                - Whether the Flow sends packets 
+                                (ct.FIDELITY_PACKET) or is simulated as a 
+                                fluid (ct.FIDELITY_FLUID).
 
-        Shared Variables:   self.type (WRITE)              (not init argument)
+        Shared Variables:   self.sim (WRITE)
+                                - Initialized
+
+                            self.type (WRITE)              (not init argument)
                                 - Initialized
                             
+                            self.ID (WRITE) 
+                                - Initialized
+
                             self.flow_name (WRITE) 
                                 - Initialized
                             
@@ -102,6 +116,10 @@ class Flow:
                             self.dest (WRITE) 
                                 - Initialized
 
+                            self.src_ID, self.dest_ID (WRITE) 
+                                                           (not init argument)
+                                - Initialized
+
                             self.size (WRITE)
                                 - Initialized
 
@@ -111,7 +129,10 @@ class Flow:
                             self.start_time (WRITE)
                                 - Initialized
 
-                            self.packets_to_send (WRITE)   (not init argument)    
+                            self.next_to_send (WRITE)      (not init argument)
+                                - Initialized
+
+                            self.num_data_packets (WRITE)  (not init argument)
                                 - Initialized
 
                             self.packets_in_flight (WRITE) (not init argument) 
@@ -132,6 +153,45 @@ class Flow:
                             self.last_RTT (WRITE)          (not init argument)
                                 - Initialized
 
+                            self.srtt (WRITE)              (not init argument)
+                                - Initialized
+
+                            self.rttvar (WRITE)            (not init argument)
+                                - Initialized
+
+                            self.rto (WRITE)               (not init argument)
+                                - Initialized
+
+                            self.rto_timer (WRITE)         (not init argument)
+                                - Initialized
+
+                            self.packets_sent (WRITE)      (not init argument)
+                                - Initialized
+
+                            self.packets_lost (WRITE)      (not init argument)
+                                - Initialized
+
+                            self.delay_sum (WRITE)         (not init argument)
+                                - Initialized
+
+                            self.delay_count (WRITE)       (not init argument)
+                                - Initialized
+
+                            self.finish_time (WRITE)       (not init argument)
+                                - Initialized
+
+                            self.fidelity (WRITE)
+                                - Initialized
+
+                            self.fluid_path (WRITE)        (not init argument)
+                                - Initialized
+
+                            self.fluid_rate (WRITE)        (not init argument)
+                                - Initialized
+
+                            self.fluid_delivered (WRITE)   (not init argument)
+                                - Initialized
+
         Global Variables:   None.
 
         Limitations:        None.
@@ -139,10 +199,17 @@ class Flow:
         Known Bugs:         None.
 
         Revision History:   10/06/15: Created
+                            2026/10/18: Can be a fluid.
         '''
+        # The simulation this Flow belongs to.
+        self.sim = in_sim
+
         # Store the type so it can be easily identified as a router.
         self.type = ct.TYPE_FLOW
         
+        # The ID of the Flow, which packets refer to it by.
+        self.ID = in_ID
+
         # Name of the Flow, each ID is a unique string (i.e. "F1")
         self.flow_name = in_flow_name
 
@@ -152,22 +219,36 @@ class Flow:
         # host_name of destination Host, a string
         self.dest = in_dest
 
+        # The endpoint IDs of the source and destination Hosts (None for the
+        #   routing flow, which has neither).
+        self.src_ID = None
+        self.dest_ID = None
+        if in_src is not None:
+            self.src_ID = self.sim.endpoints[in_src].ID
+            self.dest_ID = self.sim.endpoints[in_dest].ID
+
         # Amount of data being sent, an int (in bytes)
         self.size = in_size
 
         # Window size as computed.
         self.window_size = ct.INITIAL_WINDOW_SIZE
         
-        # The time the flow is starting.
+        # The time the flow is starting, in ticks.
         self.start_time = in_start_time
         
-        # The packets that must be sent.
-        self.packets_to_send = []
+        # The chronological number of the next packet to send for the first
+        #   time, and the number of data packets in the flow (known once it 
+        #   starts).  A packet is only created when the window lets it be 
+        #   sent, so every packet from next_to_send to num_data_packets is 
+        #   still to be sent.
+        self.next_to_send = 1
+        self.num_data_packets = 0
         
         # The packets that are in flight.
         self.packets_in_flight = []
         
-        # Every number less than this has been used as an ID.
+        # Every number less than this has been used as an ID, or is kept for
+        #   a data packet that has not been created yet.
         self.next_available_ID = 1
         
         # The next chronological packet that the dest expects from the src.
@@ -182,15 +263,35 @@ class Flow:
         #   interval.  Used to compute flow rate.
         self.acked_packets = 0
         
-        # This is the assumed RTT, which is only relevant when we have not
-        #   yet received any packets and are still guessing the RTT.
-        self.assumed_RTT = ct.INITIAL_ASSUMED_RTT
-        
-        # Keep track of the round trip time a packet has taken so we can
-        #   guage an appropriate timeout-check delay.  Before any acks are
-        #   received, this is more of a blind guess.
+        # Keep track of the round trip time the last acknowledged packet 
+        #   took.  Zero until the first ack is received.
         self.last_RTT = 0
 
+        # The smoothed RTT and RTT variation used to compute the 
+        #   retransmission timeout (RFC 6298).  Zero until the first ack is 
+        #   received.
+        self.srtt = 0
+        self.rttvar = 0
+
+        # The retransmission timeout in milliseconds.  Before any RTT has 
+        #   been measured, this is more of a blind guess.
+        self.rto = ct.INITIAL_RTO
+
+        # The flow's one retransmission timer (an enqueued Event), or None 
+        #   when no timer is running.
+        self.rto_timer = None
+
+        # Totals over the whole flow for its summary: the data packets sent
+        #   (resends included) and dropped by full link buffers, and the sum 
+        #   and number of the RTTs of acknowledged packets.
+        self.packets_sent = 0
+        self.packets_lost = 0
+        self.delay_sum = 0
+        self.delay_count = 0
+
+        # The time the flow finished in ticks, or None while it is running.
+        self.finish_time = None
+
         # Keep track of the minimum RTT up until this point for Fast TCP
         self.min_RTT = 0
 
@@ -214,7 +315,16 @@ class Flow:
 
         # Keep track of time of last dropped packet update so we have a buffer 
         #   period that avoids too many successive window updates.
-        self.last_update = 0.0
+        self.last_update = 0
+
+        # Whether the flow sends packets or is a fluid.  A fluid flow sends 
+        #   data at a rate rather than packets (see fluid.py): the links on
+        #   its route (a list of (link ID, sender index)), the rate it sends
+        #   at (in bytes/ms) and the packets' worth of data it has delivered.
+        self.fidelity = in_fidelity
+        self.fluid_path = None
+        self.fluid_rate = 0
+        self.fluid_delivered = 0
 
     
     def periodic_window_update(self, unused_list):
@@ -258,9 +368,10 @@ class Flow:
         
         # Enqueue event for updating flow, this will cause window to be updated 
         #   periodically.
-        FAST_TCP_update = e.Event(self.flow_name, 'periodic_window_update', [])
-        update_time = sim.network_now() + ct.FAST_TCP_PERIOD
-        sim.enqueue_event(update_time, FAST_TCP_update)
+        FAST_TCP_update = e.Event(self.periodic_window_update, [])
+        update_time = self.sim.network_now() + \
+                      cv.ms_to_ticks(ct.FAST_TCP_PERIOD)
+        self.sim.enqueue_event(update_time, FAST_TCP_update)
             
         
         # Unpack avg_RTT so we can compute the average_RTT
@@ -276,6 +387,142 @@ class Flow:
         # Reset the metrics used to update the flow for FAST TCP
         self.avg_RTT = (0, 0)        
         
+    def update_rto(self, rtt):
+        '''
+        Description:        Updates the smoothed RTT, the RTT variation and 
+                            the retransmission timeout with a new RTT 
+                            measurement, as described in RFC 6298.  A new 
+                            measurement also undoes any backoff of the 
+                            timeout.
+        
+        Arguments:          rtt (float)
+                                - The measured round trip time in 
+                                milliseconds.
+        
+        Return Values:      None.
+        
+        Shared Variables:   self.srtt (WRITE)
+                                - Updated with the measurement.
+
+                            self.rttvar (WRITE)
+                                - Updated with the measurement.
+
+                            self.rto (WRITE)
+                                - Recomputed from srtt and rttvar.
+        
+        Global Variables:   None.
+        
+        Limitations:        None.
+        
+        Known Bugs:         None.
+        
+        Revision History:   2026/10/18: Created
+        '''
+        if self.srtt == 0:
+            # First measurement.
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            # The variation is updated with the old smoothed RTT.
+            self.rttvar = (1 - ct.RTO_BETA) * self.rttvar + \
+                          ct.RTO_BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - ct.RTO_ALPHA) * self.srtt + ct.RTO_ALPHA * rtt
+
+        self.rto = self.srtt + max(ct.RTO_GRANULARITY, ct.RTO_K * self.rttvar)
+        self.rto = min(max(self.rto, ct.MIN_RTO), ct.MAX_RTO)
+
+
+    def start_retransmission_timer(self):
+        '''
+        Description:        Starts the retransmission timer of this flow so it 
+                            expires one retransmission timeout from now.  If 
+                            the timer is already running, it is left alone.
+        
+        Arguments:          None.
+        
+        Return Values:      None.
+        
+        Shared Variables:   self.rto_timer (WRITE)
+                                - Set to the timeout event.
+
+                            self.rto (READ)
+                                - The time until the timer expires.
+        
+        Global Variables:   sim.event_queue (WRITE)
+                                - The timeout event is enqueued.
+        
+        Limitations:        None.
+        
+        Known Bugs:         None.
+        
+        Revision History:   2026/10/18: Created
+        '''
+        if self.rto_timer is not None:
+            return
+
+        # The source host handles the timeout.
+        tmout_time = self.sim.network_now() + cv.ms_to_ticks(self.rto)
+        tmout_event = e.Event(
+                        self.sim.endpoint_list[self.src_ID].check_ack_timeout,
+                        [self.ID])
+        self.rto_timer = self.sim.enqueue_event(tmout_time, tmout_event)
+
+
+    def stop_retransmission_timer(self):
+        '''
+        Description:        Stops the retransmission timer of this flow if it 
+                            is running.
+        
+        Arguments:          None.
+        
+        Return Values:      None.
+        
+        Shared Variables:   self.rto_timer (WRITE)
+                                - Cancelled and set to None.
+        
+        Global Variables:   sim.event_queue (WRITE)
+                                - The timeout event is cancelled.
+        
+        Limitations:        None.
+        
+        Known Bugs:         None.
+        
+        Revision History:   2026/10/18: Created
+        '''
+        if self.rto_timer is not None:
+            self.sim.cancel_event(self.rto_timer)
+            self.rto_timer = None
+
+
+    def restart_retransmission_timer(self):
+        '''
+        Description:        Restarts the retransmission timer after new data 
+                            has been acknowledged.  If there is nothing left in 
+                            flight, the timer is just stopped.
+        
+        Arguments:          None.
+        
+        Return Values:      None.
+        
+        Shared Variables:   self.rto_timer (WRITE)
+                                - Replaced with a new timeout event, or None.
+
+                            self.packets_in_flight (READ)
+                                - The timer only runs while this is nonempty.
+        
+        Global Variables:   None.
+        
+        Limitations:        None.
+        
+        Known Bugs:         None.
+        
+        Revision History:   2026/10/18: Created
+        '''
+        self.stop_retransmission_timer()
+        if len(self.packets_in_flight) > 0:
+            self.start_retransmission_timer()
+
+
     def create_packet_ID(self):
         '''
         Description:        This creates a unique ID for a packet in this flow.
@@ -311,8 +558,11 @@ class Flow:
  
     def start_flow(self, unused_list):
         '''
-        Description:        This starts the flow by creating all of the packets 
-                            in the flow and then starting to send them.
+        Description:        This starts the flow by working out how many 
+                            packets it is made of and then starting to send 
+                            them.  The packets themselves are only created 
+                            as the window admits them (see 
+                            create_next_packet()).
         
         Arguments:          unused_list (List) 
                                 - Unused.
@@ -321,45 +571,90 @@ class Flow:
         
         Shared Variables:   self.size (READ) 
                                 - Used to determine how many packets to create.
+
+                            self.num_data_packets (WRITE)
+                                - Set to the number of packets in the flow.
+
+                            self.next_available_ID (WRITE)
+                                - Moved past the IDs of the data packets.
         
-        Global Variables:   sim.packets (WRITE) 
-                                - New packets are written to the global 
-                                dictionary.
+        Global Variables:   None.
         
         Limitations:        None.
         
         Known Variables:    None.
         
         Revision History:   11/16/15: Created
+                            2026/10/18: Packets are created on demand instead
+                                        of all up front.
+                            2026/10/18: Fluid flows go to the fluid model.
         '''
 
+        # Calculate the number of packets we need to send all of the data
+        self.num_data_packets = int(cv.MB_to_bytes(self.size) / 
+                                    ct.PACKET_DATA_SIZE)
+
+        # A fluid flow sends no packets, the fluid model moves its data.
+        if self.fidelity == ct.FIDELITY_FLUID:
+            self.sim.fluid.add_flow(self)
+            return
+
         # Call periodic_window_update initially so that periodic window update can 
         #   be enqueued, to start the periodic updates
         if self.congestion_alg == ct.FLOW_FAST_TCP:
             self.periodic_window_update([])
 
-        # Calculate the number of packets we need to send all of the data
-        num_packets = int(cv.MB_to_bytes(self.size) / ct.PACKET_DATA_SIZE) + 1
-        
-        # Create all of the packets.
-        for i in range(1, num_packets):
-            # First, create a packet.
-            new_pkt = p.Packet(self.create_packet_ID(), self.flow_name, 
-                               self.src, self.dest, ct.PACKET_DATA)
-                               
-            # Set the data of the packet to be its "chronological" number.
-            new_pkt.set_data(i)
-                               
-            # Put the packet into the heapqueue.
-            heapq.heappush(self.packets_to_send, (i, new_pkt))
-            
-            # Put the packet into the global dictionary of packets.
-            sim.packets[(self.flow_name, new_pkt.ID)] = new_pkt
+        # Packet i of the flow gets ID i when it is created, so keep those 
+        #   IDs for them.  Resent copies get IDs after these.
+        self.next_available_ID = self.num_data_packets + 1
             
         # Update the flow so that we have packets in motion.
         self.update_flow()
         
         
+    def create_next_packet(self):
+        '''
+        Description:        Creates the next packet of the flow to be sent for
+                            the first time.
+        
+        Arguments:          None.
+        
+        Return Values:      (integer)
+                                - The chronological number of the packet.
+
+                            (Packet)
+                                - The new packet.
+        
+        Shared Variables:   self.next_to_send (WRITE)
+                                - Moved on to the packet after it.
+        
+        Global Variables:   sim.packets (WRITE) 
+                                - The new packet is written to the global 
+                                dictionary.
+        
+        Limitations:        Must only be called while there are packets 
+                            left to send.
+        
+        Known Bugs:         None.
+        
+        Revision History:   2026/10/18: Created from start_flow(), which 
+                                        created every packet at once.
+        '''
+        pkt_num = self.next_to_send
+        self.next_to_send += 1
+
+        # Create the packet with the ID kept for it, and set its data to be 
+        #   its "chronological" number.
+        new_pkt = p.Packet(pkt_num, self.ID, self.src_ID, self.dest_ID, 
+                           ct.PACKET_DATA)
+        new_pkt.set_data(pkt_num)
+
+        # Put the packet into the global dictionary of packets.
+        self.sim.add_packet(new_pkt)
+
+        return pkt_num, new_pkt
+
+
     def resend_inflight_packets(self):
         '''
         Description:        Creates copies of all of the in flight packets and
@@ -375,7 +670,7 @@ class Flow:
                                 - This is overwritten to contain all of the 
                                 new packets.
                           
-                            flow_name (READ) 
+                            ID (READ) 
                                 - Used to index packets in the global 
                                 dictionary.
         
@@ -390,8 +685,9 @@ class Flow:
         Revision History:   11/16/15: Created
         '''
         
-        # Create a new queue of packets in flight
-        old_flight = copy.deepcopy(self.packets_in_flight)
+        # Create a new queue of packets in flight.  The old packets are only
+        #   read, so the old queue is taken over rather than copied.
+        old_flight = self.packets_in_flight
         self.packets_in_flight = []
         
         # Remove all of the packets in flight, make a new packet out of them
@@ -404,7 +700,7 @@ class Flow:
             (old_num, old_pkt) = heapq.heappop(old_flight)
             
             # Create a new packet from it but with a new ID.
-            new_pkt = p.Packet(self.create_packet_ID(), self.flow_name,
+            new_pkt = p.Packet(self.create_packet_ID(), self.ID,
                                old_pkt.src, old_pkt.dest, old_pkt.type)
 
             # Make sure the new packet contains the same data (index)
@@ -412,17 +708,18 @@ class Flow:
             
             # Set the time of this new packet to be the current time so we can
             #   determine the round trip time later.
-            new_pkt.time = sim.network_now()
+            new_pkt.time = self.sim.network_now()
             
             # Add it to the new queue of packets.
             heapq.heappush(self.packets_in_flight, (new_pkt.data, new_pkt))
             
             # Add it to the dictionary of packets.
-            sim.packets[(self.flow_name, new_pkt.ID)] = new_pkt
+            self.sim.add_packet(new_pkt)
             
             # Create an event to send this packet.
-            send_event = e.Event(new_pkt.src, 'send_packet', [new_pkt])
-            sim.enqueue_event(sim.network_now(), send_event)
+            src = self.sim.endpoint_list[new_pkt.src]
+            send_event = e.Event(src.send_packet, [new_pkt])
+            self.sim.enqueue_event(self.sim.network_now(), send_event)
 
             
     def update_flow(self):
@@ -447,9 +744,9 @@ class Flow:
                                     - Read to determine if packets should be 
                                     sent.
 
-                                packets_to_send (WRITE) 
-                                    - Packets that are to be sent are popped 
-                                    from this queue.
+                                next_to_send (WRITE) 
+                                    - Packets that are to be sent are created
+                                    from this cursor.
 
                                 flow_name (READ) 
                                     - Used for identification purposes.
@@ -459,51 +756,91 @@ class Flow:
                                     a packet needs to be put in flight, and to 
                                     account for window updates in the case of 
                                     FAST TCP being used.
-        
+
         Limitations:            None.
         
         Known Bugs:             None.
         
         Revision History:       11/13/15: Created
+                                2026/10/18: Moved finishing the flow to 
+                                            finish_flow().
+                                2026/10/18: TIME_BIT is converted to ticks.
         '''
 
-        sim.log_flow.write("[%.5f]: Updating %s\n" % 
-                          (sim.network_now(), self.flow_name))
-        sim.log_flow.write("\tin-flight / window size: %d/%d (Before)\n" %
+        self.sim.log_flow.write("[%.5f]: Updating %s\n" % 
+                          (self.sim.network_now_ms(), self.flow_name))
+        self.sim.log_flow.write("\tin-flight / window size: %d/%d (Before)\n" %
                           (len(self.packets_in_flight), self.window_size))
 
         while len(self.packets_in_flight) < self.window_size:
             # If there are no packets to send, the flow is done.
-            if len(self.packets_to_send) == 0:
-                # Remove it from our list ofrunning packets.  If it does not 
-                #   work, we already deleted it, so continue normally.
+            if self.next_to_send > self.num_data_packets:
+                # If it does not work, we already finished it, so continue 
+                #   normally.
                 try:
-                    sim.running_flows.remove(self.flow_name)
-                    self.window_size = 0
-                    self.last_RTT = 0
-                    self.avg_RTT = (0, 0)
-                    self.min_RTT = 0
+                    self.finish_flow()
                 except ValueError:
                     pass
                 return
                 
-            # Get a packet from the list of packets to send.
-            (pkt_num, pkt) = heapq.heappop(self.packets_to_send)
+            # Create the next packet to send.
+            (pkt_num, pkt) = self.create_next_packet()
             
             # Set the time of the packet so we can calculate the round trip
             #   time upon reception of this packet's ack.
-            pkt.time = sim.network_now()
+            pkt.time = self.sim.network_now()
 
             # Put it in flight.
             heapq.heappush(self.packets_in_flight, (pkt_num, pkt))
             
             # Tell the host to send the packet by creating an event for it.
-            send_time = sim.network_now() + ct.TIME_BIT
-            send_event = e.Event(self.src, 'send_packet', [pkt])
-            sim.enqueue_event(send_time, send_event)
+            send_time = self.sim.network_now() + cv.ms_to_ticks(ct.TIME_BIT)
+            src = self.sim.endpoint_list[self.src_ID]
+            send_event = e.Event(src.send_packet, [pkt])
+            self.sim.enqueue_event(send_time, send_event)
         
-        sim.log_flow.write("\tin-flight / window size: %d/%d (After)\n" %
+        self.sim.log_flow.write("\tin-flight / window size: %d/%d (After)\n" %
                           (len(self.packets_in_flight), self.window_size))
+
+
+    def finish_flow(self):
+        '''
+        Description:        Marks the flow as finished once all of its data
+                            has been sent: it is no longer running and its 
+                            window is closed.
+        
+        Arguments:          None.
+        
+        Return Values:      None.
+        
+        Shared Variables:   finish_time (WRITE)
+                                - Set to now.
+
+                            window_size, last_RTT, avg_RTT, min_RTT (WRITE)
+                                - Reset.
         
+        Global Variables:   sim.running_flows (WRITE)
+                                - The flow is removed from it.
 
+                            sim.packets_done (WRITE)
+                                - The packets in flight are added to it.
+        
+        Limitations:        Raises ValueError if the flow has already 
+                            finished.
+        
+        Known Bugs:         None.
         
+        Revision History:   2026/10/18: Created from update_flow().
+        '''
+        # Remove it from our list of running flows.
+        self.sim.running_flows.remove(self.flow_name)
+        self.stop_retransmission_timer()
+
+        # The packets still in flight are no longer waited for, so they 
+        #   count towards the progress as well.
+        self.sim.packets_done += len(self.packets_in_flight)
+        self.finish_time = self.sim.network_now()
+        self.window_size = 0
+        self.last_RTT = 0
+        self.avg_RTT = (0, 0)
+        self.min_RTT = 0
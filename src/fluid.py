@@ -0,0 +1,895 @@
+############################################################################
+#
+# Ricky Galliani, Tim Menninger, Rush Joshi, Schaeffer Reed
+# Network Simulator Project
+# CS 143 -- Fall 2015
+#
+# fluid.py
+#
+# This contains the fluid model.  A flow simulated as a fluid sends no
+# packets.  Its data flows along its route at a rate set by its window and
+# round trip time, and the links queue whatever they cannot send.  The rates
+# are worked out at each fluid step and held until the next, so the queues
+# and the data delivered change linearly in between.
+#
+# The steps are not a fixed time apart.  Each one is enqueued for the next
+# time something changes the rates: a flow starting or finishing, a queue
+# emptying or filling its buffer, or a window or round trip changing by
+# FLUID_TOLERANCE of itself.  So a flow whose window has settled moves on in
+# long steps, up to FLUID_MAX_STEP, which bounds how long a change of route
+# or of the packets sharing its links goes unnoticed.
+#
+############################################################################
+
+
+############################################################################
+#                                                                          #
+#                               Imported Modules                           #
+#                                                                          #
+############################################################################
+
+# Import network objects
+import event as e
+
+# Import the constants and the conversion functions
+import constants as ct
+import conversion as cv
+
+
+############################################################################
+#                                                                          #
+#                               Fluid Model Class                          #
+#                                                                          #
+############################################################################
+
+
+class FluidModel:
+
+    def __init__(self, in_sim):
+        '''
+        Description:        Initialize an instance of FluidModel, which
+                            moves the data of the fluid flows of a
+                            Simulation.
+
+        Arguments:          in_sim (Simulation)
+                                - The Simulation whose fluid flows this
+                                moves.
+
+        Shared Variables:   self.sim (WRITE)
+                                - Initialized
+
+                            self.flows (WRITE)
+                                - Initialized
+
+                            self.queues (WRITE)
+                                - Initialized
+
+                            self.growth (WRITE)
+                                - Initialized
+
+                            self.shares (WRITE)
+                                - Initialized
+
+                            self.losses (WRITE)
+                                - Initialized
+
+                            self.last_step (WRITE)
+                                - Initialized
+
+                            self.last_measure (WRITE)
+                                - Initialized
+
+                            self.step_event (WRITE)
+                                - Initialized
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        # The simulation the fluid flows belong to.
+        self.sim = in_sim
+
+        # The IDs of the fluid flows that are running.
+        self.flows = []
+
+        # The fluid of each direction of each link it flows on, keyed by
+        #   (link ID, sender index): the data queued in the buffer of the
+        #   sender (in bytes), how fast that grows (in bytes/ms, negative
+        #   when it drains), the ratio of the rate the fluid leaves to the
+        #   rate it arrives, and the fraction of it dropped.
+        self.queues = {}
+        self.growth = {}
+        self.shares = {}
+        self.losses = {}
+
+        # The time the fluid was last moved on, and the time the rate of the
+        #   packets on the links was last measured, in ticks.
+        self.last_step = 0
+        self.last_measure = 0
+
+        # The event of the next step, while it is in the event queue.
+        self.step_event = None
+
+
+    def add_flow(self, flow):
+        '''
+        Description:        Starts moving the data of a fluid flow.  The
+                            fluid is first moved up to now, so the rates so
+                            far are not changed after the fact.
+
+        Arguments:          flow (Flow)
+                                - The fluid flow that is starting.
+
+        Return Values:      None.
+
+        Shared Variables:   self.flows (WRITE)
+                                - The flow is added.
+
+                            self.step_event (WRITE)
+                                - The next step, enqueued again for the new
+                                rates.
+
+        Global Variables:   sim.event_queue (WRITE)
+                                - The next step is enqueued.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+                            2026/10/18: The next step is worked out from the
+                                        new rates.
+        '''
+        # The rate of the packets on the links is measured from now on.
+        if len(self.flows) == 0:
+            self.last_measure = self.sim.network_now()
+            for link in self.sim.link_list:
+                link.packet_data_sent = [ 0, 0 ]
+
+        self.advance()
+        self.flows.append(flow.ID)
+        self.update_rates()
+        self.schedule_step()
+
+
+    def step(self, unused_list):
+        '''
+        Description:        Moves the fluid on to now, finishes the flows
+                            that have delivered all of their data and works
+                            out the rates until the next step.
+
+        Arguments:          unused_list (List)
+                                - Unused.
+
+        Return Values:      None.
+
+        Shared Variables:   self.flows (WRITE)
+                                - The finished flows are taken out.
+
+                            self.step_event (WRITE)
+                                - The next step, unless there is nothing 
+                                left to move.
+
+        Global Variables:   sim.event_queue (WRITE)
+                                - The next step is enqueued.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+                            2026/10/18: The next step is worked out from the
+                                        new rates.
+        '''
+        self.step_event = None
+        self.advance()
+
+        for flow_ID in list(self.flows):
+            flow = self.sim.flow_list[flow_ID]
+            if flow.fluid_delivered >= flow.num_data_packets:
+                self.flows.remove(flow_ID)
+                flow.finish_flow()
+
+        # With no fluid flows left, the links are only left with packets.
+        if len(self.flows) == 0:
+            self.clear_links()
+            return
+
+        self.update_rates()
+        self.schedule_step()
+
+
+    def schedule_step(self):
+        '''
+        Description:        Enqueues the next step for the time the rates
+                            worked out last stop holding (see 
+                            step_length()), in place of the one already in
+                            the event queue.
+
+        Arguments:          None.
+
+        Return Values:      None.
+
+        Shared Variables:   self.step_event (WRITE)
+                                - The next step.
+
+        Global Variables:   sim.event_queue (WRITE)
+                                - The next step is enqueued, and the one
+                                before it cancelled.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        if self.step_event is not None:
+            self.sim.cancel_event(self.step_event)
+
+        step_ticks = max(cv.ms_to_ticks(self.step_length()), 1)
+        self.step_event = e.Event(self.step, [])
+        self.sim.enqueue_event(self.sim.network_now() + step_ticks,
+                               self.step_event)
+
+
+    def step_length(self):
+        '''
+        Description:        Returns how long the rates worked out last hold:
+                            until the first queue empties or fills its 
+                            buffer, the first flow delivers the last of its
+                            data, or the first window or round trip changes
+                            by FLUID_TOLERANCE of itself, but no longer than
+                            FLUID_MAX_STEP or shorter than FLUID_MIN_STEP.
+
+        Arguments:          None.
+
+        Return Values:      (float)
+                                - The time in milliseconds.
+
+        Shared Variables:   self.queues, self.growth (READ)
+                                - The queues and how fast they change.
+
+        Global Variables:   None.
+
+        Limitations:        The windows and round trips change smoothly, so
+                            the tolerance is measured against how fast they
+                            change now.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        length = ct.FLUID_MAX_STEP
+
+        # The queues run dry or fill up.
+        for (key, growth) in self.growth.items():
+            queue = self.queues.get(key, 0)
+            if growth < 0 and queue > 0:
+                length = min(length, queue / -growth)
+            elif growth > 0:
+                space = self.fluid_space(self.sim.link_list[key[0]], key[1])
+                length = min(length, max(space - queue, 0) / growth)
+
+        for flow_ID in self.flows:
+            flow = self.sim.flow_list[flow_ID]
+            if flow.fluid_path is None:
+                continue
+
+            # The flow delivers the last of its data.
+            (rate, drops) = self.follow_route(flow)
+            if rate > 0:
+                left = flow.num_data_packets - flow.fluid_delivered
+                length = min(length, 
+                             max(left, 0) * ct.PACKET_DATA_SIZE / rate)
+
+            # Its window changes.
+            lost = sum(dropped for (key, dropped) in drops)
+            change = self.window_change(flow, lost / ct.PACKET_DATA_SIZE)
+            if change != 0:
+                length = min(length, ct.FLUID_TOLERANCE * 
+                             flow.window_size / abs(change))
+
+            # Its round trip changes with the queues on its route.
+            rtt_change = sum(self.growth.get(key, 0) / 
+                             self.capacity(self.sim.link_list[key[0]])
+                             for key in flow.fluid_path)
+            if rtt_change != 0:
+                length = min(length, ct.FLUID_TOLERANCE * flow.last_RTT / 
+                             abs(rtt_change))
+
+        return max(length, ct.FLUID_MIN_STEP)
+
+
+    def advance(self):
+        '''
+        Description:        Moves the fluid on from the last step to now at
+                            the rates worked out then: the queues grow or
+                            drain and each flow delivers the data that gets
+                            through, loses the data that is dropped and
+                            opens or closes its window.
+
+        Arguments:          None.
+
+        Return Values:      None.
+
+        Shared Variables:   self.queues (WRITE)
+                                - Moved on to now.
+
+                            self.last_step (WRITE)
+                                - Set to now.
+
+        Global Variables:   sim.packets_done (WRITE)
+                                - The whole packets' worth of data
+                                delivered are added to it.
+
+        Limitations:        Data counts as delivered when it leaves the last
+                            link, without the delay of the links.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+                            2026/10/18: Follows the route with 
+                                        follow_route().
+        '''
+        dt = cv.ticks_to_ms(self.sim.network_now() - self.last_step)
+        self.last_step = self.sim.network_now()
+        if dt <= 0:
+            return
+
+        # Grow or drain the queues, as far as the buffers let them.
+        for key in self.growth:
+            link = self.sim.link_list[key[0]]
+            queue = self.queues.get(key, 0) + self.growth[key] * dt
+            queue = min(max(queue, 0), self.fluid_space(link, key[1]))
+            self.queues[key] = queue
+            link.fluid_load[key[1]] = queue
+
+        for flow_ID in self.flows:
+            flow = self.sim.flow_list[flow_ID]
+            if flow.fluid_path is None:
+                continue
+
+            # Follow the fluid down the route to find the rate that gets
+            #   through, and count what each link drops.
+            (rate, drops) = self.follow_route(flow)
+            lost = 0
+            for (key, dropped) in drops:
+                self.sim.link_list[key[0]].num_packets_lost += \
+                                    dropped * dt / ct.PACKET_DATA_SIZE
+                lost += dropped
+
+            # Deliver the data, in packets' worth.  Only whole packets count
+            #   as done, and none past the end of the flow.
+            delivered = rate * dt / ct.PACKET_DATA_SIZE
+            done_before = int(min(flow.fluid_delivered,
+                                  flow.num_data_packets))
+            flow.fluid_delivered += delivered
+            done = int(min(flow.fluid_delivered, flow.num_data_packets))
+            self.sim.packets_done += done - done_before
+            flow.to_complete = done + 1
+            flow.acked_packets += delivered
+
+            # Keep the totals for the summary.
+            flow.packets_sent += flow.fluid_rate * dt / ct.PACKET_DATA_SIZE
+            flow.packets_lost += lost * dt / ct.PACKET_DATA_SIZE
+            flow.delay_sum += flow.last_RTT * delivered
+            flow.delay_count += delivered
+
+            self.update_window(flow, lost / ct.PACKET_DATA_SIZE, dt)
+
+
+    def follow_route(self, flow):
+        '''
+        Description:        Follows the fluid of a flow down its route at
+                            the rates worked out last, dropping what each
+                            link drops and passing on what it lets through.
+
+        Arguments:          flow (Flow)
+                                - The fluid flow, which must have a route.
+
+        Return Values:      (float)
+                                - The rate that gets to the destination (in
+                                bytes/ms).
+
+                            (list)
+                                - The (link ID, sender index) of each link 
+                                on the route with the rate it drops (in 
+                                bytes/ms).
+
+        Shared Variables:   self.shares, self.losses (READ)
+                                - The share each link lets through and 
+                                drops.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created from advance().
+        '''
+        rate = flow.fluid_rate
+        drops = []
+        for key in flow.fluid_path:
+            drops.append((key, rate * self.losses.get(key, 0)))
+            rate *= self.shares.get(key, 1)
+
+        return rate, drops
+
+
+    def window_change(self, flow, loss_rate):
+        '''
+        Description:        Returns how fast the window of a fluid flow 
+                            changes.  TCP Reno grows the window by one 
+                            packet a round trip (doubling it in slow start)
+                            and halves it for every packet lost, and FAST 
+                            TCP moves it towards the window that keeps alpha
+                            packets queued, one update period at a time.
+
+        Arguments:          flow (Flow)
+                                - The fluid flow.
+
+                            loss_rate (float)
+                                - The packets' worth of its data dropped a
+                                millisecond.
+
+        Return Values:      (float)
+                                - The change in packets a millisecond, 0 
+                                without a round trip time to pace it by.
+
+        Shared Variables:   None.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created from update_window().
+        '''
+        window = flow.window_size
+        rtt = flow.last_RTT
+
+        # Until a round trip has been worked out for the flow (see 
+        #   update_rates()), there is nothing to pace the window by.
+        if rtt <= 0:
+            return 0
+
+        if flow.congestion_alg == ct.FLOW_FAST_TCP:
+            return (window * flow.min_RTT / rtt + ct.ALPHA_VALUE -
+                    window) / ct.FAST_TCP_PERIOD
+
+        if flow.state == 0:
+            change = window / rtt
+        else:
+            change = 1 / rtt
+        return change - window / 2 * loss_rate
+
+
+    def update_window(self, flow, loss_rate, dt):
+        '''
+        Description:        Opens or closes the window of a fluid flow over
+                            some time, at the rate window_change() gives.
+                            TCP Reno leaves slow start first if the flow 
+                            has lost data or reached its threshold.
+
+        Arguments:          flow (Flow)
+                                - The fluid flow.
+
+                            loss_rate (float)
+                                - The packets' worth of its data dropped a
+                                millisecond.
+
+                            dt (float)
+                                - The time in milliseconds.
+
+        Return Values:      None.
+
+        Shared Variables:   None.
+
+        Global Variables:   flow.window_size (WRITE)
+                                - Opened or closed.
+
+                            flow.state, flow.sst (WRITE)
+                                - TCP Reno leaves slow start on the first
+                                loss.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+                            2026/10/18: Leaves the window alone without a
+                                        round trip time.
+                            2026/10/18: The change is worked out by 
+                                        window_change().
+        '''
+        window = flow.window_size
+
+        # Slow start ends with the first loss, or at the threshold.
+        if flow.congestion_alg != ct.FLOW_FAST_TCP and flow.state == 0 and \
+           flow.last_RTT > 0 and (loss_rate > 0 or window >= flow.sst):
+            flow.state = 1
+            flow.sst = window / 2
+
+        change = self.window_change(flow, loss_rate)
+        flow.window_size = max(window + change * dt, ct.INITIAL_WINDOW_SIZE)
+
+
+    def update_rates(self):
+        '''
+        Description:        Works out the rates until the next step.  Each
+                            fluid flow sends a window a round trip, the
+                            round trip being the delays of the links on its
+                            route both ways and the time its data waits in
+                            their queues.  The fluid arriving at each link
+                            shares the rate the packets leave with the other
+                            fluid on its channel.  It queues what cannot
+                            be sent, and drops what does not fit in the
+                            buffer.
+
+        Arguments:          None.
+
+        Return Values:      None.
+
+        Shared Variables:   self.growth, self.shares, self.losses (WRITE)
+                                - Worked out again for every direction of a
+                                link with fluid on it.
+
+                            self.last_measure (WRITE)
+                                - Set to now.
+
+        Global Variables:   flow.fluid_path, flow.fluid_rate,
+                            flow.last_RTT, flow.min_RTT (WRITE)
+                                - Worked out again for every fluid flow.
+
+                            link.fluid_rate, link.fluid_on_link (WRITE)
+                                - Set for every link with fluid on it.
+
+        Limitations:        A route that loops back on a direction of a 
+                            link it already took would need more passes to
+                            settle, but routes do not loop.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+                            2026/10/18: The fluid reaching a link is what 
+                                        the links before it let through 
+                                        now, not at the last step.
+        '''
+        # Find the route of each fluid flow and the rate it sends.
+        keys = set(self.queues)
+        longest = 0
+        for flow_ID in self.flows:
+            flow = self.sim.flow_list[flow_ID]
+            flow.fluid_path = self.find_path(flow)
+            if flow.fluid_path is None:
+                flow.fluid_rate = 0
+                continue
+
+            base_RTT = 0
+            queueing = 0
+            for key in flow.fluid_path:
+                link = self.sim.link_list[key[0]]
+                capacity = self.capacity(link)
+                base_RTT += 2 * link.delay + ct.PACKET_DATA_SIZE / capacity
+                queueing += self.queues.get(key, 0) / capacity
+            flow.min_RTT = base_RTT
+            flow.last_RTT = base_RTT + queueing
+            flow.fluid_rate = flow.window_size * ct.PACKET_DATA_SIZE / \
+                              flow.last_RTT
+            keys.update(flow.fluid_path)
+            longest = max(longest, len(flow.fluid_path))
+
+        # Measure the rate the packets leave the fluid on each channel.  The
+        #   packets go first, so bring the link up to now before changing 
+        #   the rate it leaves them.
+        interval = cv.ticks_to_ms(self.sim.network_now() - 
+                                  self.last_measure)
+        self.last_measure = self.sim.network_now()
+        link_IDs = sorted(set(key[0] for key in keys))
+        available = {}
+        for link_ID in link_IDs:
+            link = self.sim.link_list[link_ID]
+            link.catch_up()
+            packet_rates = self.measure_packet_rates(link, interval)
+            for channel in set(link.channels):
+                available[(link_ID, channel)] = max(
+                        self.capacity(link) - packet_rates[channel], 0)
+
+        # Send the fluid of each flow down its route, and share out the 
+        #   rate of each channel with fluid on it.  The fluid arriving at a
+        #   link is what the links before it let through, so this is done 
+        #   once for every link of the longest route, each time with the 
+        #   shares worked out the time before.  Then the fluid leaving each
+        #   link is what arrives at the next one, and no more leaves a 
+        #   channel than it can send.
+        for unused in range(max(longest, 1)):
+            arrivals = {key : 0 for key in keys}
+            for flow_ID in self.flows:
+                flow = self.sim.flow_list[flow_ID]
+                if flow.fluid_path is None:
+                    continue
+                rate = flow.fluid_rate
+                for key in flow.fluid_path:
+                    arrivals[key] += rate
+                    rate *= self.shares.get(key, 1)
+
+            self.growth = {}
+            departures = {}
+            for link_ID in link_IDs:
+                link = self.sim.link_list[link_ID]
+                departures[link_ID] = [ 0, 0 ]
+                for channel in set(link.channels):
+                    senders = [ sender for sender in (0, 1)
+                                if link.channels[sender] == channel and
+                                   (link_ID, sender) in arrivals ]
+                    total = sum(arrivals[(link_ID, sender)]
+                                for sender in senders)
+                    for sender in senders:
+                        key = (link_ID, sender)
+                        departures[link_ID][channel] += self.share_rate(
+                            link, key, arrivals[key],
+                            available[(link_ID, channel)], total)
+
+        for link_ID in link_IDs:
+            link = self.sim.link_list[link_ID]
+            for channel in set(link.channels):
+                link.fluid_rate[channel] = cv.MB_to_bits(
+                        cv.bytes_to_MB(departures[link_ID][channel])) / 1000
+            link.fluid_on_link = cv.bytes_to_Mb(sum(departures[link_ID]) *
+                                                link.delay)
+
+        # The packets on every other link are measured from now on too.
+        for link in self.sim.link_list:
+            link.packet_data_sent = [ 0, 0 ]
+
+
+    def share_rate(self, link, key, arrival, available, total):
+        '''
+        Description:        Works out how the fluid arriving at one
+                            direction of a link leaves it.  The direction
+                            gets the rate left by the packets on its channel
+                            in proportion to the fluid arriving there.  If
+                            the fluid arrives faster, or there is a queue to
+                            drain, it leaves at that rate and the queue
+                            makes up the difference, unless the buffer is
+                            full and the difference is dropped instead.
+
+        Arguments:          link (Link)
+                                - The link.
+
+                            key ((int, int))
+                                - The link ID and sender index.
+
+                            arrival (float)
+                                - The rate the fluid arrives (in bytes/ms).
+
+                            available (float)
+                                - The rate of the channel left by the
+                                packets (in bytes/ms).
+
+                            total (float)
+                                - The rate of all of the fluid arriving on
+                                the channel (in bytes/ms).
+
+        Return Values:      (float)
+                                - The rate the fluid leaves (in bytes/ms).
+
+        Shared Variables:   self.growth, self.shares, self.losses (WRITE)
+                                - Set for the direction.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+                            2026/10/18: A queue drains at the full rate 
+                                        until it is empty.
+        '''
+        if total > 0:
+            rate = available * arrival / total
+        else:
+            rate = available
+
+        queue = self.queues.get(key, 0)
+        if queue > 0 or arrival > rate:
+            departure = rate
+        else:
+            departure = arrival
+
+        growth = arrival - departure
+        dropped = 0
+        if growth > 0 and queue >= self.fluid_space(link, key[1]):
+            dropped = growth
+            growth = 0
+
+        self.growth[key] = growth
+        if arrival > 0:
+            self.shares[key] = departure / arrival
+            self.losses[key] = dropped / arrival
+        else:
+            self.shares[key] = 1
+            self.losses[key] = 0
+
+        return departure
+
+
+    def find_path(self, flow):
+        '''
+        Description:        Finds the route of a fluid flow from the routing
+                            tables of the routers on the way.
+
+        Arguments:          flow (Flow)
+                                - The fluid flow.
+
+        Return Values:      (list)
+                                - The (link ID, sender index) of each link
+                                on the route, in order, or None if there is
+                                no route yet.
+
+        Shared Variables:   None.
+
+        Global Variables:   sim.endpoint_list, sim.link_list (READ)
+                                - Used to follow the route.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        path = []
+        ep = self.sim.endpoint_list[flow.src_ID]
+
+        # A route visits every endpoint at most once.
+        for hop in range(len(self.sim.endpoint_list)):
+            if ep.ID == flow.dest_ID:
+                return path
+
+            # Hosts only send their own data, and routers send it on the
+            #   link in their routing table.
+            if ep.type == ct.TYPE_HOST:
+                if ep.ID != flow.src_ID:
+                    return None
+                link_ID = ep.link
+            elif flow.dest_ID in ep.routing_table:
+                link_ID = ep.routing_table[flow.dest_ID]
+            else:
+                return None
+
+            link = self.sim.link_list[link_ID]
+            path.append((link_ID, link.end_points[ep.ID]))
+            ep = self.sim.endpoint_list[link.get_other_ep(ep.ID)]
+
+        return None
+
+
+    def measure_packet_rates(self, link, interval):
+        '''
+        Description:        Returns the rate the packets were put on each
+                            channel of a link since they were last 
+                            measured.
+
+        Arguments:          link (Link)
+                                - The link.
+
+                            interval (float)
+                                - The time since they were last measured (in
+                                ms).
+
+        Return Values:      ([float, float])
+                                - The rate of each channel (in bytes/ms).
+
+        Shared Variables:   None.
+
+        Global Variables:   link.packet_data_sent (READ)
+                                - The data put on each channel.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        if interval <= 0:
+            return [ 0, 0 ]
+
+        rates = [ data / interval for data in link.packet_data_sent ]
+        if link.duplex != ct.DUPLEX_FULL:
+            rates = [ sum(rates), 0 ]
+
+        return rates
+
+
+    def capacity(self, link):
+        '''
+        Description:        Returns the rate of a link in bytes/ms.
+
+        Arguments:          link (Link)
+                                - The link.
+
+        Return Values:      (float)
+                                - The rate.
+
+        Shared Variables:   None.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        return cv.MB_to_bytes(cv.Mb_to_MB(link.rate)) / 1000
+
+
+    def fluid_space(self, link, sender):
+        '''
+        Description:        Returns the space in a buffer of a link that is
+                            not taken up by packets.
+
+        Arguments:          link (Link)
+                                - The link.
+
+                            sender (int)
+                                - The index of the buffer.
+
+        Return Values:      (float)
+                                - The space in bytes.
+
+        Shared Variables:   None.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        return max(link.buffer_bytes - link.buffer_load[sender], 0)
+
+
+    def clear_links(self):
+        '''
+        Description:        Takes the fluid off of the links once there are
+                            no fluid flows left.
+
+        Arguments:          None.
+
+        Return Values:      None.
+
+        Shared Variables:   self.queues, self.growth, self.shares,
+                            self.losses (WRITE)
+                                - Cleared.
+
+        Global Variables:   link.fluid_load, link.fluid_rate,
+                            link.fluid_on_link (WRITE)
+                                - Reset for every link that had fluid.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        for link_ID in set(key[0] for key in
+                           list(self.queues) + list(self.growth)):
+            link = self.sim.link_list[link_ID]
+            link.catch_up()
+            link.fluid_load = [ 0, 0 ]
+            link.fluid_rate = [ 0, 0 ]
+            link.fluid_on_link = 0
+
+        self.queues = {}
+        self.growth = {}
+        self.shares = {}
+        self.losses = {}
@@ -35,9 +35,6 @@ import conversion as cv
 # Import utility functions
 import utility as u
 
-# Import functions to carry out the simulation
-sim  = sys.modules['__main__']
-
 # Import the config parser
 import config_parser as cp
 
@@ -56,18 +53,32 @@ import heapq
 
 class Host:
 
-    def __init__(self, in_host_name):
+    def __init__(self, in_sim, in_ID, in_host_name):
         '''
         Description:        Initialize an instance of Host by intitializing 
                             its attributes.
 
-        Arguments:          in_host_name (string)
+        Arguments:          in_sim (Simulation)
+                                - The Simulation that this Host instance is a 
+                                part of.
+
+                            in_ID (integer)
+                                - The endpoint ID of this Host, its index in
+                                sim.endpoint_list.
+
+                            in_host_name (string)
                                 - A string indicating the name of this 
                                 particular Host instance (i.e., "H1").
 
-        Shared Variables:   self.type (WRITE)
+        Shared Variables:   self.sim (WRITE)
                                 - Initialized 
 
+                            self.type (WRITE)
+                                - Initialized 
+
+                            self.ID (WRITE) 
+                                - Initialized
+
                             self.host_name (WRITE) 
                                 - Initialized
 
@@ -82,14 +93,20 @@ class Host:
 
         Revision History:   10/06/15: Created
         '''
+        # The simulation this Host belongs to.
+        self.sim = in_sim
+
         # Store the type so this Host instance can be easily identified as a 
         # Host.
         self.type = ct.TYPE_HOST
         
+        # The endpoint ID of the Host, which others refer to it by.
+        self.ID = in_ID
+
         # Name of the Host, each host name is unique string (i.e., "H1")
         self.host_name = in_host_name
         
-        # The link_name representing the Link to this Host
+        # The ID of the Link to this Host
         self.link = None
 
         # Number of Packets this Host has sent in a record interval
@@ -105,12 +122,12 @@ class Host:
         self.ack_received = 0
         
         
-    def add_link(self, link_name):
+    def add_link(self, link_ID):
         '''
         Description:        This sets the Link the Host is connected to.
         
-        Arguments:          link_name (string) 
-                                - The name of the Link that is associated
+        Arguments:          link_ID (integer) 
+                                - The ID of the Link that is associated
                                 with this Host.
         
         Return Values:      None.
@@ -125,7 +142,7 @@ class Host:
         
         Revision History:   2015/10/29: Created
         '''
-        self.link = link_name
+        self.link = link_ID
 
 
     def send_packet(self, arg_list):
@@ -157,101 +174,93 @@ class Host:
         '''
         # The argument list is just the packet.
         [packet] = arg_list
-        flow = sim.flows[packet.flow]
+        flow = self.sim.flow_list[packet.flow]
 
         # Log the send_packet() event to ct.HOST_LOG_FILE
         self.log_send_packet(packet)
         
         # Get the link that we are going to send the packet on.
-        link = sim.links[self.link]
+        link = self.sim.link_list[self.link]
         
         # Give the packet to the link to handle.  Here, it will either be
         #   enqueued on a buffer or transmitted.
-        link.put_packet_on_buffer(self.host_name, packet)
+        link.put_packet_on_buffer(self.ID, packet)
 
-        # Create an event that will search for acknowledgement after some 
-        #   amount of time.  If ack was not received, it will resend the 
-        #   packets.  This only applies to data packets.
-        last_flow_RTT = flow.last_RTT
-        if last_flow_RTT == 0:
-            last_flow_RTT = flow.assumed_RTT
-        
+        # Make sure the flow's retransmission timer is running so that, if 
+        #   no ack is received in time, the packets are resent.  This only 
+        #   applies to data packets.
         if packet.type == ct.PACKET_DATA:
-            tmout_time = sim.network_now() + \
-                         ct.ACK_TIMEOUT_FACTOR * last_flow_RTT
-            tmout_event = e.Event(self.host_name, 'check_ack_timeout', 
-                                  [packet])
-            sim.enqueue_event(tmout_time, tmout_event)
+            flow.start_retransmission_timer()
 
             self.pkts_sent += 1
+            flow.packets_sent += 1
 
         elif packet.type == ct.PACKET_ACK:
 
             self.ack_sent += 1
 
         
-    def check_ack_timeout(self, list_packet):
+    def check_ack_timeout(self, list_flow):
         '''
-        Description:        This is called after some amount of time to check 
-                            if we have been waiting "too long" for the argued 
-                            Packet to be acknowledged.  If the Packet has 
-                            reached its timeout, then all of the Packet in 
-                            flight are resent and it is assumed that the 
-                            Packet is lost.
-        
-        Arguments:          list_packet ([Packet]) 
-                                - A list containing the packet we are 
-                                searching acknowledgement for.
+        Description:        This is called when the retransmission timer of a 
+                            flow expires, meaning we have been waiting "too 
+                            long" for the oldest Packet in flight to be 
+                            acknowledged.  It is assumed that the Packet is 
+                            lost, so all of the Packets in flight are resent, 
+                            the timeout is backed off and the timer is 
+                            restarted.
+        
+        Arguments:          list_flow ([integer]) 
+                                - A list containing the ID of the flow whose 
+                                timer expired.
         
         Return Values:      None.
         
         Shared Variables:   None.
         
-        Global Variables:   sim.flows (READ) 
-                                - The flow the packet is a part of is read 
-                                from this dictionary.
+        Global Variables:   sim.flow_list (READ) 
+                                - The flow is read from this list.
         
         Limitations:        None.
         
         Known Bugs:         None.
         
         Revision History:   2015/11/16: Created
+                            2026/10/18: One timer per flow instead of one per 
+                                packet.
         '''
         # Unpack the argument list.
-        [packet] = list_packet
-        flow = sim.flows[packet.flow]
+        [flow_ID] = list_flow
+        flow = self.sim.flow_list[flow_ID]
+
+        # This timer has now fired, so it is no longer running.
+        flow.rto_timer = None
 
         # If window size is 0, this means the flow is done so this is just 
-        #   an irrelevant packet -> ignore it.
-        if flow.window_size == 0:
-            return
-        
-        # Check if acknowledgement has been received for this packet.  If so,
-        #   disregard, we are done here.
-        if packet.data < flow.to_complete:
+        #   an irrelevant timeout -> ignore it.  The same goes if everything
+        #   sent has already been acknowledged.
+        if flow.window_size == 0 or len(flow.packets_in_flight) == 0:
             return
 
-        # If not, we want to first resend all packets in flight,
-        #   but only do this if this is one of the packets in flight.
-        #   Otherwise, we will end up thinking we lost way more packets
-        #   than we actually did.
-        if len(flow.packets_in_flight) > 0 and \
-           packet.ID >= (flow.packets_in_flight[0][1].ID):
-            # Time out will cause congestion control to revert to slow-start 
-            #   phase, so we reset the window size to initial size of 1 packet, 
-            #   change state to slow-start, and set sst to window/2
-
-            if flow.congestion_alg == ct.FLOW_TCP_RENO and \
-                sim.network_now() >= (flow.last_update + ct.RENO_TIMEOUT_TIME):
-                flow.sst = flow.window_size/2
-                flow.window_size = 1
-                flow.state = 0
-                flow.last_update = sim.network_now()
-
-            # Resend all of the packets in flight because if one was lost,
-            #   then it is presumable that the rest of the ones in flight
-            #   were lost.
-            flow.resend_inflight_packets()
+        # Time out will cause congestion control to revert to slow-start 
+        #   phase, so we reset the window size to initial size of 1 packet, 
+        #   change state to slow-start, and set sst to window/2
+        if flow.congestion_alg == ct.FLOW_TCP_RENO and \
+            self.sim.network_now() >= \
+                (flow.last_update + cv.ms_to_ticks(ct.RENO_TIMEOUT_TIME)):
+            flow.sst = flow.window_size/2
+            flow.window_size = 1
+            flow.state = 0
+            flow.last_update = self.sim.network_now()
+
+        # Back off the timeout in case we simply aren't waiting long enough 
+        #   for ack, then restart the timer for the resent packets.
+        flow.rto = min(flow.rto * ct.RTO_BACKOFF, ct.MAX_RTO)
+        flow.start_retransmission_timer()
+
+        # Resend all of the packets in flight because if one was lost, then 
+        #   it is presumable that the rest of the ones in flight were lost.
+        flow.resend_inflight_packets()
 
         # If we are using FAST TCP, and a packet is timed out, we need to dock
         #   the average RTT so that we don't increase the window size as
@@ -262,14 +271,6 @@ class Host:
             flow.avg_RTT = (flow.avg_RTT[0] * \
                             (1 + 1 / (ct.FAST_TCP_TIMEOUT_FACTOR * \
                             flow.window_size)), flow.avg_RTT[1])
-        
-        # Next, we want to check if the time we waited for timeout is
-        #   sufficient.  If we have not received any acknowledgements yet, it
-        #   is possible that we simply aren't waiting long enough for ack.
-        #   Therefore, if there have been no acks received at all, increase
-        #   the waiting time.
-        if flow.to_complete == 1:
-            flow.assumed_RTT *= ct.ACK_TIMEOUT_FACTOR
  
 
     def receive_packet(self, arg_list):
@@ -278,18 +279,18 @@ class Host:
                             accordingly by enqueuing an event.  This event may 
                             be sending an ack Packet or otherwise.
         
-        Arguments:          argument_list ([string, string]) 
+        Arguments:          argument_list ([Packet]) 
                                 - A list of arguments that is unpacked by the 
                                 function.  This implementation is to facilitate 
                                 the Event class.  The list should contain the 
-                                flow name and the packet name.
+                                Packet handed off by the Link.
         
         Return Values:      None.
         
         Shared Variables:   None.
         
-        Global Variables:   sim.packets (READ) - This gets the Packet instance 
-                            from the dictionary using the argued key.
+        Global Variables:   sim.packets (WRITE) - The Packet is released 
+                            from it.
         
         Limitations:        None.
         
@@ -301,11 +302,18 @@ class Host:
                                         attribute.
                             2015/11/14: Responds according to packet type and 
                                         ID.
+                            2026/10/18: Releases the packet.
+                            2026/10/18: Takes the flow ID.
+                            2026/10/18: Takes the Packet itself.
         '''
         # Unpack the argument list.
-        [flow_name, packet_ID] = arg_list
-        packet = sim.packets[(flow_name, packet_ID)]
-        flow = sim.flows[flow_name]
+        [packet] = arg_list
+        flow_ID = packet.flow
+        flow = self.sim.flow_list[flow_ID]
+
+        # Whatever the packet is, it has reached the end of its trip, so it 
+        #   is taken out of the network.
+        self.sim.release_packet(packet)
 
         # If window size is 0, this means the flow is done so this is just 
         #   an irrelevant packet -> ignore it.
@@ -330,7 +338,7 @@ class Host:
                 
             # This is what we want, create an ack packet and send it.
             ack_pkt = p.Packet(-1 * packet.ID, 
-                               flow_name, self.host_name, packet.src, 
+                               flow_ID, self.ID, packet.src, 
                                ct.PACKET_ACK)
                                
             # Set the data of the ack to be what we are expecting. The src 
@@ -340,7 +348,7 @@ class Host:
             ack_pkt.time = packet.time
             
             # Add the packet to our dictionary of packets.
-            sim.packets[(flow_name, ack_pkt.ID)] = ack_pkt
+            self.sim.add_packet(ack_pkt)
             
             # Send the packet!
             self.send_packet([ack_pkt])
@@ -378,16 +386,24 @@ class Host:
                 for i in range(packet.data - flow.to_complete):
                     flow.to_complete += 1
                     flow.acked_packets += 1
+                    self.sim.packets_done += 1
                     heapq.heappop(flow.packets_in_flight)
                 assert (packet.data == flow.to_complete)
                 
                 # Compute the most recent RTT, which can be used for congestion
                 #   control
-                flow.last_RTT = sim.network_now() - packet.time
-                flow.assumed_RTT = flow.last_RTT
+                flow.last_RTT = cv.ticks_to_ms(self.sim.network_now() - 
+                                               packet.time)
+
+                # New data was acknowledged, so update the retransmission 
+                #   timeout and restart the timer for what is still in flight.
+                flow.update_rto(flow.last_RTT)
+                flow.restart_retransmission_timer()
 
                 # Add this last_RTT to our cumulative for avg
                 flow.avg_RTT = (flow.avg_RTT[0] + flow.last_RTT, flow.avg_RTT[1] + 1)
+                flow.delay_sum += flow.last_RTT
+                flow.delay_count += 1
 
                 # If the last computed RTT is less than min, update min
                 if flow.min_RTT == 0:
@@ -422,13 +438,14 @@ class Host:
                 # If at least three duplicate acks have been received, then set 
                 #   window size to w/2, set sst to w/2, and retransmit
                 if flow.congestion_alg == ct.FLOW_TCP_RENO and \
-                    sim.network_now() >= (flow.last_update + 500):
+                    self.sim.network_now() >= \
+                                (flow.last_update + cv.ms_to_ticks(500)):
                     if num_dups >= ct.TCP_RENO_MAX_DUPS:
                         flow.sst = flow.window_size/2
                         flow.window_size = flow.window_size/2
                         num_dups = 0
                         flow.num_dup_acks = (packet.ID, 0)
-                        flow.last_update = sim.network_now()
+                        flow.last_update = self.sim.network_now()
             # else the packet has already been received
         # else the packet is a routing packet and can be ignored.
         
@@ -462,20 +479,24 @@ class Host:
         Revision History:   2015/11/28: Created
         '''
         if packet.type == ct.PACKET_DATA:
-            sim.log_host.write("[%.5f]: Sending data packet from %s to %s.\n" % 
-                            (sim.network_now(), self.host_name, packet.dest))
-            sim.log_host.write("\tPacket ID: %d\n" % packet.ID)
+            self.sim.log_host.write(
+                            "[%.5f]: Sending data packet from %s to %s.\n" % 
+                            (self.sim.network_now_ms(), self.host_name, 
+                             self.sim.endpoint_names[packet.dest]))
+            self.sim.log_host.write("\tPacket ID: %d\n" % packet.ID)
             # Data of Packet is just its index within the Flow
-            sim.log_host.write("\tData: %d\n" % packet.data)
+            self.sim.log_host.write("\tData: %d\n" % packet.data)
 
         elif packet.type == ct.PACKET_ACK: # it's an ack Packet
-            sim.log_host.write("[%.5f]: Sending ack packet from %s to %s.\n" % 
-                              (sim.network_now(), self.host_name, packet.dest))
-            sim.log_host.write("\tPacket ID: %d\n" % packet.ID)
+            self.sim.log_host.write(
+                            "[%.5f]: Sending ack packet from %s to %s.\n" % 
+                            (self.sim.network_now_ms(), self.host_name, 
+                             self.sim.endpoint_names[packet.dest]))
+            self.sim.log_host.write("\tPacket ID: %d\n" % packet.ID)
             # Data of ack Packet should correspond with data of packet it is 
             # acknowleding, unless a packet is lost.  In any event, it's just
             # an integer
-            sim.log_host.write("\tData: %d\n" % packet.data)
+            self.sim.log_host.write("\tData: %d\n" % packet.data)
 
         else: # It's a routing packet
             # Not printing the routing tables received by hosts.
@@ -510,26 +531,28 @@ class Host:
         Revision History:   2015/11/28: Created
         '''
         # Retrieve the Flow that this Packet belongs to
-        flow = sim.flows[packet.flow]
+        flow = self.sim.flow_list[packet.flow]
         if packet.type == ct.PACKET_DATA:
             rec_msg = "[%.5f]: Receiving data packet at %s sent from %s.\n" \
-                      % (sim.network_now(), self.host_name, packet.src)
-            sim.log_host.write(rec_msg)
-            sim.log_host.write("\tPacket ID: %d\n" % packet.ID)
+                      % (self.sim.network_now_ms(), self.host_name, 
+                         self.sim.endpoint_names[packet.src])
+            self.sim.log_host.write(rec_msg)
+            self.sim.log_host.write("\tPacket ID: %d\n" % packet.ID)
             # Data of Packet is just its index within the Flow
-            sim.log_host.write("\tData: %d\n" % packet.data)
-            sim.log_host.write("\tExpected Data: %d\n" % flow.expecting)
+            self.sim.log_host.write("\tData: %d\n" % packet.data)
+            self.sim.log_host.write("\tExpected Data: %d\n" % flow.expecting)
 
         elif packet.type == ct.PACKET_ACK: # it's an ack Packet
             rec_msg = "[%.5f]: Receiving ack packet at %s sent from %s.\n" \
-                % (sim.network_now(), str(self.host_name), str(packet.src))
-            sim.log_host.write(rec_msg)
-            sim.log_host.write("\tPacket ID: %d\n" % packet.ID)
+                % (self.sim.network_now_ms(), str(self.host_name), 
+                   str(self.sim.endpoint_names[packet.src]))
+            self.sim.log_host.write(rec_msg)
+            self.sim.log_host.write("\tPacket ID: %d\n" % packet.ID)
             # Data of ack Packet should correspond with data of packet it is 
             # acknowleding, unless a packet is lost.  In any event, it's just
             # an integer
-            sim.log_host.write("\tData: %d\n" % packet.data)
-            sim.log_host.write("\tTo Complete: %d\n" % flow.to_complete)
+            self.sim.log_host.write("\tData: %d\n" % packet.data)
+            self.sim.log_host.write("\tTo Complete: %d\n" % flow.to_complete)
 
         else: 
             # Not printing the routing tables received by hosts.
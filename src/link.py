@@ -35,19 +35,12 @@ import conversion as cv
 # Import utility functions
 import utility as u
 
-import status as st
-
-# Import functions to carry out the simulation
-sim  = sys.modules['__main__']
-
 # Import the config parser
 import config_parser as cp
 
-# Import the queue Python package for the link buffers which are FIFO
-import queue
-
-# Import heapq library so we can use it for our events.
-import heapq 
+# Import collections for the deques the link buffers, which are FIFO, are 
+#   kept in.
+import collections
 
 
 ############################################################################
@@ -59,13 +52,21 @@ import heapq
 
 class Link:
 
-    def __init__(self, in_link_name, in_rate, in_delay, in_buffer_size, 
-                 in_endpoints):
+    def __init__(self, in_sim, in_ID, in_link_name, in_rate, in_delay, 
+                 in_buffer_size, in_endpoints, in_duplex=ct.DEFAULT_DUPLEX):
         '''
         Description:        Initialize an instance of Link by intitializing 
                             its attributes.
 
-        Arguments:          in_link_name (string)
+        Arguments:          in_sim (Simulation)
+                                - The Simulation that this Link instance is a 
+                                part of.
+
+                            in_ID (integer)
+                                - The ID of this Link, its index in 
+                                sim.link_list.
+
+                            in_link_name (string)
                                 - A string indicating the name of this 
                                 particular Link instance (i.e., "L1").
 
@@ -87,9 +88,20 @@ class Link:
                                 names (either host names and/or link names) of 
                                 the endpoints of this Link object.
 
-        Shared Variables:   self.type (WRITE)
+                            in_duplex (string)
+                                - ct.DUPLEX_HALF if the two directions share 
+                                the Link, or ct.DUPLEX_FULL if each direction
+                                has its own.
+
+        Shared Variables:   self.sim (WRITE)
+                                - Initialized
+
+                            self.type (WRITE)
                                 - Initialized
         
+                            self.ID (WRITE)
+                                - Initialized
+
                             self.link_name (WRITE)
                                 - Initialized
         
@@ -102,14 +114,26 @@ class Link:
                             self.buffer_size (WRITE)
                                 - Initialized
 
+                            self.duplex (WRITE)
+                                - Initialized
+
+                            self.channels (WRITE)         (not init argument)
+                                - Initialized
+
                             self.delay (WRITE)
                                 - Initialized
 
+                            self.delay_ticks (WRITE)      (not init argument)
+                                - Initialized
+
                             self.end_points (WRITE)       (not init argument)
                                 - Initialized
         
                             self.ep_names (WRITE)         (not init argument)
                                 - Initialized
+
+                            self.ep_IDs (WRITE)           (not init argument)
+                                - Initialized
         
                             self.buffers (WRITE)          (not init argument)
                                 - Initialized
@@ -123,7 +147,35 @@ class Link:
                             self.data_on_link (WRITE)     (not init argument)
                                 - Initialized
         
-                            self.in_transmission (WRITE)  (not init argument)
+                            self.state (WRITE)            (not init argument)
+                                - Initialized 
+        
+                            self.transmit_end (WRITE)     (not init argument)
+                                - Initialized 
+        
+                            self.wakeup_queued (WRITE)    (not init argument)
+                                - Initialized 
+
+                            self.fluid_load (WRITE)       (not init argument)
+                                - Initialized 
+
+                            self.fluid_rate (WRITE)       (not init argument)
+                                - Initialized 
+
+                            self.fluid_on_link (WRITE)    (not init argument)
+                                - Initialized 
+
+                            self.packet_data_sent (WRITE) (not init argument)
+                                - Initialized 
+
+                            self.buffer_bytes (WRITE)     (not init argument)
+                                - Initialized 
+
+                            self.packet_Mb (WRITE)        (not init argument)
+                                - Initialized 
+
+                            self.transmission_times (WRITE)
+                                                          (not init argument)
                                 - Initialized 
         
                             self.num_packets_lost (WRITE) (not init argument)
@@ -131,15 +183,29 @@ class Link:
 
         Global Variables:   None.
 
-        Limitations:        None.
+        Limitations:        The endpoints must already be in sim.endpoints.
 
         Known Bugs:         None.
 
         Revision History:   10/20/15: Created
+                            2026/10/18: The buffers are deques.
+                            2026/10/18: The link is a state machine.
+                            2026/10/18: Can be full-duplex.
+                            2026/10/18: Carries fluid flows too.
+                            2026/10/18: Precomputes the costs of packets.
+                            2026/10/18: Times are in ticks.
+                            2026/10/18: Sets the transmission times with 
+                                        set_rate().
         '''
+        # The simulation this Link belongs to.
+        self.sim = in_sim
+
         # Store the type so it can be easily identified as a router.
         self.type = ct.TYPE_LINK
         
+        # The ID of the Link, which others refer to it by.
+        self.ID = in_ID
+
         # Name of the Link, each name is a unique string (i.e. "L1")
         self.link_name = in_link_name
         
@@ -150,22 +216,39 @@ class Link:
         # How fast the Router can send data (in Mb/sec) 
         self.rate = in_rate
 
-        # How much data can be stored in the buffer (in KB)
+        # How much data can be stored in the buffer (in KB, and in bytes)
         self.buffer_size = in_buffer_size
+        self.buffer_bytes = cv.KB_to_bytes(in_buffer_size)
 
-        # Amount of time it takes to send Packet down link (in ms)
+        # Amount of time it takes to send Packet down link (in ms, and in 
+        #   ticks of the simulation clock)
         self.delay = in_delay
+        self.delay_ticks = cv.ms_to_ticks(in_delay)
+        
+        # Whether both directions share the link (half-duplex) or each has 
+        #   its own (full-duplex).  Each direction sends on a channel: the one
+        #   channel of a half-duplex link, or its own on a full-duplex link.
+        self.duplex = in_duplex
+        if self.duplex == ct.DUPLEX_FULL:
+            self.channels = [ 0, 1 ]
+        else:
+            self.channels = [ 0, 0 ]
 
         # Define the endpoints so we know how to define flow on this 
-        # half-duplex link. Could be a Router or Host. 'in_endpoints' is 
-        # passed in as a tuple of host_name and/or router_name
-        self.end_points = { in_endpoints[0] : 0, in_endpoints[1] : 1 }
+        # link. Could be a Router or Host. 'in_endpoints' is 
+        # passed in as a tuple of host_name and/or router_name.  The endpoints
+        # are then referred to by their IDs; the names are for the output.
         self.ep_names = { 0 : in_endpoints[0], 1 : in_endpoints[1] }
+        self.ep_IDs = { 0 : self.sim.endpoints[in_endpoints[0]].ID, 
+                        1 : self.sim.endpoints[in_endpoints[1]].ID }
+        self.end_points = { self.ep_IDs[0] : 0, self.ep_IDs[1] : 1 }
         
-        # The packet buffers on either end of the half-duplex link (heapq's)
-        self.buffers = [ [], [] ]
+        # The packet buffers on either end of the half-duplex link.  Packets
+        #   join the back of a buffer and leave from the front, so they are 
+        #   deques of (time, flow ID, packet ID, packet) kept in sorted order.
+        self.buffers = [ collections.deque(), collections.deque() ]
         
-        # The amount of data in the buffer in kilobytes.
+        # The amount of data in the buffer in bytes.
         self.buffer_load = [ 0, 0 ]
         
         # The total amount of data that has traversed this link in either
@@ -174,29 +257,162 @@ class Link:
         self.total_buffer_load = [ 0, 0 ]
         self.total_packets = [ 0, 0 ]
         
-        # The number of packets on the link from the indexed endpoint.  One of
-        #   these must be empty at all times because the link is half-duplex.
-        self.packets_on_link = [ [], [] ]
+        # The packets on the link from the indexed endpoint, in the order they
+        #   were put on it (and so will come off).  The Packets themselves 
+        #   are kept, so nothing has to be looked up on the way.  One of 
+        #   these must be empty at all times if the link is half-duplex.
+        self.packets_on_link = [ collections.deque(), collections.deque() ]
         
         # The amount of data on the link in Mb
         self.data_on_link = 0
         
-        # If a packet is currently being moved from the buffer to the link,
-        #   this is true.
-        self.in_transmission = False   
+        # The state of each channel: idle, transmitting a packet, or draining
+        #   the packets going one way before those waiting go the other way
+        #   (only on a half-duplex link).
+        self.state = [ ct.LINK_IDLE, ct.LINK_IDLE ]
+        
+        # The time the packet being transmitted on each channel is all on 
+        #   the link.
+        self.transmit_end = [ 0, 0 ]
+        
+        # Whether an event is queued to wake each idle channel up.
+        self.wakeup_queued = [ False, False ]
+        
+        # The data of fluid flows queued in each buffer (in bytes), the rate it
+        #   leaves on each channel (in Mb/sec) and the amount of it on the 
+        #   link (in Mb), all set by the fluid model (see fluid.py).  
+        self.fluid_load = [ 0, 0 ]
+        self.fluid_rate = [ 0, 0 ]
+        self.fluid_on_link = 0
+        
+        # The bytes of packets put on each channel, which the fluid model 
+        #   reads and resets to work out the rate left to the fluid.
+        self.packet_data_sent = [ 0, 0 ]
+        
+        # There are only a few sizes of packet, so the amount of data each
+        #   puts on the link (in Mb) and the time it takes to transmit it (in
+        #   ticks) are worked out once for each size: the data here, and the
+        #   times whenever the rate is set.
+        self.packet_Mb = {}
+        for size in (ct.PACKET_DATA_SIZE, ct.PACKET_ACK_SIZE, 
+                     ct.PACKET_ROUTING_SIZE):
+            self.packet_Mb[size] = cv.bytes_to_Mb(size)
+        self.transmission_times = {}
+        self.set_rate(in_rate)
         
         # Keep track of the number of packets lost
         self.num_packets_lost = 0  
         
         
-    def get_buffer_info(self, ep_name):
+    def transmission_time(self, packet_size, rate):
+        '''
+        Description:        Returns the time it takes to transmit a Packet 
+                            at a rate.
+        
+        Arguments:          packet_size (int)
+                                - The size of the Packet in bytes.
+
+                            rate (float)
+                                - The rate in Mb/sec.
+        
+        Return Values:      (float)
+                                - The transmission time in ms.
+        
+        Shared Variables:   None.
+        
+        Global Variables:   None.
+        
+        Limitations:        None.
+        
+        Known Bugs:         None.
+        
+        Revision History:   2026/10/18: Created from put_packet_on_link().
+                            2026/10/18: Converts seconds to ms correctly.
+        '''
+        # Calculate the transmission time as the size of the packet 
+        #   divided by the link capacity (aka rate).
+        transmission_time =  (cv.bytes_to_Mb(packet_size) / rate) 
+        transmission_time *= 1000 # To get it in ms 
+        return transmission_time
+
+
+    def set_rate(self, rate):
+        '''
+        Description:        Sets the rate of the Link and works out again the
+                            time it takes to transmit each size of Packet. 
+                            The Link is caught up first, so the Packets that
+                            went on it before now keep their transmission 
+                            times.  Use this rather than setting the rate 
+                            directly, for instance in a variant of fork_at().
+        
+        Arguments:          rate (float)
+                                - The new rate in Mb/sec.
+        
+        Return Values:      None.
+        
+        Shared Variables:   self.rate (WRITE)
+                                - Set to the argued rate.
+
+                            self.transmission_times (WRITE)
+                                - The time to transmit each size of Packet 
+                                at the new rate, in ticks.
+        
+        Global Variables:   None.
+        
+        Limitations:        A Packet being transmitted finishes at the old 
+                            rate.
+        
+        Known Bugs:         None.
+        
+        Revision History:   2026/10/18: Created
+        '''
+        self.catch_up()
+        self.rate = rate
+        for size in self.packet_Mb:
+            self.transmission_times[size] = cv.ms_to_ticks(
+                                    self.transmission_time(size, self.rate))
+
+
+    def set_buffer_size(self, buffer_size):
+        '''
+        Description:        Sets the size of the buffers of the Link.  Use 
+                            this rather than setting the size directly, for
+                            instance in a variant of fork_at(), so the size 
+                            in bytes the buffers are checked against changes
+                            too.
+        
+        Arguments:          buffer_size (float)
+                                - The new size of each buffer in KB.
+        
+        Return Values:      None.
+        
+        Shared Variables:   self.buffer_size (WRITE)
+                                - Set to the argued size.
+
+                            self.buffer_bytes (WRITE)
+                                - Set to the argued size in bytes.
+        
+        Global Variables:   None.
+        
+        Limitations:        Packets already on a buffer stay on it, even if
+                            they no longer fit.
+        
+        Known Bugs:         None.
+        
+        Revision History:   2026/10/18: Created
+        '''
+        self.buffer_size = buffer_size
+        self.buffer_bytes = cv.KB_to_bytes(buffer_size)
+
+
+    def get_buffer_info(self, ep_ID):
         '''
         Description:        This returns the amount of data and number of 
                             Packet on the buffer at the argued endpoint.  This 
                             can then be used to estimate RTTs.
         
-        Arguments:          ep_name (string) 
-                                - The name of the endpoint that is requesting 
+        Arguments:          ep_ID (integer) 
+                                - The ID of the endpoint that is requesting 
                                 its buffer information.
         
         Return Values:      (int, int) 
@@ -205,7 +421,7 @@ class Link:
         
         Shared Variables: self.end_points (READ) 
                                 - Used to get the index that corresponds to the 
-                                argued endpoint name.
+                                argued endpoint ID.
                           self.buffer_load (READ) 
                                 - Value at endpoint index is returned.
                           self.buffers (READ) 
@@ -216,53 +432,53 @@ class Link:
         
         Revision History: 11/26/15: Created
         '''
-        ep_index = self.end_points[ep_name]
+        ep_index = self.end_points[ep_ID]
         
         # Return the amount of data in the buffer and the number of packets
         #   (which is necessary because not all packets are the same size)
         return self.total_buffer_load[ep_index], self.total_packets[ep_index]
     
         
-    def get_other_ep(self, ep_name):
+    def get_other_ep(self, ep_ID):
         '''
         Description:        This is called by a particular endpoint (whose 
-                            name is argued) and returns the name of the other 
+                            ID is argued) and returns the ID of the other 
                             endpoint on the Link.
         
-        Arguments:          ep_name (string) 
-                                - The name of the endpoint calling the 
+        Arguments:          ep_ID (integer) 
+                                - The ID of the endpoint calling the 
                                 function.
         
-        Return Values:      (string) 
-                                - A string representing the name of the other
-                                endpoint.
+        Return Values:      (integer) 
+                                - The ID of the other endpoint.
         
-        Shared Variables:   self.ep_names (READ) 
-                                - Read to get the name of the other other 
+        Shared Variables:   self.ep_IDs (READ) 
+                                - Read to get the ID of the other other 
                                 endpoint.
         
         Global Variables:   None.
         
-        Limitations:        This always returns an endpoint name.  If the 
-                            argued name is unknown, it will always return what 
+        Limitations:        This always returns an endpoint ID.  If the 
+                            argued ID is unknown, it will always return what 
                             is at index 1 in the endpoint dictionary.
         
         Revision History:   11/26/15: Created
+                            2026/10/18: Works with endpoint IDs.
         '''
-        if self.ep_names[0] == ep_name:
-            return self.ep_names[1]
-        return self.ep_names[0]
+        if self.ep_IDs[0] == ep_ID:
+            return self.ep_IDs[1]
+        return self.ep_IDs[0]
           
         
-    def put_packet_on_buffer(self, sender_name, packet):
+    def put_packet_on_buffer(self, sender_ID, packet):
         '''
         Description:        This takes a packet and if there is space on the 
                             buffer, moves it onto the buffer.  If there is 
                             nothing on the Link or either buffer, it also puts 
                             it on the Link.
         
-        Arguments:          sender_name (string) 
-                                - The name of the endpoint that sent the 
+        Arguments:          sender_ID (integer) 
+                                - The ID of the endpoint that sent the 
                                 Packet.
 
                             packet (Packet) 
@@ -286,7 +502,9 @@ class Link:
                                 - This is used to determine if there is enough 
                                 space on the buffer to enqueue a Packet.
         
-        Global Variables: None.
+        Global Variables: sim.packets (WRITE)
+                                - A packet that does not fit on the buffer is
+                                dropped, so it is released.
         
         Limitations:      None.
         
@@ -297,28 +515,44 @@ class Link:
                           2015/11/03: Changed the link buffers to use the 
                                       python queue data structure and only 
                                       store the flow_name and packet_name
+                          2026/10/18: Appends to a deque.
+                          2026/10/18: Only wakes the Link up when needed.
+                          2026/10/18: Catches the Link up first.
+                          2026/10/18: Fluid data takes up buffer space.
+                          2026/10/18: Keeps the Packet and its size in 
+                                      bytes.
+                          2026/10/18: Packets arriving at the same time 
+                                      keep their order.
+                          2026/10/18: TIME_BIT is converted to ticks.
         '''
-        # Get the index of the endpoint sender_name represents and then the
+        # Get the index of the endpoint sender_ID represents and then the
         #   index of the opposite endpoint.
-        ep, other_ep = u.assign_endpoints(self.end_points, sender_name)
+        ep, other_ep = u.assign_endpoints(self.end_points, sender_ID)
+        
+        # Bring the buffers up to now before looking at their load.
+        self.catch_up()
         
         # Add the buffer recording
-        st.add_buffer_recording(sim.network_now(), self.link_name)
+        self.sim.status.add_buffer_recording(self.sim.network_now(), 
+                                             self.link_name)
 
-        # Put the packet onto the buffer heapqueue corresponding to the sender.
+        # Put the packet onto the buffer corresponding to the sender.
         #   The time we use for this will be now, because we are using first
         #   come first served priority on the links, but only if there is 
-        #   enough space.
-        if packet.size + cv.KB_to_bytes(self.buffer_load[ep]) <= \
-           cv.KB_to_bytes(self.buffer_size):
-            # Add the packet identifier to the link buffer heap queue along 
-            # 	with the time
-            heapq.heappush(self.buffers[ep], 
-                (sim.network_now(), packet.flow, packet.ID))
+        #   enough space.  The data of fluid flows queued there takes up
+        #   space as well.
+        if packet.size + self.buffer_load[ep] + self.fluid_load[ep] <= \
+           self.buffer_bytes:
+            # Add the packet identifier to the back of the link buffer along
+            # 	with the time.  The clock counts whole ticks, so packets
+            #   often arrive at the same time, and those go in the order they
+            #   arrived.
+            self.buffers[ep].append((self.sim.network_now(), packet.flow,
+                                     packet.ID, packet))
 
             # Update the buffer load for this link buffer because it is now
             # storing an additional packet.size
-            self.buffer_load[ep] += cv.bytes_to_KB(packet.size)
+            self.buffer_load[ep] += packet.size
             
             # Add to the totals so Bellman Ford can run.
             self.total_packets[ep] += 1
@@ -326,19 +560,29 @@ class Link:
         
         else: 
             self.num_packets_lost += 1
+            if packet.type == ct.PACKET_DATA:
+                self.sim.flow_list[packet.flow].packets_lost += 1
+
+            # The packet is gone from the network.
+            self.sim.release_packet(packet)
 
-        # We now want to kickstart the putting packets on the link.  If there
-        #   is already a packet in transmission, then nothing will happen.
-        #   Otherwise, we are telling it the buffer is now nonempty.  However,
-        #   create an event some dt in the future so all the "current" events
-        #   can finish first.
-        link_time = sim.network_now() + ct.TIME_BIT
-        link_ev = e.Event(self.link_name, 'put_packet_on_link', [])
-        sim.enqueue_event(link_time, link_ev)
+        # We now want to kickstart the putting packets on the channel of the 
+        #   sender, but only once and only if a packet can go on it.  If 
+        #   there is a packet in transmission, the packet just added follows
+        #   it back to back.  If the link is draining, the last packet off of
+        #   the link wakes it up.  Otherwise, wake it up some dt in the 
+        #   future so all the "current" events can finish first.
+        channel = self.channels[ep]
+        next_pop = self.update_state(channel)
+        if next_pop != -1 and not self.wakeup_queued[channel]:
+            self.wakeup_queued[channel] = True
+            link_time = self.sim.network_now() + cv.ms_to_ticks(ct.TIME_BIT)
+            link_ev = e.Event(self.wake_up, [channel])
+            self.sim.enqueue_event(link_time, link_ev)
         
         
     
-    def reset_this_buffer(self, ep_name):
+    def reset_this_buffer(self, ep_ID):
         '''
         reset_this_buffer
         
@@ -346,7 +590,7 @@ class Link:
                             start to tally again and carry out Bellman Ford.
                             
         Arguments:          self (Link)
-                            ep_name (string) - The name of the endpoint (should
+                            ep_ID (integer) - The ID of the endpoint (should
                                 be a router) that called this function to have
                                 its buffer data cleared.
                                 
@@ -364,7 +608,7 @@ class Link:
         Revision History:   12/08/15: Created
         '''
         # Get the endpoint index for the caller of this function.
-        ep_index = self.end_points[ep_name]
+        ep_index = self.end_points[ep_ID]
         
         # Reset the buffer totals for it.
         self.total_buffer_load[ep_index] = 0
@@ -372,20 +616,33 @@ class Link:
     
 
             
-    def reset_in_transmission(self, unused_list):
+    def update_state(self, channel):
         '''
-        reset_in_transmission
-        
-        Description:        Sets the in_transmission flag to 0 so more packets 
-                            can be loaded onto the link.
-        
-        Arguments:          unused_list (List) 
-                                - Unused.
-        
-        Return Values:      None.
-        
-        Shared Variables:   in_transmission (WRITE) 
-                                - Written to False.
+        Description:        Works out the state of a channel of the Link from
+                            the transmission in progress, the buffers and the
+                            Packets on the Link, and which buffer can put a 
+                            Packet on the channel now.  A transmission is 
+                            over once its end has passed.  A full-duplex 
+                            channel only carries the Packets of its own 
+                            buffer, so it never drains.
+        
+        Arguments:          channel (int)
+                                - The index of the channel.
+        
+        Return Values:      next_pop (int)
+                                - The index of the buffer to put a Packet on 
+                                the Link from now, or -1 if no Packet can go 
+                                on the Link now.
+        
+        Shared Variables:   state (READ/WRITE) 
+                                - Set to the state of the channel.
+                            
+                            transmit_end (READ) 
+                                - Used to see if the transmission is over.
+                            
+                            buffers (READ) 
+                                - Read to see if there is anything to put on 
+                                the Link.
         
         Global Variables:   None.
         
@@ -393,9 +650,34 @@ class Link:
         
         Known Bugs:         None.
         
-        Revision History:   11/16/15: Created
+        Revision History:   2026/10/18: Created
         '''
-        self.in_transmission = False
+        # Nothing can go on the channel until the transmission is over.
+        if self.state[channel] == ct.LINK_TRANSMITTING:
+            if self.sim.network_now() < self.transmit_end[channel]:
+                return -1
+            self.state[channel] = ct.LINK_IDLE
+        
+        # A full-duplex channel sends whatever is in its buffer.
+        if self.duplex == ct.DUPLEX_FULL:
+            if len(self.buffers[channel]) == 0:
+                return -1
+            return channel
+        
+        # With nothing in either buffer, the link is idle.
+        if len(self.buffers[0]) == 0 and len(self.buffers[1]) == 0:
+            self.state[0] = ct.LINK_IDLE
+            return -1
+        
+        # If the next packet goes against the direction of travel, it must 
+        #   wait until the link is clear.
+        data_src, next_pop = self.get_next_buffer_pop()
+        if data_src != -1 and next_pop != data_src:
+            self.state[0] = ct.LINK_DRAINING
+            return -1
+        
+        self.state[0] = ct.LINK_IDLE
+        return next_pop
             
 
     def get_next_buffer_pop(self):
@@ -433,6 +715,9 @@ class Link:
                                         put_packet_on_link()
                                         and into this function for readability 
                                         and easing debugging.
+                            2026/10/18: Peeks the fronts of the deques.
+                            2026/10/18: A tie on an empty Link goes to 1, 
+                                        as it did by indexing with -1.
         '''
         # Find the direction of travel, which is the source of the data on the
         #   link.  If there is no source, then the data source is -1.
@@ -457,54 +742,89 @@ class Link:
             # The next packet will be the first one that arrived.  If the two
             #   are equal, tie goes to the direction of data travel.  We thus
             #   get the time of entry for the next packet from either buffer
-            #   by "peeking" the element that would be popped off each of 
-            #   the heapq's.
-            [time0, temp1, temp2] = self.buffers[0][0]
-            [time1, temp1, temp2] = self.buffers[1][0]
+            #   by "peeking" the front of each deque.
+            time0 = self.buffers[0][0][0]
+            time1 = self.buffers[1][0][0]
             
             # If the two times are equal, keep sending data in the direction of
-            #   travel.  Otherwise, send the oldest (smallest time) packet.
+            #   travel (or from 1 if nothing is travelling).  Otherwise, send 
+            #   the oldest (smallest time) packet.
             next_pop = 0
             if time0 == time1:
-                next_pop = data_src
+                next_pop = data_src if data_src != -1 else 1
             elif time1 < time0:
                 next_pop = 1
     
         return data_src, next_pop
 
             
+    def catch_up(self):
+        '''
+        Description:        Brings the Link up to the current time.  Packets 
+                            waiting behind a transmission go on the Link back
+                            to back, each as soon as the one before it is 
+                            transmitted, for as long as they can.  When each
+                            one goes is fully determined by the rate of the 
+                            Link, so no Event is needed for it: the train is 
+                            worked out here, whenever something is about to 
+                            look at or change the Link, up to the current 
+                            time.  Each Packet of the train is handed off a 
+                            delay after its transmission, which is never 
+                            before the next Packet goes on the Link, so the 
+                            hand-offs keep the train going.
+        
+        Arguments:          None.
+        
+        Return Values:      None.
+        
+        Shared Variables:   state (READ/WRITE) 
+                                - Transmitting channels whose transmission 
+                                is over are moved on.
+                            
+                            transmit_end (READ) 
+                                - The time each transmission is over, and so
+                                the time the next Packet goes on the Link.
+        
+        Global Variables:   None.
+        
+        Limitations:        None.
+        
+        Known Bugs:         None.
+        
+        Revision History:   2026/10/18: Created
+        '''
+        now = self.sim.network_now()
+        for channel in range(self.channels[1] + 1):
+            while self.state[channel] == ct.LINK_TRANSMITTING and \
+                  self.transmit_end[channel] <= now:
+                # The transmission is over, so the next packet goes on when 
+                #   it ended, if it can.
+                start_time = self.transmit_end[channel]
+                self.state[channel] = ct.LINK_IDLE
+                next_pop = self.update_state(channel)
+                if next_pop == -1:
+                    break
+                self.transmit(channel, next_pop, start_time)
+            
+
     def put_packet_on_link(self, arg_list):
         '''
-        Description:        This puts a Packet on the Link.  It then enqueues 
-                            some Event.  One will check after transmission time 
-                            if there is another Packet that can go in the same 
-                            direction. One will check wait for transmission 
-                            time then reset the in_transmission flag.  One 
-                            waits for the Packet to reach the other end to see 
-                            if there is a Packet waiting to go the opposite 
-                            direction, and the last is for the other end to 
-                            receive the Packet.
-        
-        Arguments:          arg_list ([]) 
-                                - Unused.
+        Description:        This puts a Packet on the Link if one can go on it
+                            now.  Nothing else is needed to wake the Link up:
+                            a Packet arriving on a buffer does while the Link
+                            is idle, the Packets waiting behind a 
+                            transmission follow it back to back (see 
+                            catch_up()), and the last Packet leaving the Link
+                            does while it is draining.
+        
+        Arguments:          arg_list ([channel]) 
+                                - A list containing the index of the channel
+                                to put the Packet on.
         
         Return Values:      None.
         
-        Shared Variables:   buffers (READ/WRITE) 
-                                - Read to see if there is anything to put on 
-                                the Link, written if something is taken
-                                off of the buffer to put on the link.
-                          
-                            packets_on_link (READ/WRITE) 
-                                - Read to see direction of travel and written 
-                                to put Packet on the Link.
-                          
-                            in_transmission (WRITE) 
-                                - Written to True when a packet is being 
-                                transmitted.
-                          
-                            data_on_link (WRITE) 
-                                - The amount of data on the Link is updated.
+        Shared Variables:   state (READ) 
+                                - Read to see if the channel is free.
         
         Global Variables: None.
         
@@ -519,77 +839,138 @@ class Link:
                                       store the flow_name and packet_name
                           2015/11/16: Now checks for next packet to put on 
                                       Link and creates Event for it.
+                          2026/10/18: The buffers and link are deques.
+                          2026/10/18: Queues one Event to finish the 
+                                      transmission, only if needed.
+                          2026/10/18: Puts the Packet on a channel.
+                          2026/10/18: Moved the transmission to transmit().
         '''
-        # If there is a packet in transmission, we cannot put anything on the
-        #   link.
-        if self.in_transmission:
-            return
-            
-        # If there are no packets in either buffer, then we have no business
-        #   here.
-        if len(self.buffers[0]) == 0 and len(self.buffers[1]) == 0:
+        # Get which buffer to pop a packet from next (0 or 1).  If there is a
+        #   packet in transmission, there are no packets in either buffer or 
+        #   the next packet must wait until the link is clear to go the 
+        #   opposite direction, we have no business here.
+        [channel] = arg_list
+        self.catch_up()
+        next_pop = self.update_state(channel)
+        if next_pop == -1:
             return
 
-        # Get which buffer to pop a packet from next (0 or 1)
-        data_src, next_pop = self.get_next_buffer_pop()
+        self.transmit(channel, next_pop, self.sim.network_now())
 
-        # Now that we know the source of the next packet, we know if it goes on
-        #   right away.  If the next packet will go in the same direction of 
-        #   travel as the other packets, put it on the link.  Otherwise, we 
-        #   must wait until the link is clear to send it the opposite 
-        #   direction.
-        if (next_pop == data_src and not self.in_transmission) or \
-            data_src == -1:
-            # We are sending a packet, so set the in_transmission flag.
-            self.in_transmission = True
-            
-            # The next packet will go in the same direction as data on the 
-            #   link. Pop the packet from the link buffer
-            [time, flow_name, packet_ID] = heapq.heappop(
-                                                    self.buffers[next_pop])
-            
-            # Put it on the link and use the current time so we can heapify
-            #   more easily.  Subtract from the buffer load to reflect that the
-            #   packet is no longer on the buffer
-            heapq.heappush(self.packets_on_link[next_pop],
-                           (sim.network_now(), flow_name, packet_ID))
-            packet_size = sim.packets[(flow_name, packet_ID)].size # in bytes
-            self.buffer_load[next_pop] -= cv.bytes_to_KB(packet_size)
-
-            self.data_on_link += cv.bytes_to_Mb(packet_size)
-            
-            # Calculate the transmission time as the size of the packet 
-            #   divided by the link capacity (aka rate).
-            packet_size = sim.packets[(flow_name, packet_ID)].size
-            transmission_time =  (cv.bytes_to_Mb(packet_size) / self.rate) 
-            transmission_time /= 1000 # To get it in ms 
-            
-            # Create an event after this packet's transmission to reset the
-            #   in_transmission flag.  Subtract a small amount of time to 
-            #   assure it happens before the next call of this function.
-            reset_time = sim.network_now() + transmission_time - ct.TIME_BIT
-            reset_event = e.Event(self.link_name, 'reset_in_transmission', [])
-            sim.enqueue_event(reset_time, reset_event)
-            
-            # Create an event to check if we should send another packet after
-            #   transmission.
-            pkt1_time = sim.network_now() + transmission_time
-            pkt1_event = e.Event(self.link_name, 'put_packet_on_link', [])
-            sim.enqueue_event(pkt1_time, pkt1_event)
+
+    def transmit(self, channel, next_pop, start_time):
+        '''
+        Description:        Puts the next Packet of a buffer on a channel of
+                            the Link and enqueues the Event for the other end
+                            to receive it.
+        
+        Arguments:          channel (int)
+                                - The index of the channel.
+
+                            next_pop (int)
+                                - The index of the buffer to take the Packet 
+                                from.
+
+                            start_time (float)
+                                - The time the Packet goes on the Link, which
+                                is in the past if it follows another Packet 
+                                back to back.
+        
+        Return Values:      None.
+        
+        Shared Variables:   buffers (WRITE) 
+                                - The Packet is taken off of the buffer.
+                          
+                            packets_on_link (WRITE) 
+                                - The Packet is put on the Link.
+                          
+                            state (WRITE) 
+                                - Written to transmitting.
+                          
+                            transmit_end (WRITE) 
+                                - Written to the time the transmission ends.
+                          
+                            data_on_link (WRITE)
+                                - The amount of data on the Link is updated.
+
+                            packet_data_sent (WRITE)
+                                - The Packet is added to it.
+
+                            fluid_rate (READ)
+                                - The rate fluid flows take from the Link.
+
+        Global Variables:   None.
+        
+        Limitations:        None.
+        
+        Known Bugs:         None.
+        
+        Revision History:   2026/10/18: Moved out of put_packet_on_link().
+                            2026/10/18: Shares the rate with fluid flows.
+                            2026/10/18: Looks up the transmission time.
+                            2026/10/18: Times are in ticks.
+        '''
+        # We are sending a packet, so the channel is transmitting.
+        self.state[channel] = ct.LINK_TRANSMITTING
+        
+        # The next packet will go in the same direction as data on the 
+        #   link. Pop the packet from the link buffer
+        packet = self.buffers[next_pop].popleft()[3]
+        
+        # Put it on the link.  Subtract from the buffer load to reflect that
+        #   the packet is no longer on the buffer
+        self.packets_on_link[next_pop].append(packet)
+        packet_size = packet.size # bytes
+        self.buffer_load[next_pop] -= packet_size
+
+        self.data_on_link += self.packet_Mb[packet_size]
+        self.packet_data_sent[channel] += packet_size
+        
+        # The transmission time is looked up, unless fluid flowing on the 
+        #   channel is taking some of its rate.  That always leaves the 
+        #   packets some of the rate.
+        if self.fluid_rate[channel] == 0:
+            transmission_time = self.transmission_times[packet_size]
+        else:
+            rate = max(self.rate - self.fluid_rate[channel], 
+                       self.rate * ct.FLUID_MIN_PACKET_SHARE)
+            transmission_time = cv.ms_to_ticks(
+                                    self.transmission_time(packet_size, rate))
+        self.transmit_end[channel] = start_time + transmission_time
+        
+        # Enqueue the event for the opposite end to receive the packet.
+        #   This occurs at the same time as the transmission plus delay
+        #   event.
+        rcv_time = self.transmit_end[channel] + self.delay_ticks
+        rcv_event = e.Event(self.handoff_packet, [next_pop])
+        self.sim.enqueue_event(rcv_time, rcv_event)
             
-            # Enqueue the event for the opposite end to receive the packet.
-            #   This occurs at the same time as the transmission plus delay
-            #   event.
-            rcv_time = pkt1_time + self.delay
-            rcv_event = e.Event(self.link_name, 'handoff_packet', [next_pop])
-            sim.enqueue_event(rcv_time, rcv_event)
             
-            # If we are not sending another packet after transmission, we need
-            #   to also have an event that checks after propagation.  Because 
-            #   we do not know yet, we must make the event no matter what.
-            pkt2_time = rcv_time
-            pkt2_event = e.Event(self.link_name, 'put_packet_on_link', [])
-            sim.enqueue_event(pkt2_time, pkt2_event)
+    def wake_up(self, list_channel):
+        '''
+        Description:        Puts the next Packet on a channel after a Packet 
+                            arrived on a buffer of the idle channel.
+        
+        Arguments:          list_channel ([channel]) 
+                                - A list containing the index of the channel.
+        
+        Return Values:      None.
+        
+        Shared Variables:   wakeup_queued (WRITE) 
+                                - Cleared, so the next Packet to arrive can 
+                                wake the Link up again.
+        
+        Global Variables:   None.
+        
+        Limitations:        None.
+        
+        Known Bugs:         None.
+        
+        Revision History:   2026/10/18: Created
+        '''
+        [channel] = list_channel
+        self.wakeup_queued[channel] = False
+        self.put_packet_on_link([channel])
             
             
     def handoff_packet(self, list_sender):
@@ -610,14 +991,10 @@ class Link:
                             packets_on_link (WRITE) 
                                 - Packet popped off of Link.
 
-                            ep_names (READ) 
-                                - Used to get the name of the endpoint.
+                            ep_IDs (READ) 
+                                - Used to get the ID of the endpoint.
         
-        Global Variables:   sim.packets (READ) 
-                                - Used to get the size of data being taken off 
-                                of the Link.
-
-                            sim.endpoints (READ) 
+        Global Variables:   sim.endpoint_list (READ) 
                                 - Used to obtain endpoint object.
         
         Limitations:        None.
@@ -625,21 +1002,32 @@ class Link:
         Known Bugs:         None.
         
         Revision History:   2015/11/16: Created
+                            2026/10/18: Pops the front of a deque.
+                            2026/10/18: Puts the next Packet on the Link.
+                            2026/10/18: Catches the Link up first.
+                            2026/10/18: The Packet is kept on the Link.
+                            2026/10/18: Hands off the Packet itself.
         '''
         # Unpack the argument list, which has the sender in it.
         [sender_index] = list_sender
         
+        # Put the packets that followed this one back to back on the link.
+        self.catch_up()
+        
         # Take the packet off of the link by removing it from the queue.
-        [time, flow_name, packet_ID] = \
-                heapq.heappop(self.packets_on_link[sender_index])
-        packet_size = sim.packets[(flow_name, packet_ID)].size # in bytes
-        self.data_on_link -= cv.bytes_to_Mb(packet_size)
+        packet = self.packets_on_link[sender_index].popleft()
+        self.data_on_link -= self.packet_Mb[packet.size]
         
         # Use the sender index to figure out the receiver index.
         rcv_index = (sender_index + 1) % 2
         
         # Now "hand off" the packet to the host/router.
-        ep = sim.endpoints[self.ep_names[rcv_index]]
-        ep.receive_packet([flow_name, packet_ID])
+        ep = self.sim.endpoint_list[self.ep_IDs[rcv_index]]
+        ep.receive_packet([packet])
+        
+        # If this was the last packet on a half-duplex link, the packets 
+        #   waiting to go the other way can go now.
+        if self.duplex != ct.DUPLEX_FULL:
+            self.put_packet_on_link([0])
            
     
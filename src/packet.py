@@ -22,10 +22,6 @@ import event as e
 import constants as ct
 import conversion as cv
 
-# Import the simulate module.
-import sys
-sim = sys.modules['__main__']
-
 
 ############################################################################
 #                                                                          #
@@ -36,6 +32,10 @@ sim = sys.modules['__main__']
 
 class Packet:
 
+    # Packets are the most numerous objects in a simulation, so they keep 
+    #   their attributes in slots rather than in a dictionary each.
+    __slots__ = ('type', 'ID', 'flow', 'src', 'dest', 'size', 'time', 'data')
+
     def __init__(self, in_ID, in_flow, in_src, in_dest, in_type):
         '''
         Description:        Initialize an instance of Packet by intitializing 
@@ -43,22 +43,22 @@ class Packet:
 
         Arguments:          in_ID (integer)
                                 - An integer that is the ID of the Packet; it 
-                                is combined with the flow name to uniquely
+                                is combined with the flow ID to uniquely
                                 idenitfy this Packet object.
 
-                            in_flow (string)
-                                - A string indicating the name of the Flow 
-                                that this Packet instance belongs to.  It, 
-                                along with the packet_ID uniquely identifies a 
-                                Packet.
+                            in_flow (integer)
+                                - The ID of the Flow that this Packet 
+                                instance belongs to.  It, along with the 
+                                packet_ID uniquely identifies a Packet.
 
-                            in_src (string)
-                                - A string indicating the host name of the 
-                                source of the Packet (i.e., "H1").
+                            in_src (integer)
+                                - The endpoint ID of the source Host of the 
+                                Packet (for a routing packet, the ID of the
+                                Link it is sent on).
 
-                            in_dest (string)
-                                - A string indicating the host name of the 
-                                destination Host of the Packet (i.e., "H2").
+                            in_dest (integer)
+                                - The endpoint ID of the destination Host of 
+                                the Packet (None for a routing packet).
 
                             in_type (integer)
                                 - An integer constant defined in constants.py
@@ -92,21 +92,20 @@ class Packet:
         Known Bugs:         None.
 
         Revision History:   10/03/15: Created
+                            2026/10/18: Attributes are slots.
+                            2026/10/18: Flow, source and destination are IDs.
         '''
-        # Store the type so we can easily identify the object.
-        self.type = ct.TYPE_PACKET
-        
         # ID of the Link, each ID is a unique string (i.e. "P1")
         self.ID = in_ID
 
-        # Flow that the Packet belongs to 
+        # ID of the Flow that the Packet belongs to 
         # Gives access to source and destination, uniquely identifies Packet
         self.flow = in_flow
 
-        # Host/Router sending the Packet
+        # ID of the Host sending the Packet (or Link, for routing packets)
         self.src = in_src
 
-        # Host/Router to receive the Packet
+        # ID of the Host to receive the Packet
         self.dest = in_dest
 
         # Constant representing the type of Packet being sent 
@@ -121,7 +120,8 @@ class Packet:
         elif self.type == ct.PACKET_ROUTING:
             self.size = ct.PACKET_ROUTING_SIZE
         
-        # The time of transmission from src.  -1 means not transmitted
+        # The time of transmission from src in ticks.  None means not 
+        #   transmitted
         self.time = None
         
         # The data is usually a marker so we have some sense of chronology of
@@ -129,11 +129,14 @@ class Packet:
         self.data = None
         
         
-    def copy_packet(self):
+    def copy_packet(self, sim):
         '''
         Description:        Returns a copy of the argued packet.
         
-        Arguments:          None.
+        Arguments:          sim (Simulation)
+                                - The Simulation the Packet is in.  Used to 
+                                get a new ID from the Flow and to register the 
+                                copy.
         
         Return Values:      Packet
                                 - An exact copy of this Packet object.
@@ -150,19 +153,23 @@ class Packet:
                             self.type (READ)
                                 - Used to initialize another duplicate Packet.
 
-        Global Variables: None.
+        Global Variables: sim.flow_list (READ)
+                                - Used to get a unique ID for the copy.
+
+                          sim.packets (WRITE)
+                                - The copy is added to this dictionary.
         
         Revision History: 11/26/15: Created
         '''
-        copy_pkt = Packet(sim.flows[self.flow].create_packet_ID(), self.flow,
-                            self.src, self.dest, self.type)
+        copy_pkt = Packet(sim.flow_list[self.flow].create_packet_ID(), 
+                          self.flow, self.src, self.dest, self.type)
                             
         # Copy the other data over.
         copy_pkt.time = self.time
         copy_pkt.set_data(self.data)
         
         # Add it to the global dictionary of packets.
-        sim.packets[(copy_pkt.flow, copy_pkt.ID)] = copy_pkt
+        sim.add_packet(copy_pkt)
         
         return copy_pkt
         
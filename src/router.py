@@ -8,7 +8,8 @@
 #
 # This contains the router class, which contains methods for simulating the
 # routers in the network.  It also contains methods which periodically run
-# a Bellman-Ford algorithm to build its own routing table.
+# a Bellman-Ford algorithm to build its own routing table, and a function
+# that fills the routing tables once with static shortest paths instead.
 #
 ############################################################################
 
@@ -30,13 +31,12 @@ import event as e
 import constants as ct
 import conversion as cv
 
-# Import simulator so we can access events, objects and time.
-import sys
-sim = sys.modules['__main__']
-
 # Allows us to copy elements
 import copy
 
+# Import heapq for the priority queue of Dijkstra's algorithm
+import heapq
+
 
 ############################################################################
 #                                                                          #
@@ -46,14 +46,26 @@ import copy
 
 class Router:
 
-    def __init__(self, in_router_name):
+    def __init__(self, in_sim, in_ID, in_router_name):
         '''
         Description:        Initialize an instance of Router by intitializing 
                             its attributes.
 
-        Arguments:          in_router_name (string)
+        Arguments:          in_sim (Simulation)
+                                - The Simulation that this Router instance is 
+                                a part of.
+
+                            in_ID (integer)
+                                - The endpoint ID of this Router, its index in
+                                sim.endpoint_list.
+
+                            in_router_name (string)
+
+        Shared Variables:   self.sim (WRITE)
 
-        Shared Variables:   self.in_router_name (WRITE)
+                            self.ID (WRITE)
+
+                            self.in_router_name (WRITE)
 
         Global Variables:   None.
  
@@ -62,30 +74,37 @@ class Router:
         Known Bugs:         None.
 
         Revision History:   10/20/15: Created
+                            2026/10/18: Refers to objects by ID.
         '''
+        # The simulation this Router belongs to.
+        self.sim = in_sim
+
         # Store the type so it can be easily identified as a router.
         self.type = ct.TYPE_ROUTER
 
+        # The endpoint ID of the Router, which others refer to it by.
+        self.ID = in_ID
+
         # Name of the Router, each name is a unique string (i.e., "R1")
         self.router_name = in_router_name
 
-        # Dictionary indexed by link names whose values are the identity of
-        #   the endpoint on the other side.
+        # Dictionary indexed by link IDs whose values are the IDs of the 
+        #   endpoints on the other side.
         self.links = {}
 
-        # Python dictionary - contains destination hostnames as keys and Link
-        #   names as values.
+        # Python dictionary - contains destination host IDs as keys and Link
+        #   IDs as values.
         self.routing_table = {}
         self.updating_table = {}
         
-        # Dictionary where keys are hosts and values are pairs of distance to
+        # Dictionary where keys are host IDs and values are pairs of distance to
         #   that host (in average time) and the link one should send a packet 
         #   on to send to that host with that time.  A distance of -1 implies 
         #   that it is unknown what the distance to that host is, but the 
         #   existance of the host is known.
         self.distances = {}
         
-        # Dictionary where keys are link names and values are the number of
+        # Dictionary where keys are link IDs and values are the number of
         #   consecutive routing packets from that link where no new 
         #   information was learned.
         self.no_improves = {}
@@ -126,57 +145,58 @@ class Router:
                                 to this table.
         
         Global Variables: 
-                            sim.endpoints (READ) 
+                            sim.endpoint_list (READ) 
                                 - Used to get the endpoint at the other end of 
                                 a Link.
                           
-                            sim.links (READ) 
-                                - Used to get the Link object from its name.
+                            sim.link_list (READ) 
+                                - Used to get the Link object from its ID.
         
         Limitations:      None.
         
         Known Bugs:       None.
         
         Revision History: 11/26/15: Created
+                          2026/10/18: Keyed by endpoint and link IDs.
         '''
         # Iterate over all of the links' other endpoints to get distances.
-        for link_name in self.links:
-            link = sim.links[link_name]
+        for link_ID in self.links:
+            link = self.sim.link_list[link_ID]
             
-            # Get the name of the other endpoint to see if it is a host.
-            other_ep_name = link.get_other_ep(self.router_name)
+            # Get the ID of the other endpoint to see if it is a host.
+            other_ep_ID = link.get_other_ep(self.ID)
             
             # Get the other endpoint to check its type.
-            other_ep = sim.endpoints[other_ep_name]
+            other_ep = self.sim.endpoint_list[other_ep_ID]
             
             # If it is not a host, we don't learn anything from it.
             if other_ep.type != ct.TYPE_HOST:
                 continue
                 
             # Get the delay associated with sending packets along this link.
-            total_delay = self.get_distance(link_name)
+            total_delay = self.get_distance(link_ID)
             
             # Add this "distance" to the distance dictionary
-            self.distances[other_ep_name] = total_delay
+            self.distances[other_ep_ID] = total_delay
             
             # Add this host and link pair to our routing table.
-            self.updating_table[other_ep_name] = link_name
+            self.updating_table[other_ep_ID] = link_ID
             
             # Add this link to the routing table, as there will never be an
             #   update for this host as there is only one route.
-            self.routing_table[other_ep_name] = link_name
+            self.routing_table[other_ep_ID] = link_ID
             
             # There will be no routing packets on this link, so make its
             #   no improvements number the maximum.
-            self.no_improves[link_name] = ct.MAX_NO_IMPROVES
+            self.no_improves[link_ID] = ct.MAX_NO_IMPROVES
 
 
-    def add_link(self, link_name):
+    def add_link(self, link_ID):
         '''
         Description:        This sets the Link the Router is connected to.
         
-        Arguments:          link_name (string) 
-                                - The name of the Link that is associated
+        Arguments:          link_ID (integer) 
+                                - The ID of the Link that is associated
                                 with this Router.
         
         Return Values:      None.
@@ -184,8 +204,8 @@ class Router:
         Shared Variables:   self.link (WRITE) 
                                 - This sets the link attribute.
         
-        Global Variables:   sim.links (READ) 
-                                - Used to get the name of what is connected to 
+        Global Variables:   sim.link_list (READ) 
+                                - Used to get the ID of what is connected to 
                                 this Router by this Link.
         
         Limitations:        None.
@@ -193,14 +213,14 @@ class Router:
         Known Bugs:         None.
         
         Revision History:   2015/10/29: Created
+                            2026/10/18: Keyed by link ID.
         '''
         # Add the link and other endpoint to the dictionary of links
-        self.links[link_name] = sim.links[link_name].get_other_ep(
-                                                            self.router_name)
+        self.links[link_ID] = self.sim.link_list[link_ID].get_other_ep(self.ID)
         
         # There have obviously been no consecutive routing packets on this link
         #   yet.
-        self.no_improves[link_name] = 0
+        self.no_improves[link_ID] = 0
         
 
     def transmit_config_packet(self, empty_list):
@@ -223,14 +243,15 @@ class Router:
                                 table is sent as data.
         
         Global Variables:   sim.flows (READ) 
-                                - Used to get the link we are putting Packet 
-                                on.
+                                - Used to get the routing Flow the Packet 
+                                belongs to.
         
         Limitations:        None.
         
         Known Bugs:         None.
         
         Revision History:   11/23/15: Created
+                            2026/10/18: Sends on link IDs.
         '''
         # This marks the start of configuration.
         self.configuring = True
@@ -238,11 +259,11 @@ class Router:
         # If there are still flows, the network is not done yet, and we should
         #   schedule the next routing send event.  The one flow that does not
         #   count here (why we use > 1) is the routing flow.
-        if len(sim.running_flows) > 1:
-            routing_time = sim.network_now() + ct.CONFIG_PKT_TIME
-            routing_event = e.Event(self.router_name, 
-                                    'transmit_config_packet', [])
-            sim.enqueue_event(routing_time, routing_event)
+        if len(self.sim.running_flows) > 1:
+            routing_time = self.sim.network_now() + \
+                           cv.ms_to_ticks(ct.CONFIG_PKT_TIME)
+            routing_event = e.Event(self.transmit_config_packet, [])
+            self.sim.enqueue_event(routing_time, routing_event)
             
         # Calculate the time distances to each host connected to this router 
         #   so we can broadcast the information
@@ -254,15 +275,16 @@ class Router:
             return
         
         # Send this packet onto each link on the router.
-        for link_name in self.links:
+        routing_flow = self.sim.flows[ct.ROUTING_FLOW]
+        for link_ID in self.links:
             
             # Get a unique packet ID for the routing flow.
-            pkt_ID = sim.flows[ct.ROUTING_FLOW].create_packet_ID()
+            pkt_ID = routing_flow.create_packet_ID()
 
             # Create the packet that we are going to send.  It doesn't need to 
             #   have a destination because its destination is everywhere.  
-            #   The source is the link name for ease when parsing it.
-            routing_pkt = p.Packet(pkt_ID, ct.ROUTING_FLOW, link_name,
+            #   The source is the link ID for ease when parsing it.
+            routing_pkt = p.Packet(pkt_ID, routing_flow.ID, link_ID,
                                     None, ct.PACKET_ROUTING)
 
             # The data that will be parsed is the table of current known
@@ -271,20 +293,21 @@ class Router:
 
             # Record the time of transmission for this packet so others can 
             #   update their routing table effectively.
-            routing_pkt.time = sim.network_now()
+            routing_pkt.time = self.sim.network_now()
 
             # Put the packet in the global dictionary of packets.
-            sim.packets[(ct.ROUTING_FLOW, routing_pkt.ID)] = routing_pkt
+            self.sim.add_packet(routing_pkt)
             
             # Send this packet on the link.
-            self.send_packet([routing_pkt, link_name])
+            self.send_packet([routing_pkt, link_ID])
             
         # After a certain amount of time, we will assume all routing packets 
         #   not received have been lost, and we should just switch routing 
         #   tables as is.
-        timeout_time = sim.network_now() + ct.ROUTING_TIMEOUT
-        timeout_ev = e.Event(self.router_name, 'switch_routing_tables', [])
-        sim.enqueue_event(timeout_time, timeout_ev)
+        timeout_time = self.sim.network_now() + \
+                       cv.ms_to_ticks(ct.ROUTING_TIMEOUT)
+        timeout_ev = e.Event(self.switch_routing_tables, [])
+        self.sim.enqueue_event(timeout_time, timeout_ev)
         
 
     def parse_config_packet(self, packet):
@@ -319,23 +342,24 @@ class Router:
         Known Bugs:         None.
         
         Revision History:   11/24/15: Created
+                            2026/10/18: Tables keyed by IDs.
         '''
         # Before doing anything else, if this contains information about a host
         #   that is not in the routing table, put it in right away.  We don't
         #   want to lose more packets to that host than we already have.
-        for host_name in packet.data:
-            if host_name not in self.routing_table:
-                self.routing_table[host_name] = copy.deepcopy(packet.src)
+        for host_ID in packet.data:
+            if host_ID not in self.routing_table:
+                self.routing_table[host_ID] = packet.src
         
         # Make sure this wasn't called by mistake.
         assert(packet.type == ct.PACKET_ROUTING)
         
         # We want to iterate through the data on the packet to see what can
         #   be updated on our updating routing table.
-        for host_name in packet.data:
+        for host_ID in packet.data:
             # Get the distance from what sent this packet and add it to the
             #   data.
-            packet.data[host_name] += self.get_distance(packet.src)
+            packet.data[host_ID] += self.get_distance(packet.src)
             
             if not self.configuring:
                 continue
@@ -343,14 +367,13 @@ class Router:
             # If it is not in our table yet, it is clearly an update.  If it
             #   is in our table and is an improvement, there must also be an
             #   update.
-            if host_name not in self.updating_table or \
-               packet.data[host_name] < self.distances[host_name]:
+            if host_ID not in self.updating_table or \
+               packet.data[host_ID] < self.distances[host_ID]:
                 # Have the table reflect the link this packet came from
-                self.updating_table[host_name] = copy.deepcopy(packet.src)
+                self.updating_table[host_ID] = packet.src
                 
                 # Update the distance known to that host.
-                self.distances[host_name] = copy.deepcopy(
-                                                    packet.data[host_name])
+                self.distances[host_ID] = packet.data[host_ID]
                 
                 # There have now been zero consecutive non-improvements on
                 #   this link.
@@ -367,26 +390,26 @@ class Router:
         # Check if we have received enough packets to determine we are in
         #   equilibrium, in which case we can switch routing tables.
         switch_tables = True
-        for link_name in self.no_improves:
-            if self.no_improves[link_name] < ct.MAX_NO_IMPROVES:
+        for link_ID in self.no_improves:
+            if self.no_improves[link_ID] < ct.MAX_NO_IMPROVES:
                 switch_tables = False
                        
         # If we received this without improvement, only send it if the num
         #   improves is less than the max.  Otherwise, we can assume the 
         #   system is in equilibrium
         if not switch_tables:#self.no_improves[packet.src] <= ct.MAX_NO_IMPROVES:
-            for link_name in self.links:
+            for link_ID in self.links:
                 # Copy the packet
-                updated_pkt = packet.copy_packet()
+                updated_pkt = packet.copy_packet(self.sim)
                 
                 # Change the source to be the link it will be sent on.
-                updated_pkt.src = link_name
+                updated_pkt.src = link_ID
                 
                 # Update the data.
                 updated_pkt.data = copy.deepcopy(self.distances)
                 
                 # Send the packet.
-                self.send_packet([updated_pkt, link_name])
+                self.send_packet([updated_pkt, link_ID])
         
         # If we never switched the flag to false, we have received enough
         #   packets to switch routing tables.
@@ -394,17 +417,17 @@ class Router:
             self.switch_routing_tables([])
         
         
-    def get_distance(self, link_name):
+    def get_distance(self, link_ID):
         '''
         Description:        This takes the argued Link and estimates the time 
                             it would take to send a Packet down this Link using 
                             the queue on this side of the Link, the Link 
                             capacity and the Link propagation delay.
         
-        Arguments:          link_name (string) 
-                                - A string representing the name of the Link 
-                                we are interested in.  This is used to index 
-                                the global dictionary of Link.
+        Arguments:          link_ID (integer) 
+                                - The ID of the Link we are interested in.  
+                                This is used to index the global list of 
+                                Link.
         
         Return Values:      (int) 
                                 - The time it would take to send a packet along
@@ -412,9 +435,9 @@ class Router:
         
         Shared Variables:   None.
         
-        Global Variables:   sim.links (READ) 
-                                - The argued Link name is used to get a Link 
-                                object from this dictionary.
+        Global Variables:   sim.link_list (READ) 
+                                - The argued Link ID is used to get a Link 
+                                object from this list.
         
         Limitations:        This uses the link buffer on this side of the 
                             Link to estimate the link buffer on the other side 
@@ -423,13 +446,15 @@ class Router:
         Known Bugs:         None.
         
         Revision History:   11/27/15: Created
+                            2026/10/18: Takes a link ID.
+                            2026/10/18: Converts seconds to ms correctly.
         '''
         # Get the link so we can retrieve information from it.
-        link = sim.links[link_name]
+        link = self.sim.link_list[link_ID]
                 
         # Otherwise, get the amount of data in the queue for this link
         #   so we can estimate the time it takes to send something here.
-        (data, num_pkts) = link.get_buffer_info(self.router_name)
+        (data, num_pkts) = link.get_buffer_info(self.ID)
         
         # We will now guess the "distance" to this router in units of time.
         #   This time is the propagation delay plus the queuing delay.  The
@@ -457,7 +482,7 @@ class Router:
         data /= ct.CONFIG_PKT_TIME # Puts it as a rate per millisecond.
         num_pkts *= 2
         num_pkts /= ct.CONFIG_PKT_TIME # Puts it as a rate per millisecond.
-        queuing_delay = (cv.KB_to_Mb(data) / link.rate) / 1000
+        queuing_delay = (cv.bytes_to_Mb(data) / link.rate) * 1000
         prop_delay = (num_pkts / ct.CONSEC_PKTS + 1) * link.delay
         return queuing_delay + prop_delay
         
@@ -490,6 +515,7 @@ class Router:
         Known Bugs:         None.
         
         Revision History:   11/26/15: Created
+                            2026/10/18: Uses link IDs.
         '''
         # If the new routing table is empty, do nothing.
         if not self.configuring:
@@ -497,14 +523,14 @@ class Router:
         
         # Fill any host entry in the routing table that is not in the updating
         #   table.
-        for host_name in self.routing_table:
-            if host_name not in self.updating_table:
-                self.updating_table[host_name] = self.routing_table[host_name]
+        for host_ID in self.routing_table:
+            if host_ID not in self.updating_table:
+                self.updating_table[host_ID] = self.routing_table[host_ID]
                 
         # Reset the data logger on the link so we can fill the table again.
-        for link_name in self.links:
-            link = sim.links[link_name]
-            link.reset_this_buffer(self.router_name)
+        for link_ID in self.links:
+            link = self.sim.link_list[link_ID]
+            link.reset_this_buffer(self.ID)
                         
         # Switch routing tables then clear the updating one for the next time
         #   around.
@@ -519,21 +545,21 @@ class Router:
         Description:        This sends a Packet from this Router onto the 
                             argued Link that is attached to it.
         
-        Arguments:          argument_list ([Packet, string]) 
+        Arguments:          argument_list ([Packet, int]) 
                                 - A list of arguments that is unpacked by the 
                                 function.  This is a list to facilitate class 
                                 definition.  The list should contain the 
-                                Packet being sent and the name of the Link it 
+                                Packet being sent and the ID of the Link it 
                                 will be sent on.
         
         Return Values:      None.
         
-        Shared Variables:   self.router_name (READ) 
-                                - This function uses the Router name so the 
+        Shared Variables:   self.ID (READ) 
+                                - This function uses the Router ID so the 
                                 Link knows where the Packet came from.
         
-        Global Variables:   sim.links (READ) 
-                                - The link name is used to index this and get
+        Global Variables:   sim.link_list (READ) 
+                                - The link ID is used to index this and get
                                 the Link.
         
         Limitations:        None.
@@ -545,17 +571,18 @@ class Router:
                             2015/11/14: Now just puts Packet on buffer.
                             2015/11/22: Copied from Host and adapted for 
                             Router.
+                            2026/10/18: Takes a link ID.
         '''
         # The argument list is just the packet.
-        [packet, link_name] = arg_list
-        link = sim.links[link_name]
+        [packet, link_ID] = arg_list
+        link = self.sim.link_list[link_ID]
         
         # Log the send_packet() event to ct.ROUTER_LOG_FILE
         self.log_send_packet(packet)
 
         # Give the packet to the link to handle.  Here, it will either be
         #   enqueued on a buffer or transmitted.
-        link.put_packet_on_buffer(self.router_name, packet)
+        link.put_packet_on_buffer(self.ID, packet)
 
 
     def receive_packet(self, arg_list):
@@ -565,19 +592,19 @@ class Router:
                             putting the Packet on the Link that leads to that 
                             destination.
         
-        Arguments:          arg_list ([string, int]) 
+        Arguments:          arg_list ([Packet]) 
                                 - A list of arguments that is unpacked by the 
                                 function.  This implementation is to 
                                 facilitate the event class.  The list should 
-                                contain the flow name and the packet ID.
+                                contain the Packet handed off by the Link.
         
         Return Values:      None.
         
         Shared Variables:   None.
         
-        Global Variables:   sim.packets (READ) 
-                                - This gets the packet instance from the 
-                                dictionary using the argued key.
+        Global Variables:   sim.packets (WRITE) 
+                                - The Packet is released from it unless it 
+                                is forwarded.
         
         Limitations:        None.
         
@@ -590,10 +617,13 @@ class Router:
                             2015/11/14: Responds according to packet type and 
                                         ID.
                             2015/11/22: Copied from Host and adapted to Router.
+                            2026/10/18: Releases the packet if it is done.
+                            2026/10/18: Takes the flow ID.
+                            2026/10/18: Takes the Packet itself.
+                            2026/10/18: TIME_BIT is converted to ticks.
         '''
         # Unpack the argument list.
-        [flow_name, packet_ID] = arg_list
-        packet = sim.packets[(flow_name, packet_ID)] 
+        [packet] = arg_list
 
         # Log the receive_packet() event to ct.ROUTER_LOG_FILE
         self.log_receive_packet(packet)
@@ -603,15 +633,21 @@ class Router:
         if packet.type == ct.PACKET_ROUTING:
             self.parse_config_packet(packet)
 
+            # The packet is only resent as copies, so it is done.
+            self.sim.release_packet(packet)
+
         # Use the routing table and the packet destination to decide where to
         #   send this packet.  If it is not in the list, then something went
         #   wrong and this packet will go lost.
         elif packet.dest in self.routing_table:
             # Send the packet on that link.
-            send_time = sim.network_now() + ct.TIME_BIT
-            send_ev = e.Event(self.router_name, 'send_packet',
-                                [packet, self.routing_table[packet.dest]])
-            sim.enqueue_event(send_time, send_ev)
+            send_time = self.sim.network_now() + cv.ms_to_ticks(ct.TIME_BIT)
+            send_ev = e.Event(self.send_packet,
+                              [packet, self.routing_table[packet.dest]])
+            self.sim.enqueue_event(send_time, send_ev)
+
+        else:
+            self.sim.release_packet(packet)
 
 
     def log_send_packet(self, packet):
@@ -641,39 +677,43 @@ class Router:
         Known Bugs:         None.
         
         Revision History:   2015/11/28: Created
+                            2026/10/18: Prints the names of IDs.
         '''
         if packet.type == ct.PACKET_DATA:
             snd_msg = "[%.5f]: Sending data packet from %s to %s.\n" \
-                        % (sim.network_now(), self.router_name, packet.dest)
-            sim.log_router.write(snd_msg)
-            sim.log_router.write("\tPacket ID: %d\n" % packet.ID)
-            sim.log_router.write("\tNext link: %s\n" % \
-                            self.routing_table[packet.dest])
+                        % (self.sim.network_now_ms(), self.router_name, 
+                           self.sim.endpoint_names[packet.dest])
+            self.sim.log_router.write(snd_msg)
+            self.sim.log_router.write("\tPacket ID: %d\n" % packet.ID)
+            self.sim.log_router.write("\tNext link: %s\n" % \
+                self.sim.link_list[self.routing_table[packet.dest]].link_name)
             # Data of Packet is just its index within the Flow
-            sim.log_router.write("\tData: %d\n" % packet.data)
+            self.sim.log_router.write("\tData: %d\n" % packet.data)
 
         elif packet.type == ct.PACKET_ACK: # it's an ack Packet
             snd_msg = "[%.5f]: Sending ack packet from %s to %s.\n" \
-                        % (sim.network_now(), self.router_name, packet.dest)
-            sim.log_router.write(snd_msg)
-            sim.log_router.write("\tPacket ID: %d\n" % packet.ID)
-            sim.log_router.write("\tNext link: %s\n" % \
-                            self.routing_table[packet.dest])
+                        % (self.sim.network_now_ms(), self.router_name, 
+                           self.sim.endpoint_names[packet.dest])
+            self.sim.log_router.write(snd_msg)
+            self.sim.log_router.write("\tPacket ID: %d\n" % packet.ID)
+            self.sim.log_router.write("\tNext link: %s\n" % \
+                self.sim.link_list[self.routing_table[packet.dest]].link_name)
             # Data of ack Packet should correspond with data of packet it is 
             # acknowleding, unless a packet is lost.  In any event, it's just
             # an integer
-            sim.log_router.write("\tData: %d\n" % packet.data)
+            self.sim.log_router.write("\tData: %d\n" % packet.data)
 
         else:
             # Destination of routing config packets is 'None'
             snd_msg = "[%.5f]: Sending routing config packet from %s.\n"\
-            % (sim.network_now(), self.router_name) 
-            sim.log_router.write(snd_msg)
-            sim.log_router.write("\tPacket ID: %d\n" % packet.ID)
+            % (self.sim.network_now_ms(), self.router_name) 
+            self.sim.log_router.write(snd_msg)
+            self.sim.log_router.write("\tPacket ID: %d\n" % packet.ID)
             # Data of Packet is a routing table
-            sim.log_router.write("\tData (Distances):\n")
+            self.sim.log_router.write("\tData (Distances):\n")
             for ep in packet.data: 
-                sim.log_router.write("\t\t%s : %s\n" % (ep, packet.data[ep]))
+                self.sim.log_router.write("\t\t%s : %s\n" % 
+                        (self.sim.endpoint_names[ep], packet.data[ep]))
 
 
     def log_receive_packet(self, packet):
@@ -703,39 +743,122 @@ class Router:
         Known Bugs:         None.
         
         Revision History:   2015/11/28: Created
+                            2026/10/18: Prints the names of IDs.
         '''
         if packet.type == ct.PACKET_DATA:
             rec_msg = "[%.5f]: Receiving data packet at %s sent from %s.\n" \
-                      % (sim.network_now(), self.router_name, packet.src)
-            sim.log_router.write(rec_msg)
-            sim.log_router.write("\tPacket ID: %d\n" % packet.ID)
-            sim.log_router.write("\tNext link: %s\n" % \
-                            self.routing_table[packet.dest])
+                      % (self.sim.network_now_ms(), self.router_name, 
+                         self.sim.endpoint_names[packet.src])
+            self.sim.log_router.write(rec_msg)
+            self.sim.log_router.write("\tPacket ID: %d\n" % packet.ID)
+            self.sim.log_router.write("\tNext link: %s\n" % \
+                self.sim.link_list[self.routing_table[packet.dest]].link_name)
             # Data of Packet is just its index within the Flow
-            sim.log_router.write("\tData: %d\n" % packet.data)
+            self.sim.log_router.write("\tData: %d\n" % packet.data)
 
         elif packet.type == ct.PACKET_ACK: # it's an ack Packet
             rec_msg = "[%.5f]: Receiving ack packet at %s sent from %s.\n" \
-                % (sim.network_now(), self.router_name, packet.src)
-            sim.log_router.write(rec_msg)
-            sim.log_router.write("\tPacket ID: %d\n" % packet.ID)
+                % (self.sim.network_now_ms(), self.router_name, 
+                   self.sim.endpoint_names[packet.src])
+            self.sim.log_router.write(rec_msg)
+            self.sim.log_router.write("\tPacket ID: %d\n" % packet.ID)
             if packet.dest in self.routing_table:
-                sim.log_router.write("\tNext link: %s\n" % \
-                                        self.routing_table[packet.dest])
+                self.sim.log_router.write("\tNext link: %s\n" % \
+                self.sim.link_list[self.routing_table[packet.dest]].link_name)
             # Data of ack Packet should correspond with data of packet it is 
             # acknowleding, unless a packet is lost.  In any event, it's just
             # an integer
-            sim.log_router.write("\tData: %d\n" % packet.data)
+            self.sim.log_router.write("\tData: %d\n" % packet.data)
 
         else: # it's a Routing Packet
             rec_msg = "[%.5f]: Receiving routing config packet at %s sent " \
-                  "from %s.\n" % (sim.network_now(), self.router_name, 
-                                  packet.src)
-            sim.log_router.write(rec_msg)
-            sim.log_router.write("\tPacket ID: %d\n" % packet.ID)
+                  "from %s.\n" % (self.sim.network_now_ms(), self.router_name, 
+                                  self.sim.link_list[packet.src].link_name)
+            self.sim.log_router.write(rec_msg)
+            self.sim.log_router.write("\tPacket ID: %d\n" % packet.ID)
             # Data of Packet is a routing table
-            sim.log_router.write("\tData (Distances):\n")
+            self.sim.log_router.write("\tData (Distances):\n")
             for ep in packet.data: 
-                sim.log_router.write("\t\t%s : %.5f\n" % (ep, packet.data[ep]))
+                self.sim.log_router.write("\t\t%s : %.5f\n" % 
+                        (self.sim.endpoint_names[ep], packet.data[ep]))
 
 
+############################################################################
+#                                                                          #
+#                             Routing Functions                            #
+#                                                                          #
+############################################################################
+
+
+def fill_static_routing_tables(sim):
+    '''
+    Description:        Fills the routing table of every Router with the
+                        shortest paths to the hosts, for static routing.
+                        The length of a Link is its delay plus the time it
+                        takes to transmit a data Packet on it (0.8192 ms at
+                        10 Mbps), so that a slow Link counts as longer than
+                        a fast one with the same delay.  Dijkstra's 
+                        algorithm is run from each host over the Links, and
+                        each Router it reaches sends to that host on the 
+                        Link it was reached by.  Packets are only passed on
+                        by Routers, so the paths do not go through other 
+                        hosts.
+
+    Arguments:          sim (Simulation)
+                            - The simulation whose network is routed.
+
+    Return Values:      None.
+
+    Shared Variables:   None.
+
+    Global Variables:   sim.endpoint_list (READ/WRITE)
+                            - The routing tables of the Routers are filled.
+
+                        sim.link_list (READ)
+                            - The Links the paths are made of.
+
+    Limitations:        The paths do not change with the load of the 
+                        network.  Of paths of equal length, the one through
+                        the endpoints and Links with the lowest IDs is used.
+
+    Known Bugs:         None.
+
+    Revision History:   2026/10/18: Created
+                        2026/10/18: The transmission time is a real cost.
+    '''
+    # The Links out of each endpoint, with their lengths, as (length, link
+    #   ID, endpoint ID at the other end).
+    neighbors = [[] for ep in sim.endpoint_list]
+    for link in sim.link_list:
+        length = link.delay + link.transmission_time(ct.PACKET_DATA_SIZE,
+                                                     link.rate)
+        neighbors[link.ep_IDs[0]].append((length, link.ID, link.ep_IDs[1]))
+        neighbors[link.ep_IDs[1]].append((length, link.ID, link.ep_IDs[0]))
+
+    for host in sim.endpoint_list:
+        if host.type != ct.TYPE_HOST:
+            continue
+
+        # Grow the tree of shortest paths to the host out from it.  The 
+        #   queue holds (distance, endpoint ID, ID of the Link towards the 
+        #   host), and an endpoint is done the first time it is popped.
+        done = set()
+        queue = [(0, host.ID, None)]
+        while len(queue) > 0:
+            (distance, ep_ID, link_ID) = heapq.heappop(queue)
+            if ep_ID in done:
+                continue
+            done.add(ep_ID)
+
+            # Only Routers pass packets on, so a path ends at any other
+            #   host.
+            ep = sim.endpoint_list[ep_ID]
+            if ep_ID != host.ID:
+                if ep.type != ct.TYPE_ROUTER:
+                    continue
+                ep.routing_table[host.ID] = link_ID
+
+            for (length, next_link_ID, next_ep_ID) in neighbors[ep_ID]:
+                if next_ep_ID not in done:
+                    heapq.heappush(queue, (distance + length, next_ep_ID,
+                                           next_link_ID))
@@ -0,0 +1,996 @@
+############################################################################
+#
+# Ricky Galliani, Tim Menninger, Rush Joshi, Schaeffer Reed
+# Network Simulator Project
+# CS 143 -- Fall 2015
+#
+# scheduler.py
+#
+# This contains the event schedulers, which are the data structures that
+# hold the pending events of a simulation.  Every scheduler holds entries
+# of the form (time, sequence number, Event) and hands them back in sorted
+# order.  The sequence numbers are unique, so no two entries ever compare
+# equal and the Events themselves are never compared.  All schedulers have
+# the same methods:
+#
+#     push(entry)         Adds an entry.
+#     pop()               Removes and returns the smallest entry.
+#     peek()              Returns the smallest entry without removing it.
+#     len(scheduler)      The number of entries held.
+#     entries()           A list of all entries held, in no particular order.
+#     rebuild(entries)    Replaces all entries held with the argued ones.
+#
+############################################################################
+
+
+############################################################################
+#                                                                          #
+#                               Imported Modules                           #
+#                                                                          #
+############################################################################
+
+# Import the constants
+import constants as ct
+
+# Import heapq library for the binary heap scheduler and for sampling.
+import heapq
+
+# Import bisect library to keep the buckets sorted.
+import bisect
+
+
+############################################################################
+#                                                                          #
+#                             Heap Scheduler Class                         #
+#                                                                          #
+############################################################################
+
+
+class HeapScheduler:
+
+    def __init__(self):
+        '''
+        Description:        Initialize an instance of HeapScheduler, which
+                            keeps the entries in a binary heap.  Pushing and
+                            popping are O(log n).
+
+        Arguments:          None.
+
+        Shared Variables:   self.heap (WRITE)
+                                - Initialized
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created from the heap queue of the
+                                        simulation.
+        '''
+        # Heap queue containing (time, seq, event) tuples
+        self.heap = []
+
+
+    def __len__(self):
+        return len(self.heap)
+
+
+    def push(self, entry):
+        '''
+        Description:        Adds an entry to the heap.
+
+        Arguments:          entry ((float, integer, Event))
+                                - The entry to add.
+
+        Return Values:      None.
+
+        Shared Variables:   self.heap (WRITE)
+                                - The entry is pushed onto it.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        heapq.heappush(self.heap, entry)
+
+
+    def pop(self):
+        '''
+        Description:        Removes and returns the smallest entry.
+
+        Arguments:          None.
+
+        Return Values:      ((float, integer, Event))
+                                - The smallest entry.
+
+        Shared Variables:   self.heap (WRITE)
+                                - The entry is popped from it.
+
+        Global Variables:   None.
+
+        Limitations:        The scheduler must not be empty.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        return heapq.heappop(self.heap)
+
+
+    def peek(self):
+        '''
+        Description:        Returns the smallest entry without removing it.
+
+        Arguments:          None.
+
+        Return Values:      ((float, integer, Event))
+                                - The smallest entry.
+
+        Shared Variables:   self.heap (READ)
+                                - The entry is at the root.
+
+        Global Variables:   None.
+
+        Limitations:        The scheduler must not be empty.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        return self.heap[0]
+
+
+    def entries(self):
+        '''
+        Description:        Returns a list of all of the entries held.
+
+        Arguments:          None.
+
+        Return Values:      (list)
+                                - The entries, in no particular order.
+
+        Shared Variables:   self.heap (READ)
+                                - Copied
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        return list(self.heap)
+
+
+    def rebuild(self, entries):
+        '''
+        Description:        Replaces the entries held with the argued ones.
+
+        Arguments:          entries (list)
+                                - The new entries, in any order.
+
+        Return Values:      None.
+
+        Shared Variables:   self.heap (WRITE)
+                                - Replaced
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        self.heap = list(entries)
+        heapq.heapify(self.heap)
+
+
+############################################################################
+#                                                                          #
+#                           Calendar Scheduler Class                       #
+#                                                                          #
+############################################################################
+
+
+class CalendarScheduler:
+
+    def __init__(self):
+        '''
+        Description:        Initialize an instance of CalendarScheduler, which
+                            keeps the entries in a calendar queue (R. Brown,
+                            1988).  Time is cut into "days" of equal width
+                            and the entries of a day go in the sorted bucket
+                            of that day modulo the number of buckets, like
+                            the days of a year on a desk calendar.  The number
+                            of buckets follows the number of entries and the
+                            day width follows the spacing of the soonest
+                            entries, so pushing and popping are O(1) on
+                            average.
+
+        Arguments:          None.
+
+        Shared Variables:   self.buckets (WRITE)
+                                - Initialized
+
+                            self.width (WRITE)
+                                - Initialized
+
+                            self.size (WRITE)
+                                - Initialized
+
+                            self.day (WRITE)
+                                - Initialized
+
+                            self.last_time (WRITE)
+                                - Initialized
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        # The buckets, each a sorted list of entries.
+        self.buckets = [[] for i in range(ct.CALENDAR_MIN_BUCKETS)]
+
+        # The width of a day in ticks of the simulation clock.
+        self.width = ct.CALENDAR_INITIAL_WIDTH
+
+        # The number of entries held.
+        self.size = 0
+
+        # The day the last popped entry was on.  No entry is on an earlier
+        #   day, so popping starts searching from here.
+        self.day = 0
+
+        # The time of the last popped entry, used to find the day again when
+        #   the width changes.
+        self.last_time = 0
+
+
+    def __len__(self):
+        return self.size
+
+
+    def day_of(self, time):
+        '''
+        Description:        Returns the day the argued time falls on.
+
+        Arguments:          time (float)
+                                - The time of an entry.
+
+        Return Values:      (integer)
+                                - The number of whole days before the time.
+
+        Shared Variables:   self.width (READ)
+                                - The width of a day.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        return int(time / self.width)
+
+
+    def push(self, entry):
+        '''
+        Description:        Adds an entry to the bucket of its day, doubling
+                            the number of buckets if there are more than two
+                            entries per bucket.
+
+        Arguments:          entry ((float, integer, Event))
+                                - The entry to add.
+
+        Return Values:      None.
+
+        Shared Variables:   self.buckets (WRITE)
+                                - The entry is inserted into one of them.
+
+                            self.size (WRITE)
+                                - Incremented
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        bucket = self.buckets[self.day_of(entry[0]) % len(self.buckets)]
+        bisect.insort(bucket, entry)
+        self.size += 1
+
+        if self.size > 2 * len(self.buckets):
+            self.resize(2 * len(self.buckets))
+
+
+    def soonest_bucket(self):
+        '''
+        Description:        Returns the bucket holding the smallest entry.
+                            Starting at the day of the last popped entry, this
+                            looks through the buckets day by day for an entry
+                            on that day.  If a whole year goes by without one,
+                            the soonest entry is far away, so the smallest
+                            bucket head is searched for directly.
+
+        Arguments:          None.
+
+        Return Values:      (list)
+                                - The bucket, whose first entry is the
+                                smallest.
+
+        Shared Variables:   self.buckets (READ)
+                                - Searched
+
+                            self.day (READ)
+                                - The day the search starts at.
+
+        Global Variables:   None.
+
+        Limitations:        The scheduler must not be empty.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        num_buckets = len(self.buckets)
+
+        # Look for an entry on each day of the next year.
+        for day in range(self.day, self.day + num_buckets):
+            day_bucket = self.buckets[day % num_buckets]
+            if len(day_bucket) > 0 and self.day_of(day_bucket[0][0]) <= day:
+                return day_bucket
+
+        # Otherwise, take the bucket with the smallest head.
+        return min((b for b in self.buckets if len(b) > 0),
+                   key=lambda b: b[0])
+
+
+    def pop(self):
+        '''
+        Description:        Removes and returns the smallest entry.  Halves
+                            the number of buckets if there are fewer than half
+                            an entry per bucket.
+
+        Arguments:          None.
+
+        Return Values:      ((float, integer, Event))
+                                - The smallest entry.
+
+        Shared Variables:   self.buckets (WRITE)
+                                - The entry is removed from one of them.
+
+                            self.day (WRITE)
+                                - Set to the day of the popped entry.
+
+                            self.last_time (WRITE)
+                                - Set to the time of the popped entry.
+
+                            self.size (WRITE)
+                                - Decremented
+
+        Global Variables:   None.
+
+        Limitations:        The scheduler must not be empty.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        entry = self.soonest_bucket().pop(0)
+        self.size -= 1
+        self.last_time = entry[0]
+        self.day = self.day_of(entry[0])
+
+        if self.size < len(self.buckets) / 2 and \
+           len(self.buckets) > ct.CALENDAR_MIN_BUCKETS:
+            self.resize(len(self.buckets) // 2)
+
+        return entry
+
+
+    def peek(self):
+        '''
+        Description:        Returns the smallest entry without removing it.
+
+        Arguments:          None.
+
+        Return Values:      ((float, integer, Event))
+                                - The smallest entry.
+
+        Shared Variables:   self.buckets (READ)
+                                - The entry is in one of them.
+
+        Global Variables:   None.
+
+        Limitations:        The scheduler must not be empty.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        return self.soonest_bucket()[0]
+
+
+    def entries(self):
+        '''
+        Description:        Returns a list of all of the entries held.
+
+        Arguments:          None.
+
+        Return Values:      (list)
+                                - The entries, in no particular order.
+
+        Shared Variables:   self.buckets (READ)
+                                - The entries are collected from them.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        return [entry for bucket in self.buckets for entry in bucket]
+
+
+    def rebuild(self, entries):
+        '''
+        Description:        Replaces the entries held with the argued ones.
+
+        Arguments:          entries (list)
+                                - The new entries, in any order.
+
+        Return Values:      None.
+
+        Shared Variables:   self.buckets (WRITE)
+                                - Refilled with the new entries.
+
+                            self.size (WRITE)
+                                - Set to the number of new entries.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        num_buckets = ct.CALENDAR_MIN_BUCKETS
+        while 2 * num_buckets < len(entries):
+            num_buckets *= 2
+
+        self.fill(num_buckets, entries)
+
+
+    def resize(self, num_buckets):
+        '''
+        Description:        Moves all of the entries into the argued number
+                            of buckets, picking a new day width on the way.
+
+        Arguments:          num_buckets (integer)
+                                - The new number of buckets.
+
+        Return Values:      None.
+
+        Shared Variables:   self.buckets (WRITE)
+                                - Replaced
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        self.fill(num_buckets, self.entries())
+
+
+    def fill(self, num_buckets, entries):
+        '''
+        Description:        Picks the day width from the spacing of the
+                            soonest entries and puts the argued entries into
+                            the argued number of buckets.  The width is three
+                            times the average spacing of the soonest entries,
+                            leaving out spacings over twice the average
+                            (Brown's heuristic), so a day holds a few entries.
+
+        Arguments:          num_buckets (integer)
+                                - The new number of buckets.
+
+                            entries (list)
+                                - The entries to put in the buckets.
+
+        Return Values:      None.
+
+        Shared Variables:   self.buckets (WRITE)
+                                - Replaced
+
+                            self.width (WRITE)
+                                - Recomputed, unless the entries are all at
+                                nearly the same time.
+
+                            self.size (WRITE)
+                                - Set to the number of entries.
+
+                            self.day (WRITE)
+                                - Recomputed with the new width.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        # Measure the spacing of the soonest entries.
+        soonest = heapq.nsmallest(ct.CALENDAR_SAMPLE_SIZE, entries)
+        gaps = [soonest[i + 1][0] - soonest[i][0]
+                for i in range(len(soonest) - 1)]
+        if len(gaps) > 0:
+            avg_gap = sum(gaps) / len(gaps)
+            close_gaps = [gap for gap in gaps if gap <= 2 * avg_gap]
+            width = 3 * sum(close_gaps) / len(close_gaps)
+            # Entries at the same time tell us nothing about the spacing.
+            if width > 0:
+                self.width = width
+
+        self.buckets = [[] for i in range(num_buckets)]
+        for entry in entries:
+            bucket = self.buckets[self.day_of(entry[0]) % num_buckets]
+            bucket.append(entry)
+        for bucket in self.buckets:
+            bucket.sort()
+
+        self.size = len(entries)
+        self.day = self.day_of(self.last_time)
+
+
+############################################################################
+#                                                                          #
+#                            Ladder Scheduler Class                        #
+#                                                                          #
+############################################################################
+
+
+class LadderScheduler:
+
+    def __init__(self):
+        '''
+        Description:        Initialize an instance of LadderScheduler, which
+                            keeps the entries in a ladder queue (W. T. Tang,
+                            R. S. M. Goh and I. L.-J. Thng, 2005).  Entries
+                            far in the future are appended to the unsorted
+                            "top" list.  When everything sooner has been
+                            popped, the top is spread over the buckets of a
+                            "rung", and any bucket holding too many entries
+                            is in turn spread over the finer buckets of a
+                            new rung below it.  Only small buckets are ever
+                            sorted, into the "bottom" list that entries are
+                            popped from.  Pushing and popping are O(1) on
+                            average, and unlike the calendar queue there is
+                            nothing to resize.
+
+        Arguments:          None.
+
+        Shared Variables:   self.top (WRITE)
+                                - Initialized
+
+                            self.top_min (WRITE)
+                                - Initialized
+
+                            self.top_max (WRITE)
+                                - Initialized
+
+                            self.top_start (WRITE)
+                                - Initialized
+
+                            self.rungs (WRITE)
+                                - Initialized
+
+                            self.bottom (WRITE)
+                                - Initialized
+
+                            self.bottom_pos (WRITE)
+                                - Initialized
+
+                            self.size (WRITE)
+                                - Initialized
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        # The unsorted entries at or after top_start, and the smallest and
+        #   largest of their times.
+        self.top = []
+        self.top_min = float('inf')
+        self.top_max = float('-inf')
+
+        # Entries at or after this time go in the top.  Until the top is
+        #   spread over a rung for the first time, everything does.
+        self.top_start = float('-inf')
+
+        # The rungs, coarsest first.  Each rung is a list of
+        #   [start time, bucket width, current bucket, buckets], where the
+        #   buckets before the current one have already been emptied.
+        self.rungs = []
+
+        # The sorted entries that are popped from, and the position of the
+        #   next one to pop.  Popped entries are cleared rather than removed
+        #   so popping does not have to move the rest of the list.
+        self.bottom = []
+        self.bottom_pos = 0
+
+        # The number of entries held.
+        self.size = 0
+
+
+    def __len__(self):
+        return self.size
+
+
+    def push(self, entry):
+        '''
+        Description:        Adds an entry to the top if it is far enough in
+                            the future, otherwise to the finest rung whose
+                            current bucket it is not before, otherwise to the
+                            bottom.
+
+        Arguments:          entry ((float, integer, Event))
+                                - The entry to add.
+
+        Return Values:      None.
+
+        Shared Variables:   self.top, self.rungs, self.bottom (WRITE)
+                                - The entry is added to one of them.
+
+                            self.size (WRITE)
+                                - Incremented
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        self.size += 1
+        time = entry[0]
+
+        if time >= self.top_start:
+            self.top.append(entry)
+            self.top_min = min(self.top_min, time)
+            self.top_max = max(self.top_max, time)
+            return
+
+        for rung in self.rungs:
+            [start, width, current, buckets] = rung
+            if time >= start + current * width:
+                self.bucket_of(rung, time).append(entry)
+                return
+
+        bisect.insort(self.bottom, entry, self.bottom_pos)
+
+
+    def pop(self):
+        '''
+        Description:        Removes and returns the smallest entry, refilling
+                            the bottom first if it is empty.
+
+        Arguments:          None.
+
+        Return Values:      ((float, integer, Event))
+                                - The smallest entry.
+
+        Shared Variables:   self.bottom (WRITE)
+                                - The entry is cleared from it.
+
+                            self.bottom_pos (WRITE)
+                                - Moved past the entry.
+
+                            self.size (WRITE)
+                                - Decremented
+
+        Global Variables:   None.
+
+        Limitations:        The scheduler must not be empty.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        if self.bottom_pos == len(self.bottom):
+            self.refill_bottom()
+
+        entry = self.bottom[self.bottom_pos]
+        self.bottom[self.bottom_pos] = None
+        self.bottom_pos += 1
+        self.size -= 1
+
+        return entry
+
+
+    def peek(self):
+        '''
+        Description:        Returns the smallest entry without removing it,
+                            refilling the bottom first if it is empty.
+
+        Arguments:          None.
+
+        Return Values:      ((float, integer, Event))
+                                - The smallest entry.
+
+        Shared Variables:   self.bottom (READ)
+                                - The entry is the next one in it.
+
+        Global Variables:   None.
+
+        Limitations:        The scheduler must not be empty.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        if self.bottom_pos == len(self.bottom):
+            self.refill_bottom()
+
+        return self.bottom[self.bottom_pos]
+
+
+    def refill_bottom(self):
+        '''
+        Description:        Refills the empty bottom with the soonest entries.
+                            The next nonempty bucket of the finest rung is
+                            sorted into the bottom, unless it is too big, in
+                            which case it is spread over a new finer rung
+                            first.  Rungs that run out of buckets are removed,
+                            and if there are no rungs left the top is spread
+                            over a new rung.
+
+        Arguments:          None.
+
+        Return Values:      None.
+
+        Shared Variables:   self.top, self.rungs, self.bottom (WRITE)
+                                - Entries are moved down the ladder.
+
+                            self.bottom_pos (WRITE)
+                                - Reset to the start of the bottom.
+
+        Global Variables:   None.
+
+        Limitations:        The scheduler must not be empty.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        self.bottom = []
+        self.bottom_pos = 0
+
+        while len(self.bottom) == 0:
+            if len(self.rungs) == 0:
+                self.spread_top()
+                continue
+
+            # Find the next nonempty bucket of the finest rung.
+            rung = self.rungs[-1]
+            [start, width, current, buckets] = rung
+            while current < len(buckets) and len(buckets[current]) == 0:
+                current += 1
+            if current == len(buckets):
+                self.rungs.pop()
+                continue
+
+            # This bucket is done with as far as this rung goes.
+            bucket = buckets[current]
+            buckets[current] = []
+            rung[2] = current + 1
+
+            times = [entry[0] for entry in bucket]
+            if len(bucket) > ct.LADDER_THRESHOLD and \
+               len(self.rungs) < ct.LADDER_MAX_RUNGS and \
+               min(times) < max(times):
+                self.add_rung(bucket, start + current * width, width)
+            else:
+                bucket.sort()
+                self.bottom = bucket
+
+
+    def spread_top(self):
+        '''
+        Description:        Spreads the entries of the top over a new rung
+                            and starts a new, empty top after them.
+
+        Arguments:          None.
+
+        Return Values:      None.
+
+        Shared Variables:   self.top (WRITE)
+                                - Emptied
+
+                            self.top_start (WRITE)
+                                - Set to the largest time in the old top.
+
+                            self.rungs (WRITE)
+                                - A rung is added.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        entries = self.top
+        start = self.top_min
+        span = self.top_max - self.top_min
+
+        # Entries pushed from now on at or after the largest time go in the
+        #   top.  Those at exactly this time were pushed later than the ones
+        #   here, so they belong after them anyway.
+        self.top_start = self.top_max
+        self.top = []
+        self.top_min = float('inf')
+        self.top_max = float('-inf')
+
+        if span == 0:
+            # All at the same time, so there is nothing to spread.
+            entries.sort()
+            self.bottom = entries
+        else:
+            self.add_rung(entries, start, span)
+
+
+    def add_rung(self, entries, start, span):
+        '''
+        Description:        Adds a finer rung below the others that covers
+                            the argued span of time with one bucket per entry
+                            and spreads the argued entries over it.
+
+        Arguments:          entries (list)
+                                - The entries to spread over the rung.
+
+                            start (float)
+                                - The start of the time covered.
+
+                            span (float)
+                                - The length of the time covered.
+
+        Return Values:      None.
+
+        Shared Variables:   self.rungs (WRITE)
+                                - The rung is added.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        width = span / len(entries)
+        rung = [start, width, 0, [[] for entry in entries]]
+        self.rungs.append(rung)
+
+        for entry in entries:
+            self.bucket_of(rung, entry[0]).append(entry)
+
+
+    def bucket_of(self, rung, time):
+        '''
+        Description:        Returns the bucket of the argued rung that the
+                            argued time falls in.  Rounding can put a time
+                            just outside of the buckets that are left, so the
+                            bucket number is clamped to them.
+
+        Arguments:          rung (list)
+                                - The rung to find the bucket in.
+
+                            time (float)
+                                - The time of an entry.
+
+        Return Values:      (list)
+                                - The bucket.
+
+        Shared Variables:   None.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        [start, width, current, buckets] = rung
+        index = int((time - start) / width)
+        return buckets[min(max(index, current), len(buckets) - 1)]
+
+
+    def entries(self):
+        '''
+        Description:        Returns a list of all of the entries held.
+
+        Arguments:          None.
+
+        Return Values:      (list)
+                                - The entries, in no particular order.
+
+        Shared Variables:   self.top, self.rungs, self.bottom (READ)
+                                - The entries are collected from them.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        entries = self.top + self.bottom[self.bottom_pos:]
+        for rung in self.rungs:
+            for bucket in rung[3]:
+                entries.extend(bucket)
+
+        return entries
+
+
+    def rebuild(self, entries):
+        '''
+        Description:        Replaces the entries held with the argued ones,
+                            which all start out in the top.
+
+        Arguments:          entries (list)
+                                - The new entries, in any order.
+
+        Return Values:      None.
+
+        Shared Variables:   self.top, self.rungs, self.bottom (WRITE)
+                                - Replaced
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        self.__init__()
+        for entry in entries:
+            self.push(entry)
+
+
+# The schedulers by the name they are selected with.
+SCHEDULERS = {
+    'heap'     : HeapScheduler,
+    'calendar' : CalendarScheduler,
+    'ladder'   : LadderScheduler
+}
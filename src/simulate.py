@@ -6,8 +6,8 @@
 #
 # simulate.py
 #
-# This module contains functions that are required to carry out a network 
-# simulation.
+# This module contains the simulation class, which owns everything that is
+# required to carry out a network simulation, and the script that runs one.
 #
 ############################################################################
 
@@ -21,6 +21,11 @@
 import sys
 from sys import stdout
 import time
+import argparse
+import itertools
+import pickle
+import os
+import traceback
 
 # Import network objects
 import packet as p
@@ -39,291 +44,1245 @@ import utility as u
 
 # Import functions to carry out the simulation
 import status as s
+import fluid as fl
 
 # Import the config parser
 import config_parser as cp
 
-# Import heapq library so we can use it for our events.
-import heapq
+# Import the event schedulers
+import scheduler as sc
 
 
 ############################################################################
 #                                                                          #
-#                               Global Variables                           #
+#                               Simulation Class                           #
 #                                                                          #
 ############################################################################
 
-# Global variables containing objects in the network as well as events.
-packets     = {} # Packets in the system
-links       = {} # Links in the network
-endpoints   = {} # Hosts and routers in the network
-flows       = {} # Flows of data in the network
+class Simulation:
 
-running_flows = [] # Flows that have packets still to send.
+    def __init__(self, in_scheduler=ct.DEFAULT_SCHEDULER, in_quiet=False,
+                 in_output_directory=ct.OUTPUT_DIRECTORY,
+                 in_routing=ct.DEFAULT_ROUTING):
+        '''
+        Description:        Initialize an instance of Simulation, which owns
+                            the clock, the event queue, the network objects,
+                            the log files and the network recordings of one
+                            simulation.  Every network object holds the
+                            Simulation it is a part of, so any number of them
+                            can exist in one interpreter.
 
-event_queue = [] # Heap queue containing (time, event) tuples
+        Arguments:          in_scheduler (string)
+                                - The name of the scheduler that holds the
+                                event queue (a key of scheduler.SCHEDULERS).
 
-# We cannot have duplicate entries for time, so we must keep a "count" of
-#   entries so we have a "tie breaker"
-ev_time_dict = {}
+                            in_quiet (boolean)
+                                - True if the progress of the simulation
+                                should not be printed.
 
-# A file to log output
-log_host = open(ct.HOST_LOG_FILE, 'w')
-log_router = open(ct.ROUTER_LOG_FILE, 'w')
-log_flow = open(ct.FLOW_LOG_FILE, 'w')
-log_main = open(ct.MAIN_LOG_FILE, 'w')
+                            in_output_directory (string)
+                                - The directory the log files and the data
+                                files are written to, in its log and data
+                                directories.
 
-# The time of the network in simulated milliseconds.
-network_time = 0
+                            in_routing (string)
+                                - ct.ROUTING_DYNAMIC if the routers fill 
+                                their routing tables with routing packets, 
+                                or ct.ROUTING_STATIC if the shortest paths 
+                                are worked out once when the network is 
+                                loaded.
 
-# The number of network recordings being taken by the simulation.
-network_recordings = 0    
+        Shared Variables:   self.packets (WRITE)
+                                - Initialized
 
-############################################################################
-#                                                                          #
-#                           Simulator Functions                            #
-#                                                                          #
-############################################################################
+                            self.links (WRITE)
+                                - Initialized
 
-def run_network():
-    '''
-    Description:        Starts the loop that will run the network.  This loop 
-                        will run either until there are no more events (which 
-                        means the network either failed or completed 
-                        successfully) or until the maximum simulation time is 
-                        reached.  This starts by creating initial events and 
-                        then the loop is fueled by functions adding events.
+                            self.endpoints (WRITE)
+                                - Initialized
 
-    Arguments:          None.
+                            self.flows (WRITE)
+                                - Initialized
 
-    Return Values:      None.
+                            self.link_list, self.endpoint_list,
+                            self.endpoint_names, self.flow_list (WRITE)
+                                - Initialized
 
-    Global Variables:   network_time (WRITE) 
-                            - Updated to show current time.
-                      
-                        event_queue (WRITE) 
-                            - Updated to have next events.
+                            self.running_flows (WRITE)
+                                - Initialized
 
-    Limitations:        None.
+                            self.event_queue (WRITE)
+                                - Initialized
 
-    Known Bugs:         None.
+                            self.event_seq (WRITE)
+                                - Initialized
 
-    Revision History:   2015/10/22: Created as main()
-                        2015/10/29: Changed to run_network and filled in more 
-                                    than print functions.
-                        2015/11/17: Restyled and neatened it up
-                        2015/11/18: Adding halting condition for network 
-    '''
-    
-    # Declare that we are using/changing the global variable.
-    global network_time
-    
-    # Create the initial events, which is the start of each flow.
-    create_initial_events()
-
-    # Iterate through the event queue until it is empty.
-    while len(event_queue) > 0:
-        # Pop the next event.
-        [event_time, unused, event] = heapq.heappop(event_queue)
-        
-        # Advance the network time to the event time.
-        network_time = event_time
-        
-        # If we exceeded the maximum network running time, stop simulating.
-        if network_time >= ct.MAX_SIMULATION_TIME:
-            print ("\n +----------------------------------+\n",
-                      "|              WARNING             |\n",
-                      "|                                  |\n",
-                      "| Maximum simulation time reached. |\n",
-                      "| Aborting...                      |\n",
-                      "|                                  |\n",
-                      "+----------------------------------+\n")
+                            self.num_cancelled (WRITE)
+                                - Initialized
+
+                            self.output_directory (WRITE)
+                                - Initialized
+
+                            self.log_host, self.log_router, self.log_flow,
+                            self.log_main (WRITE)
+                                - Opened
+
+                            self.network_time (WRITE)
+                                - Initialized
+
+                            self.network_recordings (WRITE)
+                                - Initialized
+
+                            self.quiet (WRITE)
+                                - Initialized
+
+                            self.routing (WRITE)
+                                - Initialized
+
+                            self.packets_total (WRITE)
+                                - Initialized
+
+                            self.packets_done (WRITE)
+                                - Initialized
+
+                            self.peak_packets (WRITE)
+                                - Initialized
+
+                            self.packets_released (WRITE)
+                                - Initialized
+
+                            self.last_progress_print (WRITE)
+                                - Initialized
+
+                            self.started (WRITE)
+                                - Initialized
+
+                            self.status (WRITE)
+                                - Initialized
+
+                            self.fluid (WRITE)
+                                - Initialized
+
+        Global Variables:   None.
+
+        Limitations:        Simulations with the same output directory 
+                            write to the same output files.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created from the global variables of
+                                        this module.
+                            2026/10/18: Can route statically.
+        '''
+        # Objects in the network as well as events.
+        self.packets     = {} # Packets in the system
+        self.links       = {} # Links in the network
+        self.endpoints   = {} # Hosts and routers in the network
+        self.flows       = {} # Flows of data in the network
+
+        # The names of the network objects are interned to dense integer IDs
+        #   when the network is loaded, and these lists are indexed by them.
+        #   The objects refer to each other by ID; the dictionaries above and
+        #   the names are only used to load the network and for the output.
+        self.link_list      = [] # Links by ID
+        self.endpoint_list  = [] # Hosts and routers by ID
+        self.endpoint_names = [] # Names of the hosts and routers by ID
+        self.flow_list      = [] # Flows by ID
+
+        self.running_flows = [] # Flows that have packets still to send.
+
+        # Scheduler holding (time, seq, event) tuples
+        self.event_queue = sc.SCHEDULERS[in_scheduler]()
+
+        # We cannot have duplicate entries for time, so every entry gets the
+        #   next number of this counter as a "tie breaker".  Events at the
+        #   same time then run in the order they were enqueued.
+        self.event_seq = itertools.count()
+
+        # The number of cancelled events still sitting in the event queue.
+        self.num_cancelled = 0
+
+        # Where the output goes.
+        self.output_directory = in_output_directory
+        for directory in (ct.LOG_DIRECTORY, ct.DATA_DIRECTORY):
+            os.makedirs(u.output_path(self.output_directory, directory),
+                        exist_ok=True)
+
+        # A file to log output
+        self.log_host = open(u.output_path(self.output_directory,
+                                           ct.HOST_LOG_FILE), 'w')
+        self.log_router = open(u.output_path(self.output_directory,
+                                             ct.ROUTER_LOG_FILE), 'w')
+        self.log_flow = open(u.output_path(self.output_directory,
+                                           ct.FLOW_LOG_FILE), 'w')
+        self.log_main = open(u.output_path(self.output_directory,
+                                           ct.MAIN_LOG_FILE), 'w')
+
+        # The time of the network in ticks of the simulation clock 
+        #   (nanoseconds).  It is an integer, so that events that happen at 
+        #   the same time have exactly the same time.
+        self.network_time = 0
+
+        # The number of network recordings being taken by the simulation.
+        self.network_recordings = 0
+
+        # Whether to leave out printing the progress of the simulation.
+        self.quiet = in_quiet
+
+        # Whether the routing tables are filled by routing packets or once
+        #   with static shortest paths.
+        self.routing = in_routing
+
+        # The number of data packets the flows have to deliver, and how many
+        #   of them are done so far.  A packet is done once it has been
+        #   acknowledged or its flow has finished.
+        self.packets_total = 0
+        self.packets_done = 0
+
+        # For debugging the packet lifetimes: the most packets there have
+        #   been in the network at once and the number released so far.  The
+        #   packets in the network now are the ones in self.packets.
+        self.peak_packets = 0
+        self.packets_released = 0
+
+        # The real time the progress was last printed.
+        self.last_progress_print = 0
+
+        # Whether the initial events have been created, so a simulation that
+        #   is resumed does not create them again.
+        self.started = False
+
+        # The recordings of the network and the data files they go to.
+        self.status = s.Status(self)
+
+        # The model that moves the data of the fluid flows.
+        self.fluid = fl.FluidModel(self)
+
+
+    def load_network(self, network_file):
+        '''
+        Description:        Loads the network objects described by the argued
+                            config file into this simulation.
+
+        Arguments:          network_file (string)
+                                - The relative file name of the network
+                                topology config file.
+
+        Return Values:      None.
+
+        Shared Variables:   self.endpoints, self.links, self.flows,
+                            self.packets (WRITE)
+                                - Filled by the config parser.
+
+                            self.link_list, self.endpoint_list,
+                            self.endpoint_names, self.flow_list (WRITE)
+                                - Filled by the config parser.
+
+                            self.packets_total (WRITE)
+                                - The data packets of the new flows are
+                                added to it.
+
+                            self.routing (READ)
+                                - With static routing, the routing tables 
+                                of the routers are filled.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+                            2026/10/18: Fills the static routing tables.
+        '''
+        cp.load_network_objects(self, network_file)
+
+        # With static routing, the routing tables are filled once and for 
+        #   all, here.
+        if self.routing == ct.ROUTING_STATIC:
+            r.fill_static_routing_tables(self)
+
+        for flow in self.flows.values():
+            if flow.flow_name != ct.ROUTING_FLOW:
+                self.packets_total += int(cv.MB_to_bytes(flow.size) /
+                                          ct.PACKET_DATA_SIZE)
+
+
+    def run_network(self, stop_time=None):
+        '''
+        Description:        Starts the loop that will run the network.  This
+                            loop will run either until there are no more
+                            events (which means the network either failed or
+                            completed successfully), until the maximum
+                            simulation time is reached or until the argued
+                            stop time.  This starts by creating initial
+                            events the first time it is called and then the
+                            loop is fueled by functions adding events.  When
+                            it stops at the stop time, calling it again
+                            carries on where it stopped.  All of the
+                            events of a time are taken from the queue at
+                            once and run in the order they were enqueued,
+                            followed by the events they enqueued for that
+                            same time, so the order is the same as popping
+                            them one at a time.
+
+        Arguments:          stop_time (float)
+                                - The time in milliseconds to stop before.
+                                Events at this time or later are left in the
+                                queue.  None to run to the end.
+
+        Return Values:      None.
+
+        Shared Variables:   self.network_time (WRITE)
+                                - Updated to show current time.
+
+                            self.event_queue (WRITE)
+                                - Updated to have next events.
+
+                            self.started (WRITE)
+                                - Set once the initial events are created.
+
+        Global Variables:   None.
+
+        Limitations:        Nothing is printed in quiet mode.
+
+        Known Bugs:         None.
+
+        Revision History:   2015/10/22: Created as main()
+                            2015/10/29: Changed to run_network and filled in
+                                        more than print functions.
+                            2015/11/17: Restyled and neatened it up
+                            2015/11/18: Adding halting condition for network
+                            2026/10/18: Runs all of the events of a time as a
+                                        batch.
+                            2026/10/18: Can stop at a time and be resumed.
+                            2026/10/18: The clock counts integer ticks.
+                            2026/10/18: The warning is not printed in quiet
+                                        mode.
+        '''
+        # Create the initial events, which is the start of each flow.
+        if not self.started:
+            self.create_initial_events()
+            self.started = True
+
+        # The times to stop at, in ticks.
+        if stop_time is not None:
+            stop_time = cv.ms_to_ticks(stop_time)
+        max_time = cv.ms_to_ticks(ct.MAX_SIMULATION_TIME)
+
+        # Iterate through the event queue until it is empty.
+        while len(self.event_queue) > 0:
+            # Leave the rest of the events for later if it is time to stop.
+            if stop_time is not None and \
+               self.event_queue.peek()[0] >= stop_time:
+                return
+
+            # Pop the next event and every other event at the same time.
+            [event_time, unused, event] = self.event_queue.pop()
+            event_batch = [event]
+            while len(self.event_queue) > 0 and \
+                  self.event_queue.peek()[0] == event_time:
+                event_batch.append(self.event_queue.pop()[2])
+
+            # Advance the network time to the event time.
+            self.network_time = event_time
+
+            # If we exceeded the maximum network running time, stop
+            #   simulating.
+            if self.network_time >= max_time:
+                if not self.quiet:
+                    print ("\n +----------------------------------+\n",
+                              "|              WARNING             |\n",
+                              "|                                  |\n",
+                              "| Maximum simulation time reached. |\n",
+                              "| Aborting...                      |\n",
+                              "|                                  |\n",
+                              "+----------------------------------+\n")
+                self.print_progress_status()
+                return
+
+            for event in event_batch:
+                # The event counts as queued until it runs, so the events
+                #   before it in the batch can still cancel it.
+                event.queued = False
+
+                # Cancelled events are left in the queue until they come up,
+                #   and then they are simply dropped.
+                if event.cancelled:
+                    self.num_cancelled -= 1
+                    continue
+
+                # Extract the information about the event so we can execute
+                #   it.  The function is already bound to the actor carrying
+                #   it out.
+                (event_function, event_parameters) = event.get_elements()
+
+                # Call the event function with its parameters
+                event_function(event_parameters)
+
+            # Only print the progress every so often, it is not worth
+            #   slowing the simulation down for.
+            if time.time() - self.last_progress_print >= \
+               ct.PROGRESS_PERIOD / 1000:
+                self.print_progress_status()
+
+        # Show where the simulation ended up.
+        self.print_progress_status()
+
+
+    def print_progress_status(self):
+        '''
+        Description:        Prints the percentage of the data packets of all
+                            of the flows that are done, over the last
+                            progress printed.
+
+        Arguments:          None.
+
+        Return Values:      None.
+
+        Shared Variables:   self.packets_total (READ)
+                                - The number of packets to deliver.
+
+                            self.packets_done (READ)
+                                - The number of packets done.
+
+                            self.last_progress_print (WRITE)
+                                - Set to the current real time.
+
+        Global Variables:   None.
+
+        Limitations:        Nothing is printed in quiet mode.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created from
+                                        compute_and_print_progress_status,
+                                        which counted sent rather than
+                                        acknowledged packets and only for
+                                        flows that had started.
+        '''
+        self.last_progress_print = time.time()
+        if self.quiet or self.packets_total == 0:
             return
-        
-        # Extract the information about the next event so we can execute it.
-        (actor_name, function_name, event_parameters) = event.get_elements()
-        
-        # If there is no actor, then this event is asking to record network
-        #   status.
-        if actor_name == None:
-            s.record_network_status()
-        else:
-            # Retrieve the actor and the function it will perform on the 
-            # network
-            actor, event = u.get_actor_and_function(actor_name, function_name)
-
-            # Call the event function with the correct actor and parameters
-            event(actor, event_parameters)
-
-        compute_and_print_progress_status()
-
-
-def compute_and_print_progress_status():
-    '''
-    '''
-    total_pkts = 0
-    total_progress = 0
-    for flow in flows.values():
-        if flow.flow_name != ct.ROUTING_FLOW:
-            num_flow_pkts = int(cv.MB_to_bytes(flow.size) /ct.PACKET_DATA_SIZE) 
-            total_pkts += num_flow_pkts
-            if network_now() > flow.start_time:
-                total_progress += num_flow_pkts - len(flow.packets_to_send)
-    
-    # Dynamically update user of Simulation Progress
-    progress_msg = "Simulation Progress: %.1f%%" \
-                                    % (100 * (total_progress / total_pkts))
-    stdout.write("\r" + progress_msg)
-    stdout.flush()
-
-
-def network_now():
-    '''
-    Description:        Returns the current simulation time in milliseconds.
 
-    Arguments:          None.
+        # Dynamically update user of Simulation Progress
+        progress_msg = "Simulation Progress: %.1f%%" \
+                       % (100 * self.packets_done / self.packets_total)
+        stdout.write("\r" + progress_msg)
+        stdout.flush()
 
-    Return Values:      (integer) 
-                            - The number of milliseconds since the network
-                            simulation began.
 
-    Global Variables: None.
+    def network_now(self):
+        '''
+        Description:        Returns the current simulation time in ticks of
+                            the simulation clock (nanoseconds).
 
-    Limitations:      None.
+        Arguments:          None.
 
-    Known Bugs:       None.
+        Return Values:      (integer)
+                                - The number of ticks since the network
+                                simulation began.
 
-    Revision History: 2015/11/02: Created
-    '''
-    return network_time
+        Shared Variables:   self.network_time (READ)
+                                - Returned
 
+        Global Variables:   None.
 
-def create_initial_events():
-    '''
-    Description:        This takes the flows and creates the initial events for
-                        them.  The initial Event will be the same for all Flow
-                        objects, but the time of the event will depend on the 
-                        Flow start time.
+        Limitations:        None.
 
-    Arguments:          None.
+        Known Bugs:         None.
 
-    Return Values:      None.
+        Revision History:   2015/11/02: Created
+                            2026/10/18: In ticks.
+        '''
+        return self.network_time
 
-    Global Variables:   event_queue (WRITE) 
-                            - The event_queue heapqueue has the initial Flow 
-                            events enqueued.
 
-    Limitations:        None.
+    def network_now_ms(self):
+        '''
+        Description:        Returns the current simulation time in
+                            milliseconds, for the output.
 
-    Known Bugs:         None.
+        Arguments:          None.
+
+        Return Values:      (float)
+                                - The number of milliseconds since the 
+                                network simulation began.
+
+        Shared Variables:   self.network_time (READ)
+                                - Converted and returned
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        return cv.ticks_to_ms(self.network_time)
+
+
+    def get_summary(self):
+        '''
+        Description:        Returns a summary of the simulation so far: the
+                            network time and, for each flow, its average
+                            throughput from its start until it finished (or
+                            until now), the fraction of its data packets
+                            dropped by full link buffers and the mean round
+                            trip time of its acknowledged packets.
+
+        Arguments:          None.
+
+        Return Values:      (dictionary)
+                                - 'network_time' is the elapsed network time
+                                in seconds and 'flows' maps each flow name
+                                to a dictionary of its 'throughput' (Mbps),
+                                'loss' (fraction) and 'delay' (ms).  A
+                                measure that cannot be computed yet is None.
+
+        Shared Variables:   self.flows (READ)
+                                - The totals of the flows are read.
+
+                            self.network_recordings (READ)
+                                - Used for the network time.
+
+        Global Variables:   None.
+
+        Limitations:        The throughput only counts data acknowledged in
+                            order, and the delay is the round trip time, as
+                            in the packet delay recordings.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        flows = {}
+        for flow_name in sorted(self.flows):
+            flow = self.flows[flow_name]
+            if flow_name == ct.ROUTING_FLOW:
+                continue
+
+            # Every packet before the one to complete has been acked.
+            end_time = flow.finish_time
+            if end_time is None:
+                end_time = self.network_now()
+            duration = cv.ticks_to_ms(end_time - flow.start_time) / 1000
+            acked_Mb = (flow.to_complete - 1) * ct.PACKET_DATA_SIZE * 8 / 1e6
+
+            flows[flow_name] = {
+                'throughput' : (acked_Mb / duration
+                                if duration > 0 else None),
+                'loss'       : (flow.packets_lost / flow.packets_sent
+                                if flow.packets_sent > 0 else None),
+                'delay'      : (flow.delay_sum / flow.delay_count
+                                if flow.delay_count > 0 else None)}
+
+        return {'network_time' : (self.network_recordings * ct.RECORD_TIME
+                                  / 1000),
+                'flows'        : flows}
+
+
+    def add_packet(self, packet):
+        '''
+        Description:        Puts a new packet in the dictionary of packets in
+                            the network, where the links and endpoints look 
+                            it up by its flow name and ID.
+
+        Arguments:          packet (Packet)
+                                - The new packet.
+
+        Return Values:      None.
+
+        Shared Variables:   self.packets (WRITE)
+                                - The packet is added.
+
+                            self.peak_packets (WRITE)
+                                - Raised if there are now more packets than
+                                ever before.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        self.packets[(packet.flow, packet.ID)] = packet
+        if len(self.packets) > self.peak_packets:
+            self.peak_packets = len(self.packets)
+
+
+    def release_packet(self, packet):
+        '''
+        Description:        Takes a packet out of the dictionary of packets
+                            in the network once it is done: it was dropped, 
+                            it reached its host, or it was a routing packet 
+                            that was parsed or a packet that could not be 
+                            routed.  Nothing looks it up by its key after 
+                            this, so the packet is freed once whatever still
+                            holds it (the packets in flight of its flow, say)
+                            lets it go.
+
+        Arguments:          packet (Packet)
+                                - The packet that is done.
+
+        Return Values:      None.
+
+        Shared Variables:   self.packets (WRITE)
+                                - The packet is removed.
+
+                            self.packets_released (WRITE)
+                                - Incremented
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        del self.packets[(packet.flow, packet.ID)]
+        self.packets_released += 1
+
+
+    def create_initial_events(self):
+        '''
+        Description:        This takes the flows and creates the initial
+                            events for them.  The initial Event will be the
+                            same for all Flow objects, but the time of the
+                            event will depend on the Flow start time.
+
+        Arguments:          None.
+
+        Return Values:      None.
+
+        Shared Variables:   self.event_queue (WRITE)
+                                - The event queue has the initial Flow
+                                events enqueued.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2015/11/02: Created
+                            2026/10/18: No routing packets with static 
+                                        routing.
+                            2026/10/18: TIME_BIT is converted to ticks.
+        '''
+        # Create the event that will record the network status.
+        self.enqueue_event(self.network_now(),
+                           e.Event(self.status.record_network_status, []))
+
+        # Create an event for each flow.
+        for flow_name in self.flows:
+            # Add the flow to our list of running flows.
+            self.running_flows.append(flow_name)
+
+            # If this is the routing flow, don't call start flow.  We will
+            #   handle the routing flow separately.
+            if flow_name == ct.ROUTING_FLOW:
+                continue
+
+            # Create the event for the flow starting.  There are no arguments,
+            # but the event class expects an argument list.
+            flow_event = e.Event(self.flows[flow_name].start_flow, [])
+
+            # Enqueue the event in our heap queue.
+            self.enqueue_event(self.flows[flow_name].start_time, flow_event)
 
-    Revision History:   2015/11/02: Created
-    '''    
-    # Create the event that will record the network status.
-    enqueue_event(network_now(), e.Event(None, None, None))
-    
-    # Create an event for each flow.
-    for flow_name in flows:
-        # Add the flow to our list of running flows.
-        running_flows.append(flow_name)
-        
-        # If this is the routing flow, don't call start flow.  We will handle
-        #   the routing flow separately.
-        if flow_name == ct.ROUTING_FLOW:
-            continue
-         
-        # Create the event for the flow starting.  There are no arguments, 
-        # but the event class expects an argument list.
-        flow_event = e.Event(flow_name, 'start_flow', [])
-        
-        # Enqueue the event in our heap queue.
-        enqueue_event(flows[flow_name].start_time, flow_event)
-        
-    for ep_name in endpoints:
-        # Get the link from the dictionary.
-        ep = endpoints[ep_name]
-        
-        # Only want to create events for routers...
-        if ep.type != ct.TYPE_ROUTER:
-            continue
-        
-        # Create the first event for each router.
-        routing_time = network_now() + ct.TIME_BIT
-        routing_event = e.Event(ep.router_name, 'transmit_config_packet', [])
-        enqueue_event(routing_time, routing_event)
-    
-    
-def enqueue_event(time, event):
+        # With static routing, the routing tables are already filled and the
+        #   routers never send routing packets.
+        if self.routing == ct.ROUTING_STATIC:
+            return
+
+        for ep_name in self.endpoints:
+            # Get the link from the dictionary.
+            ep = self.endpoints[ep_name]
+
+            # Only want to create events for routers...
+            if ep.type != ct.TYPE_ROUTER:
+                continue
+
+            # Create the first event for each router.
+            routing_time = self.network_now() + cv.ms_to_ticks(ct.TIME_BIT)
+            routing_event = e.Event(ep.transmit_config_packet, [])
+            self.enqueue_event(routing_time, routing_event)
+
+
+    def enqueue_event(self, time, event):
+        '''
+        Description:        This enqueues an event onto the event queue.
+                            Python queues do not accept two identical entries,
+                            and because it cannot sort Event instances, two
+                            entries of the same time counts as a duplicate
+                            entry.  Thus, each entry includes a sequence
+                            number that increases with every enqueued event,
+                            so that Python has a way of differentiating and
+                            sorting the heap.  Events of the same time are
+                            executed in the order they were enqueued.
+
+        Arguments:          time (integer)
+                                - The time the event is to occur/be enqueued,
+                                in ticks.
+
+                            event (Event)
+                                - The event that is to occur/be enqueued.
+
+        Return Values:      (Event)
+                                - The enqueued event, which can be used to
+                                cancel it.
+
+        Shared Variables:   self.event_seq (WRITE)
+                                - The next sequence number is taken from it.
+
+                            self.event_queue (WRITE)
+                                - Enqueues the event.
+
+        Global Variables:   None.
+
+        Limitations:        This orders events that are otherwise supposed to
+                            be simultaneous.
+
+        Known Bugs:         None.
+
+        Revision History:   2015/11/16: Created
+                            2026/10/18: Sequence number instead of a count
+                                        per time.
+                            2026/10/18: Takes the time in ticks.
+        '''
+        # Tag the entry with the next sequence number so that we don't have
+        #   two entries in the event queue that have the exact same key.
+        self.event_queue.push((time, next(self.event_seq), event))
+        event.queued = True
+
+        return event
+
+
+    def cancel_event(self, event):
+        '''
+        Description:        Cancels an event that is in the event queue so it
+                            is not executed.  The event is only marked and
+                            stays in the queue until it is popped, unless
+                            cancelled events make up enough of the queue that
+                            it is worth rebuilding the queue without them.
+                            Cancelling an event that already ran or was
+                            already cancelled does nothing.
+
+        Arguments:          event (Event)
+                                - The event to cancel.
+
+        Return Values:      None.
+
+        Shared Variables:   self.num_cancelled (WRITE)
+                                - Incremented for the cancelled event.
+
+                            self.event_queue (WRITE)
+                                - Rebuilt without cancelled events if enough
+                                of them have piled up.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        # Nothing to do if the event is not waiting in the queue.
+        if not event.queued or event.cancelled:
+            return
+
+        event.cancelled = True
+        self.num_cancelled += 1
+
+        # Rebuild the queue once it is mostly cancelled events.
+        if self.num_cancelled >= ct.EVENT_COMPACT_MIN and \
+           self.num_cancelled > ct.EVENT_COMPACT_RATIO * len(self.event_queue):
+            self.compact_event_queue()
+
+
+    def compact_event_queue(self):
+        '''
+        Description:        Rebuilds the event queue without the cancelled
+                            events in it.  The remaining events keep their
+                            times and tie breakers, so their order does not
+                            change.
+
+        Arguments:          None.
+
+        Return Values:      None.
+
+        Shared Variables:   self.event_queue (WRITE)
+                                - Cancelled events are removed.
+
+                            self.num_cancelled (WRITE)
+                                - Reduced by the number removed.  Cancelled
+                                events in the batch being run are not in the
+                                queue, so they are still counted.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        live_events = []
+        for entry in self.event_queue.entries():
+            if entry[2].cancelled:
+                entry[2].queued = False
+                self.num_cancelled -= 1
+            else:
+                live_events.append(entry)
+
+        self.event_queue.rebuild(live_events)
+
+
+    def __getstate__(self):
+        '''
+        Description:        Returns the attributes to pickle.  The log files
+                            are saved as their names and positions, and the
+                            event sequence counter as its next number.
+
+        Arguments:          None.
+
+        Return Values:      (dictionary)
+                                - The attributes.
+
+        Shared Variables:   self.log_host, self.log_router, self.log_flow,
+                            self.log_main (READ)
+                                - Flushed and saved.
+
+                            self.event_seq (WRITE)
+                                - Restarted at the number saved.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        next_seq = next(self.event_seq)
+        self.event_seq = itertools.count(next_seq)
+
+        state = u.save_open_files(self.__dict__)
+        state['event_seq'] = next_seq
+
+        return state
+
+
+    def __setstate__(self, state):
+        '''
+        Description:        Restores the unpickled attributes, reopening the
+                            log files where they were left off.
+
+        Arguments:          state (dictionary)
+                                - The attributes returned by __getstate__.
+
+        Return Values:      None.
+
+        Shared Variables:   self.log_host, self.log_router, self.log_flow,
+                            self.log_main (WRITE)
+                                - Reopened
+
+                            self.event_seq (WRITE)
+                                - Restarted at the number saved.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        self.__dict__.update(u.reopen_saved_files(state))
+        self.event_seq = itertools.count(state['event_seq'])
+
+
+    def save_checkpoint(self, checkpoint_file):
+        '''
+        Description:        Saves the whole state of the simulation to the
+                            argued file: the clock, the pending events, the
+                            links with their buffers and packets, the flows,
+                            the routing tables and the recordings.  A
+                            simulation loaded from it with load_checkpoint()
+                            carries on exactly as this one would.
+
+        Arguments:          checkpoint_file (string)
+                                - The name of the file to save to.
+
+        Return Values:      None.
+
+        Shared Variables:   None.
+
+        Global Variables:   None.
+
+        Limitations:        The output files are not saved, only how far
+                            they were written, so they have to stay around
+                            to resume from the checkpoint.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        with open(checkpoint_file, 'wb') as checkpoint:
+            pickle.dump(self, checkpoint, pickle.HIGHEST_PROTOCOL)
+
+
+    def move_output(self, output_directory):
+        '''
+        Description:        Moves the log files and the data files of this
+                            simulation to the argued directory.  What has
+                            been written so far is copied over, and the
+                            simulation carries on writing there.
+
+        Arguments:          output_directory (string)
+                                - The directory to move the output to.  The
+                                files go in its log and data directories.
+
+        Return Values:      None.
+
+        Shared Variables:   self.log_host, self.log_router, self.log_flow,
+                            self.log_main (WRITE)
+                                - Moved
+
+                            self.status (WRITE)
+                                - Its data files are moved.
+
+                            self.output_directory (WRITE)
+                                - Set to the argued directory.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        u.move_open_files(self.__dict__, self.output_directory,
+                          output_directory)
+        self.status.move_data_files(self.output_directory, output_directory)
+        self.output_directory = output_directory
+
+
+    def fork_at(self, branch_time, variants, collect=None,
+                fork_directory=ct.FORK_DIRECTORY):
+        '''
+        Description:        Runs the simulation up to the argued branch time
+                            and then forks a child process for each variant.
+                            A variant is a function that is passed the
+                            Simulation and changes it, for example setting
+                            ct.ALPHA_VALUE or calling set_rate() or 
+                            set_buffer_size() on a link.  Each child starts
+                            from a copy-on-write copy of this simulation,
+                            applies its variant, moves its output to its own
+                            directory, runs to the end and hands the result
+                            of the collect function back.  At most as many
+                            children as there are CPUs run at once.  This 
+                            simulation is left at the branch time, so it can
+                            carry on unchanged as the baseline.
+
+        Arguments:          branch_time (float)
+                                - The time in milliseconds to branch at.
+
+                            variants (list)
+                                - The variant functions.
+
+                            collect (function)
+                                - Called with each finished child
+                                Simulation to get its result, which must be
+                                picklable.  By default the result is the
+                                elapsed network time in seconds.
+
+                            fork_directory (string)
+                                - The directory the output of the variants
+                                goes in, variant_0, variant_1 and so on.
+
+        Return Values:      (list)
+                                - The result of each variant, in order.
+
+        Shared Variables:   self.event_queue (WRITE)
+                                - Run up to the branch time.
+
+        Global Variables:   None.
+
+        Limitations:        Only works where os.fork() does (not Windows).
+                            A variant that fails raises a RuntimeError once
+                            all of the children have finished.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+                            2026/10/18: Links are changed through their 
+                                        setters.
+        '''
+        if collect is None:
+            collect = lambda sim: (sim.network_recordings * ct.RECORD_TIME
+                                   / 1000)
+
+        self.run_network(branch_time)
+
+        # Flush the output so the children copy all of it, and so nothing
+        #   waiting in the buffers gets written once by each process.
+        self.flush_files()
+
+        running = {}
+        result_files = []
+        for (i, variant) in enumerate(variants):
+            output_directory = os.path.join(fork_directory, "variant_%d" % i)
+            result_files.append(os.path.join(output_directory, "result.pkl"))
+            if os.path.exists(result_files[i]):
+                os.remove(result_files[i])
+
+            # Wait for a child to finish if all of the CPUs are busy.
+            if len(running) == os.cpu_count():
+                (pid, unused) = os.wait()
+                running.pop(pid, None)
+
+            pid = os.fork()
+            if pid == 0:
+                self.run_variant(variant, collect, output_directory,
+                                 result_files[i])
+            running[pid] = i
+
+        for pid in running:
+            os.waitpid(pid, 0)
+
+        results = []
+        failures = []
+        for (i, result_file) in enumerate(result_files):
+            if os.path.exists(result_file):
+                with open(result_file, 'rb') as result:
+                    (success, value) = pickle.load(result)
+            else:
+                (success, value) = (False, "no result was saved\n")
+            if not success:
+                failures.append("variant %d failed:\n%s" % (i, value))
+            results.append(value)
+
+        if len(failures) > 0:
+            raise RuntimeError("\n".join(failures))
+
+        return results
+
+
+    def run_variant(self, variant, collect, output_directory, result_file):
+        '''
+        Description:        Runs a variant in a child process forked by
+                            fork_at() and exits the process.  The variant is
+                            applied, the output is moved to its directory,
+                            the simulation is run to the end, and the result
+                            of the collect function (or the error, if there
+                            is one) is pickled to the result file.
+
+        Arguments:          variant (function)
+                                - Changes the simulation.
+
+                            collect (function)
+                                - Gets the result of the simulation.
+
+                            output_directory (string)
+                                - The directory to move the output to.
+
+                            result_file (string)
+                                - The file to pickle (success, result) to.
+
+        Return Values:      Does not return.
+
+        Shared Variables:   Everything, through the variant and the run.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        try:
+            self.quiet = True
+            self.move_output(output_directory)
+            variant(self)
+            self.run_network()
+            self.close_files()
+            outcome = (True, collect(self))
+        except BaseException:
+            outcome = (False, traceback.format_exc())
+
+        try:
+            os.makedirs(output_directory, exist_ok=True)
+            with open(result_file, 'wb') as result:
+                pickle.dump(outcome, result)
+        finally:
+            # Leave without running anything the parent set up to run at
+            #   exit.
+            os._exit(0)
+
+
+    def flush_files(self):
+        '''
+        Description:        Flushes the log files and the data files of this
+                            simulation.
+
+        Arguments:          None.
+
+        Return Values:      None.
+
+        Shared Variables:   self.log_host, self.log_router, self.log_flow,
+                            self.log_main (WRITE)
+                                - Flushed
+
+                            self.status (WRITE)
+                                - Its data files are flushed.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        for log in (self.log_host, self.log_router, self.log_flow,
+                    self.log_main):
+            log.flush()
+        self.status.flush_data_files()
+
+
+    def close_files(self):
+        '''
+        Description:        Closes the log files and the data files of this
+                            simulation.  Safe to call more than once.
+
+        Arguments:          None.
+
+        Return Values:      None.
+
+        Shared Variables:   self.log_host, self.log_router, self.log_flow,
+                            self.log_main (WRITE)
+                                - Closed
+
+                            self.status (WRITE)
+                                - Its data files are closed.
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
+
+        Revision History:   2026/10/18: Created
+        '''
+        self.log_host.close()
+        self.log_router.close()
+        self.log_flow.close()
+        self.log_main.close()
+        self.status.close_data_files()
+
+
+def load_checkpoint(checkpoint_file):
     '''
-    Description:        This enqueues an event onto the event queue.  Python 
-                        queues do not accept two identical entries, and because 
-                        it cannot sort Event instances, two entries of the 
-                        same time counts as a duplicate entry.  Thus, this 
-                        counts how many entries the time has, and includes 
-                        that number so that Python has a way of 
-                        differentiating and sorting the heap.
-
-    Arguments:          time (float) 
-                            - The time the event is to occur/be enqueued.
-                        
-                        event (Event) 
-                            - The event that is to occur/be enqueued.
-
-    Return Values:      None.
+    Description:        Loads a simulation saved with save_checkpoint().  Its
+                        output files are reopened where they were when it
+                        was saved, and run_network() carries on from there.
 
-    Shared Variables:   None.
+    Arguments:          checkpoint_file (string)
+                            - The name of the file to load.
+
+    Return Values:      (Simulation)
+                            - The loaded simulation.
 
-    Global Variables:   ev_time_dict (WRITE) 
-                            - Uses this to count how many times a particular 
-                            time appears in the event queue.
+    Shared Variables:   None.
 
-                        event_queue (WRITE) 
-                            - Enqueues the event.
+    Global Variables:   None.
 
-    Limitations:        This orders events that are otherwise supposed to be
-                        simultaneous.
+    Limitations:        Checkpoints can only be loaded by the same version
+                        of the simulator.
 
     Known Bugs:         None.
 
-    Revision History:   2015/11/16: Created
+    Revision History:   2026/10/18: Created
     '''
-    # Figure out the "count" for this particular time so that we don't have two
-    #   entries in the heapqueue that have the exact same key.
-    if time not in ev_time_dict:
-        ev_time_dict[time] = 0
-    else:
-        ev_time_dict[time] += 1
-        
-    heapq.heappush(event_queue, (time, ev_time_dict[time], event))
-    
-    
+    with open(checkpoint_file, 'rb') as checkpoint:
+        return pickle.load(checkpoint)
+
+
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        # Input was incorrect
-        print("usage: python simulate.py [config_file]\n")
-        exit()
+    # Take the config filename and options from the commandline.
+    parser = argparse.ArgumentParser(description="Run a network simulation.")
+    parser.add_argument("config_file", nargs="?",
+                        help="the network topology config file")
+    parser.add_argument("--scheduler", choices=sorted(sc.SCHEDULERS),
+                        default=ct.DEFAULT_SCHEDULER,
+                        help="the event scheduler to use "
+                             "(default: %(default)s)")
+    parser.add_argument("--routing", choices=[ct.ROUTING_DYNAMIC,
+                                              ct.ROUTING_STATIC],
+                        default=ct.DEFAULT_ROUTING,
+                        help="fill the routing tables with routing packets "
+                             "(dynamic) or once with the shortest paths "
+                             "(static) (default: %(default)s)")
+    parser.add_argument("--quiet", action="store_true",
+                        help="do not print the progress of the simulation")
+    parser.add_argument("--no-plot", action="store_true",
+                        help="do not plot the recordings (the data files "
+                             "are still written), so the plotting modules "
+                             "are never imported")
+    parser.add_argument("--checkpoint", metavar="FILE",
+                        help="save the simulation to this file at the time "
+                             "given by --checkpoint-at")
+    parser.add_argument("--checkpoint-at", type=float, metavar="TIME",
+                        help="the time in milliseconds to save the "
+                             "simulation at")
+    parser.add_argument("--restore", metavar="FILE",
+                        help="resume a simulation saved with --checkpoint "
+                             "instead of loading a config file")
+    args = parser.parse_args()
+    if (args.config_file is None) == (args.restore is None):
+        parser.error("give either a config file or --restore")
+    if (args.checkpoint is None) != (args.checkpoint_at is None):
+        parser.error("--checkpoint and --checkpoint-at go together")
 
     # Start the timer
     start = time.time()
 
-    # Take the config filename from the commandline.
-    network_file = sys.argv[1]
-    
-    # Load in the network topology
-    endpoints, links, flows, packets = cp.load_network_objects(network_file)
-    
-    # Run the network simulation loop
-    status = run_network()
+    # Load in the network topology, or the simulation to resume.
+    if args.restore is not None:
+        sim = load_checkpoint(args.restore)
+        sim.quiet = args.quiet
+    else:
+        sim = Simulation(args.scheduler, args.quiet,
+                         in_routing=args.routing)
+        sim.load_network(args.config_file)
+
+    # Run the network simulation loop, saving it on the way if asked to.
+    if args.checkpoint is not None:
+        sim.run_network(args.checkpoint_at)
+        sim.save_checkpoint(args.checkpoint)
+    sim.run_network()
 
     # End the timer because the simulation is over
     end = time.time()
-    print("\n\n[SUCCESS]: NETWORK SIMULATION COMPLETE.") 
-    net_time = (network_recordings * ct.RECORD_TIME) / 1000
+    print("\n\n[SUCCESS]: NETWORK SIMULATION COMPLETE.")
+    net_time = (sim.network_recordings * ct.RECORD_TIME) / 1000
     print("    [ELAPSED NETWORK TIME]: %.3f seconds" % net_time)
     print("    [ELAPSED REAL TIME]:    %.3f seconds" % (end - start))
-    print("    [NETWORK RECORDINGS]:   %d\n" % network_recordings)
-
-    # Construct and desplay the plots
-    s.construct_plots()
+    print("    [NETWORK RECORDINGS]:   %d" % sim.network_recordings)
+    print("    [PACKETS LIVE / PEAK]:  %d / %d\n" % (len(sim.packets),
+                                                  sim.peak_packets))
 
+    # Construct and desplay the plots, unless running in batch mode.
+    sim.close_files()
+    if not args.no_plot:
+        sim.status.construct_plots()
 
@@ -0,0 +1,368 @@
+############################################################################
+#
+# Ricky Galliani, Tim Menninger, Rush Joshi, Schaeffer Reed
+# Network Simulator Project
+# CS 143 -- Fall 2015
+#
+# sweep.py
+#
+# This script runs a parameter sweep: the same network is simulated once for
+# every combination of constant values asked for, with the runs spread over
+# a pool of worker processes.  Each run writes its logs and data files to
+# its own directory, and a summary of every run (network time, real time
+# and the throughput, loss and delay of each flow) is printed and written to
+# summary.csv.  Run it from the project directory, for example:
+#
+#     $ python3 src/sweep.py in/test_configs/case_1.txt \
+#           --grid ALPHA_VALUE=5,10,20 --grid DEFAULT_ALG=FLOW_FAST_TCP
+#
+############################################################################
+
+
+############################################################################
+#                                                                          #
+#                               Imported Modules                           #
+#                                                                          #
+############################################################################
+
+import os
+import ast
+import csv
+import time
+import argparse
+import itertools
+import contextlib
+import concurrent.futures
+
+# Import the constants
+import constants as ct
+
+# Import the simulation and the event schedulers
+import simulate
+import scheduler as sc
+
+
+# The constants whose values stand for one of a few choices, with the names
+#   of the constants giving those choices.  Their values are checked against
+#   the choices and printed by name.
+ENUM_CONSTANTS = {
+    'DEFAULT_ALG' : ['FLOW_FAST_TCP', 'FLOW_TCP_RENO']
+}
+
+
+############################################################################
+#                                                                          #
+#                             Sweep Functions                              #
+#                                                                          #
+############################################################################
+
+
+def parse_value(name, text):
+    '''
+    Description:        Returns the value of a constant given on the command
+                        line.  It is either a Python literal or the name of
+                        another constant, such as FLOW_FAST_TCP.  A 
+                        numeric constant takes any integer or float, a 
+                        constant in ENUM_CONSTANTS takes one of its choices,
+                        and any other constant a value of its own type, so
+                        that a mistyped value is caught before any run 
+                        starts.
+
+    Arguments:          name (string)
+                            - The name of the constant the value is for.
+
+                        text (string)
+                            - The value as it was typed.
+
+    Return Values:      The value.
+
+    Shared Variables:   None.
+
+    Global Variables:   None.
+
+    Limitations:        None.
+
+    Known Bugs:         None.
+
+    Revision History:   2026/10/18: Created
+                        2026/10/18: Checks the type of the value.
+                        2026/10/18: Takes any number for a numeric constant
+                                    and checks the choices of an enum.
+    '''
+    text = text.strip()
+    if hasattr(ct, text):
+        value = getattr(ct, text)
+    else:
+        try:
+            value = ast.literal_eval(text)
+        except (ValueError, SyntaxError):
+            raise ValueError("%r is neither a literal nor a constant" % text)
+
+    numbers = (int, float)
+    default = getattr(ct, name)
+    if name in ENUM_CONSTANTS:
+        choices = ENUM_CONSTANTS[name]
+        if value not in [getattr(ct, choice) for choice in choices]:
+            raise ValueError("%s=%s: %s must be one of %s" % 
+                             (name, text, name, ", ".join(choices)))
+    elif type(default) in numbers:
+        if type(value) not in numbers:
+            raise ValueError("%s=%s: %s must be a number, not %s" % 
+                             (name, text, name, type(value).__name__))
+    elif type(value) is not type(default):
+        raise ValueError("%s=%s: %s must be %s, not %s" % 
+                         (name, text, name, type(default).__name__, 
+                          type(value).__name__))
+
+    return value
+
+
+def format_value(name, value):
+    '''
+    Description:        Formats the value of a constant for the summary.  
+                        The value of a constant in ENUM_CONSTANTS is given
+                        by the name of its choice, and any other value as 
+                        a Python literal.
+    '''
+    for choice in ENUM_CONSTANTS.get(name, []):
+        if getattr(ct, choice) == value:
+            return choice
+    return repr(value)
+
+
+def parse_assignment(text):
+    '''
+    Description:        Splits a NAME=VALUE[,VALUE...] argument into the name
+                        of a constant and its values.
+
+    Arguments:          text (string)
+                            - The argument.
+
+    Return Values:      (string)
+                            - The name of the constant.
+
+                        (list)
+                            - The values.
+
+    Shared Variables:   None.
+
+    Global Variables:   None.
+
+    Limitations:        Values cannot contain commas, so tuples and lists
+                        cannot be swept.
+
+    Known Bugs:         None.
+
+    Revision History:   2026/10/18: Created
+                        2026/10/18: Checks the types of the values.
+    '''
+    (name, equals, values) = text.partition("=")
+    name = name.strip()
+    if equals == "" or not name.isupper() or not hasattr(ct, name):
+        raise ValueError("%r does not set a constant" % text)
+
+    return name, [parse_value(name, value) for value in values.split(",")]
+
+
+def build_runs(grids, runs):
+    '''
+    Description:        Returns the constant values of every run of the
+                        sweep.  The grids are crossed with each other, and
+                        each explicit run is added after them.
+
+    Arguments:          grids (list)
+                            - NAME=VALUE,VALUE... arguments, each giving the
+                            values to try for one constant.
+
+                        runs (list)
+                            - NAME=VALUE,NAME=VALUE... arguments, each giving
+                            the constants of one more run.
+
+    Return Values:      (list)
+                            - A dictionary of the constant values for each
+                            run, by name.
+
+    Shared Variables:   None.
+
+    Global Variables:   None.
+
+    Limitations:        None.
+
+    Known Bugs:         None.
+
+    Revision History:   2026/10/18: Created
+    '''
+    combos = []
+    if len(grids) > 0 or len(runs) == 0:
+        axes = [parse_assignment(grid) for grid in grids]
+        for values in itertools.product(*[vals for (name, vals) in axes]):
+            combos.append({name : value for ((name, unused), value)
+                           in zip(axes, values)})
+
+    for run in runs:
+        combo = {}
+        for assignment in run.split(","):
+            (name, [value]) = parse_assignment(assignment)
+            combo[name] = value
+        combos.append(combo)
+
+    return combos
+
+
+def run_one(config_file, overrides, scheduler_name, output_directory,
+            routing=ct.DEFAULT_ROUTING):
+    '''
+    Description:        Runs one simulation of the sweep in a worker process.
+                        The constants are set to the argued values for the
+                        run and put back afterwards, because a worker runs
+                        many simulations.  DELTA_SECS is worked out again
+                        from RECORD_TIME and RECORD_DELTA unless it is set
+                        itself.
+
+    Arguments:          config_file (string)
+                            - The network config file.
+
+                        overrides (dictionary)
+                            - The constant values to use, by name.
+
+                        scheduler_name (string)
+                            - The name of the scheduler to use.
+
+                        output_directory (string)
+                            - The directory to write the output of the run
+                            to.
+
+                        routing (string)
+                            - How the routing tables are filled 
+                            (ct.ROUTING_DYNAMIC or ct.ROUTING_STATIC).
+
+    Return Values:      (dictionary)
+                            - The summary of the simulation (see
+                            Simulation.get_summary()).
+
+                        (float)
+                            - The real time the simulation took in seconds.
+
+    Shared Variables:   None.
+
+    Global Variables:   The overridden constants (WRITE)
+                            - Set for the run and then restored.
+
+    Limitations:        Constants that only other constants are worked out
+                        from (like OUTPUT_DIRECTORY) have no effect, and
+                        neither do the default arguments read when the
+                        modules were loaded.
+
+    Known Bugs:         None.
+
+    Revision History:   2026/10/18: Created
+                        2026/10/18: Takes the routing.
+    '''
+    overrides = dict(overrides)
+    if 'DELTA_SECS' not in overrides:
+        overrides['DELTA_SECS'] = (overrides.get('RECORD_TIME',
+                                                 ct.RECORD_TIME) *
+                                   overrides.get('RECORD_DELTA',
+                                                 ct.RECORD_DELTA)) / 1000
+
+    saved = {name : getattr(ct, name) for name in overrides}
+    try:
+        for (name, value) in overrides.items():
+            setattr(ct, name, value)
+
+        with open(os.devnull, 'w') as devnull, \
+             contextlib.redirect_stdout(devnull):
+            sim = simulate.Simulation(scheduler_name, True, output_directory,
+                                      routing)
+            sim.load_network(config_file)
+
+            start = time.time()
+            sim.run_network()
+            end = time.time()
+
+        sim.close_files()
+        return sim.get_summary(), end - start
+
+    finally:
+        for (name, value) in saved.items():
+            setattr(ct, name, value)
+
+
+def format_measure(value, fmt):
+    '''
+    Description:        Formats a measure of the summary, which is None when
+                        it could not be computed.
+    '''
+    return "-" if value is None else fmt % value
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a network simulation "
+                                     "for many values of the constants.")
+    parser.add_argument("config_file",
+                        help="the network topology config file")
+    parser.add_argument("--grid", action="append", default=[],
+                        metavar="NAME=VALUE,VALUE",
+                        help="values of a constant to try; the values of "
+                             "every --grid are crossed with each other")
+    parser.add_argument("--run", action="append", default=[],
+                        metavar="NAME=VALUE,NAME=VALUE",
+                        help="the constants of one more run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="the most runs at once (default: the number "
+                             "of CPUs)")
+    parser.add_argument("--out-dir", default=ct.SWEEP_DIRECTORY,
+                        help="the directory the output of each run goes in, "
+                             "as run_0, run_1 and so on (default: "
+                             "%(default)s)")
+    parser.add_argument("--scheduler", choices=sorted(sc.SCHEDULERS),
+                        default=ct.DEFAULT_SCHEDULER,
+                        help="the event scheduler to use "
+                             "(default: %(default)s)")
+    parser.add_argument("--routing", choices=[ct.ROUTING_DYNAMIC,
+                                              ct.ROUTING_STATIC],
+                        default=ct.DEFAULT_ROUTING,
+                        help="fill the routing tables with routing packets "
+                             "(dynamic) or once with the shortest paths "
+                             "(static) (default: %(default)s)")
+    args = parser.parse_args()
+
+    try:
+        combos = build_runs(args.grid, args.run)
+    except ValueError as error:
+        parser.error(str(error))
+
+    # Start every run, each with its own output directory.
+    with concurrent.futures.ProcessPoolExecutor(args.workers) as pool:
+        futures = [pool.submit(run_one, args.config_file, combo,
+                               args.scheduler,
+                               os.path.join(args.out_dir, "run_%d" % i),
+                               args.routing)
+                   for (i, combo) in enumerate(combos)]
+        results = [future.result() for future in futures]
+
+    # One row per flow of every run.
+    header = ["run", "constants", "network_time", "real_time", "flow",
+              "throughput", "loss", "delay"]
+    rows = []
+    for (i, (combo, (summary, real_time))) in enumerate(zip(combos, results)):
+        constants = " ".join("%s=%s" % (name, format_value(name, combo[name]))
+                             for name in sorted(combo))
+        for (flow_name, flow) in sorted(summary['flows'].items()):
+            rows.append([i, constants, summary['network_time'], real_time,
+                         flow_name, flow['throughput'], flow['loss'],
+                         flow['delay']])
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    with open(os.path.join(args.out_dir, "summary.csv"), 'w',
+              newline='') as summary_file:
+        writer = csv.writer(summary_file)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+    print("%-4s %-30s %9s %9s %-6s %11s %7s %10s" % ("run", "constants",
+          "net (s)", "real (s)", "flow", "rate (Mbps)", "loss", "delay (ms)"))
+    for row in rows:
+        print("%-4d %-30s %9.3f %9.3f %-6s %11s %7s %10s" % (row[0], row[1],
+              row[2], row[3], row[4], format_measure(row[5], "%.3f"),
+              format_measure(row[6], "%.4f"), format_measure(row[7], "%.2f")))
@@ -27,12 +27,13 @@ import router as r
 import host as h
 import event as e
 
-# Import simulator so we can access events, objects and time.
-import sys
-sim = sys.modules['__main__']
-
 import constants as ct
 
+# So open files can be saved, reopened and moved.
+import io
+import os
+import shutil
+
 
 ############################################################################
 #                                                                          #
@@ -41,78 +42,199 @@ import constants as ct
 ############################################################################
 
 
-def network_type(actor_name):
+def assign_endpoints(endpoints, sender_ID):
+    '''
+    Description:        Returns a tuple, either (1,0) or (0,1), given an input 
+                        of the sender ID which indicates what the keys for 
+                        the ep_IDs dictionary is in link.py. 
+    '''
+    ep = endpoints[sender_ID]
+    other_ep = (ep + 1) % 2
+    return ep, other_ep
+
+
+def print_dict_keys(dict_name, dict):
     '''
-    Description:        Returns the type of the network object (as a constant) 
-                        given its name.
+    Description:        Prints the keys of a dictionary.
     '''
-    if actor_name in sim.flows:
-        # It's a Flow!
-        return ct.TYPE_FLOW
+    print("- " + dict_name + " -")
+    for key in dict.keys():
+        print("\t" + key)
+
+
+def save_open_files(state):
+    '''
+    Description:        Returns a copy of the argued attribute dictionary of
+                        an object being pickled, with every open file
+                        replaced by its name and how much has been written
+                        to it.  Files cannot be pickled, and they are
+                        flushed so what has been written is on disk.
+
+    Arguments:          state (dictionary)
+                            - The attributes of the object.
 
-    elif actor_name in sim.links:
-        # It's a Link!
-        return ct.TYPE_LINK
+    Return Values:      (dictionary)
+                            - The attributes with (name, offset) tuples
+                            instead of open files.
 
-    elif actor_name in sim.endpoints:
-        # It's an endpoint (Host or Router)!
-        return sim.endpoints[actor_name].type
+    Global Variables:   None.
 
-    else:
-        # It's a Packet!
-        return ct.TYPE_PACKET
+    Limitations:        Only works for files open for writing.
 
+    Known Bugs:         None.
 
-def get_actor_and_function(actor_name, function_name):
+    Revision History:   2026/10/18: Created
     '''
-    Description:        Returns the actor and function object given an 
-                        actor_type (one of the network object constants from 
-                        constants.py) and the function_name (a string).
+    state = dict(state)
+    for (key, value) in state.items():
+        if isinstance(value, io.IOBase):
+            value.flush()
+            state[key] = SavedFile(value.name, value.tell())
+
+    return state
+
+
+def reopen_saved_files(state):
     '''
-    # Get whether its a Flow, Link, Host, Router, or Packet so that 
-    # you can call the correct function
-    actor_type = network_type(actor_name)
-    
-    # FLOW
-    if actor_type == ct.TYPE_FLOW:
-        actor = sim.flows[actor_name]
-        event_function = getattr(f.Flow, function_name)
-    # LINK
-    elif actor_type == ct.TYPE_LINK:
-        actor = sim.links[actor_name]
-        event_function = getattr(l.Link, function_name)
-    # PACKET
-    elif actor_type == ct.TYPE_PACKET:
-        actor = sim.packets[actor_name]
-        event_function = getattr(p.Packet, function_name)
-    
-    # ROUTER or HOST
-    else: # actor_type == ct.TYPE_ROUTER or actor_type == ct.TYPE_HOST
-        actor = sim.endpoints[actor_name]
-        if actor_type == ct.TYPE_ROUTER:
-            event_function = getattr(r.Router, function_name)
-        else: # actor_type == ct.TYPE_HOST
-            event_function = getattr(h.Host, function_name)
-
-    return actor, event_function
-
-
-def assign_endpoints(endpoints, sender_name):
+    Description:        Undoes save_open_files() on the argued attribute
+                        dictionary of an object being unpickled.  Each file
+                        is reopened for appending, and anything that was
+                        written to it after it was saved is cut off, so the
+                        object carries on writing where it left off.
+
+    Arguments:          state (dictionary)
+                            - The attributes of the object, with SavedFile
+                            instances for the files.
+
+    Return Values:      (dictionary)
+                            - The attributes with open files.
+
+    Global Variables:   None.
+
+    Limitations:        If a file has since been replaced by a shorter one,
+                        it is appended to as it is.
+
+    Known Bugs:         None.
+
+    Revision History:   2026/10/18: Created
     '''
-    Description:        Returns a tuple, either (1,0) or (0,1), given an input 
-                        of the sender name which indicates what the keys for 
-                        the ep_names dictionary is in link.py. 
+    state = dict(state)
+    for (key, value) in state.items():
+        if isinstance(value, SavedFile):
+            out_file = open(value.name, 'a')
+            if os.path.getsize(value.name) >= value.offset:
+                out_file.truncate(value.offset)
+            state[key] = out_file
+
+    return state
+
+
+def output_path(output_directory, file_name):
     '''
-    ep = endpoints[sender_name]
-    other_ep = (ep + 1) % 2
-    return ep, other_ep
+    Description:        Returns where the argued output file goes when the
+                        output is written to the argued directory instead of
+                        the default one.  The file keeps its place under the
+                        output directory, so for example out/log/host.log
+                        goes to <directory>/log/host.log.
 
+    Arguments:          output_directory (string)
+                            - The directory the output is written to.
 
-def print_dict_keys(dict_name, dict):
+                        file_name (string)
+                            - The name of the file under the default output
+                            directory (one of the ct.*_OUT or ct.*_LOG_FILE
+                            constants).
+
+    Return Values:      (string)
+                            - The name of the file under the argued 
+                            directory.
+
+    Global Variables:   ct.OUTPUT_DIRECTORY (READ)
+                            - The default output directory.
+
+    Limitations:        None.
+
+    Known Bugs:         None.
+
+    Revision History:   2026/10/18: Created
     '''
-    Description:        Prints the keys of a dictionary.
+    return os.path.join(output_directory,
+                        os.path.relpath(file_name, ct.OUTPUT_DIRECTORY))
+
+
+def move_open_files(state, old_directory, new_directory):
     '''
-    print("- " + dict_name + " -")
-    for key in dict.keys():
-        print("\t" + key)
+    Description:        Moves every open output file in the argued attribute
+                        dictionary of an object from one output directory to
+                        another.  What has been written so far is copied over
+                        and the file is reopened there for appending.  The
+                        file keeps its place under the output directory, so
+                        for example <old>/log/host.log moves to 
+                        <new>/log/host.log.
+
+    Arguments:          state (dictionary)
+                            - The attributes of the object, which are 
+                            updated with the moved files.
+
+                        old_directory (string)
+                            - The directory the files are in.
+
+                        new_directory (string)
+                            - The directory to move the files to.
+
+    Return Values:      None.
+
+    Global Variables:   None.
+
+    Limitations:        The files left behind are closed but not deleted.
+
+    Known Bugs:         None.
+
+    Revision History:   2026/10/18: Created
+    '''
+    for (key, value) in state.items():
+        if isinstance(value, io.IOBase):
+            value.close()
+            new_name = os.path.join(new_directory, 
+                           os.path.relpath(value.name, old_directory))
+            os.makedirs(os.path.dirname(new_name), exist_ok=True)
+            shutil.copyfile(value.name, new_name)
+            state[key] = open(new_name, 'a')
+
+
+############################################################################
+#                                                                          #
+#                               Saved File Class                           #
+#                                                                          #
+############################################################################
+
+
+class SavedFile:
+
+    def __init__(self, in_name, in_offset):
+        '''
+        Description:        Initialize an instance of SavedFile, which stands 
+                            in for an open file in a pickled object.
+
+        Arguments:          in_name (string)
+                                - The name the file was opened with.
+
+                            in_offset (integer)
+                                - The number of bytes written to the file.
+
+        Shared Variables:   self.name (WRITE)
+                                - Initialized
+
+                            self.offset (WRITE)
+                                - Initialized
+
+        Global Variables:   None.
+
+        Limitations:        None.
+
+        Known Bugs:         None.
 
+        Revision History:   2026/10/18: Created
+        '''
+        self.name = in_name
+        self.offset = in_offset
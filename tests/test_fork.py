@@ -0,0 +1,71 @@
+############################################################################
+#
+# Ricky Galliani, Tim Menninger, Rush Joshi, Schaeffer Reed
+# Network Simulator Project
+# CS 143 -- Fall 2015
+#
+# test_fork.py
+#
+# This tests that the variants of Simulation.fork_at() that change a link
+# change the result.  Run it with pytest from the project directory:
+#
+#     $ python3 -m pytest tests
+#
+############################################################################
+
+
+############################################################################
+#                                                                          #
+#                               Imported Modules                           #
+#                                                                          #
+############################################################################
+
+import os
+import sys
+
+# The modules of the simulator are in src/.
+SRC_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             os.pardir, "src")
+sys.path.insert(0, SRC_DIRECTORY)
+
+import simulate
+
+
+############################################################################
+#                                                                          #
+#                                  Tests                                   #
+#                                                                          #
+############################################################################
+
+
+def test_link_variants_change_the_result(tmp_path):
+    '''
+    Description:        Forks test case 0 at 5 s into an unchanged variant
+                        and variants that change the rate and the buffer 
+                        size of its link, and checks that each change gives
+                        a different end time.
+    '''
+    config_file = os.path.join(SRC_DIRECTORY, os.pardir, "in", 
+                               "test_configs", "case_0.txt")
+    sim = simulate.Simulation(in_quiet=True,
+                              in_output_directory=str(tmp_path / "out"))
+    sim.load_network(config_file)
+
+    def unchanged(sim):
+        pass
+
+    def set_rate(rate):
+        return lambda sim: sim.links["L1"].set_rate(rate)
+
+    def set_buffer_size(buffer_size):
+        return lambda sim: sim.links["L1"].set_buffer_size(buffer_size)
+
+    times = sim.fork_at(5000, [unchanged, set_rate(5), set_buffer_size(8),
+                               set_buffer_size(1000)],
+                        fork_directory=str(tmp_path / "fork"))
+    sim.close_files()
+
+    (baseline, slower, smaller, larger) = times
+    assert slower > baseline
+    assert smaller != baseline
+    assert larger != baseline